@@ -6,6 +6,7 @@ based on job titles and existing department data
 
 import os
 import sys
+from collections import defaultdict
 from dotenv import load_dotenv
 from supabase import create_client
 
@@ -173,7 +174,7 @@ def update_standardized_departments():
         print(f"📊 Processing {len(roles)} current roles...")
         
         # Categorize and update each role
-        updates = {}
+        updates = defaultdict(list)
         for role in roles:
             job_title = role.get('job_title', '')
             existing_dept = role.get('dept', '')
@@ -181,8 +182,6 @@ def update_standardized_departments():
             
             standardized_dept = categorize_role(job_title, existing_dept, department_mapping)
             
-            if standardized_dept not in updates:
-                updates[standardized_dept] = []
             updates[standardized_dept].append({
                 'id': role_id,
                 'job_title': job_title,
@@ -76,9 +76,9 @@ def analyze_team_job_titles():
     
     print(f"✅ Found {len(team_roles)} current roles at Team organizations")
     
-    # Analyze job titles
-    job_titles = []
-    departments = []
+    # Analyze job titles, counting as the roles are scanned rather than building lists for Counter
+    title_counts = Counter()
+    dept_counts = Counter()
     org_names = set()
     sports = set()
     
@@ -94,22 +94,18 @@ def analyze_team_job_titles():
             sport = role.get('sport', '')
         
         if job_title:
-            job_titles.append(job_title)
+            title_counts[job_title] += 1
         if dept:
-            departments.append(dept)
+            dept_counts[dept] += 1
         if org_name:
             org_names.add(org_name)
         if sport:
             sports.add(sport)
     
-    # Count frequency
-    title_counts = Counter(job_titles)
-    dept_counts = Counter(departments) if departments else Counter()
-    
     print(f"\n📊 Analysis Summary:")
     print(f"   • {len(org_names)} Team organizations")
-    print(f"   • {len(set(job_titles))} unique job titles")
-    print(f"   • {len(set(departments))} existing departments")
+    print(f"   • {len(title_counts)} unique job titles")
+    print(f"   • {len(dept_counts)} existing departments")
     print(f"   • Sports: {', '.join(sports) if sports else 'Not specified'}")
     
     print(f"\n🏢 Team Organizations:")
@@ -128,7 +124,8 @@ def analyze_team_job_titles():
     # Suggest department categorization based on job titles
     print(f"\n💡 Suggested Department Categories (based on job title analysis):")
     
-    suggested_departments = analyze_and_suggest_departments(job_titles)
+    # Each unique title once; the listing below only shows distinct titles per category
+    suggested_departments = analyze_and_suggest_departments(title_counts)
     
     for category, roles in suggested_departments.items():
         print(f"\n   🔹 {category}:")
@@ -4,6 +4,7 @@ Centralized Supabase client and database utilities
 """
 
 import os
+from collections import Counter
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from supabase import create_client, Client
@@ -96,7 +97,7 @@ class DatabaseManager:
                 return result.data if result else None
                 
             elif operation == "count":
-                result = self.client.table(table).select("*", count="exact").execute()
+                result = self.client.table(table).select("*", count="exact", head=True).execute()
                 return result.count if result else 0
                 
         except Exception as e:
@@ -194,10 +195,7 @@ class DatabaseManager:
             # Get organization type breakdown
             orgs = self.safe_query('organization', 'select')
             if orgs:
-                org_type_counts = {}
-                for org in orgs:
-                    org_type = org.get('org_type', 'Unknown')
-                    org_type_counts[org_type] = org_type_counts.get(org_type, 0) + 1
+                org_type_counts = Counter(org.get('org_type', 'Unknown') for org in orgs)
                 stats['org_type_breakdown'] = [
                     {'org_type': k, 'count': v} 
                     for k, v in org_type_counts.items()
@@ -411,7 +409,7 @@ def get_enriched_organization_data(limit: int = 100, offset: int = 0, filters: D
                         enriched_org['additional_employees'] = f"+{len(current_roles.data)-3} more"
                     
                     # Get unique job titles
-                    job_titles = list(set([role.get('job_title') for role in current_roles.data if role.get('job_title')]))
+                    job_titles = list({role.get('job_title') for role in current_roles.data if role.get('job_title')})
                     enriched_org['unique_job_titles'] = len(job_titles)
                     enriched_org['active_job_titles'] = ', '.join(job_titles[:3])
                     if len(job_titles) > 3:
@@ -3,6 +3,7 @@ Enhanced Database Manager - Using Summary Tables for Performance
 This eliminates the complex joins that were causing "Server disconnected" errors
 """
 
+from collections import Counter
 from typing import Dict, List, Optional, Any
 from datetime import datetime, date
 from app.core.logger import get_logger
@@ -99,23 +100,23 @@ class EnhancedDatabaseManager:
             stats = {}
             
             # Count total people (from network_status table)
-            people_count = self.client.table('network_status').select('*', count='exact').execute()
+            people_count = self.client.table('network_status').select('*', count='exact', head=True).execute()
             stats['total_people'] = people_count.count if people_count else 0
             
             # Count total organizations (from organization_summary table)  
-            org_count = self.client.table('organization_summary').select('*', count='exact').execute()
+            org_count = self.client.table('organization_summary').select('*', count='exact', head=True).execute()
             stats['total_organizations'] = org_count.count if org_count else 0
             
             # Count executives (from network_status table)
             exec_count = self.client.table('network_status')\
-                .select('*', count='exact')\
+                .select('*', count='exact', head=True)\
                 .eq('is_executive', True)\
                 .execute()
             stats['total_executives'] = exec_count.count if exec_count else 0
             
             # Count people with current roles
             employed_count = self.client.table('network_status')\
-                .select('*', count='exact')\
+                .select('*', count='exact', head=True)\
                 .not_.is_('current_organization', 'null')\
                 .execute()
             stats['people_with_roles'] = employed_count.count if employed_count else 0
@@ -126,11 +127,9 @@ class EnhancedDatabaseManager:
                 .execute()
                 
             if org_types and org_types.data:
-                type_counts = {}
-                for org in org_types.data:
-                    org_type = org.get('org_type', 'Unknown')
-                    type_counts[org_type] = type_counts.get(org_type, 0) + 1
-                stats['organization_types'] = type_counts
+                stats['organization_types'] = dict(
+                    Counter(org.get('org_type', 'Unknown') for org in org_types.data)
+                )
             else:
                 stats['organization_types'] = {}
             
@@ -141,11 +140,9 @@ class EnhancedDatabaseManager:
                 .execute()
                 
             if sports and sports.data:
-                sport_counts = {}
-                for org in sports.data:
-                    sport = org.get('sport', 'Unknown')
-                    sport_counts[sport] = sport_counts.get(sport, 0) + 1
-                stats['sports_distribution'] = sport_counts
+                stats['sports_distribution'] = dict(
+                    Counter(org.get('sport', 'Unknown') for org in sports.data)
+                )
             else:
                 stats['sports_distribution'] = {}
                 
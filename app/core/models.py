@@ -4,8 +4,9 @@ Pydantic models for API and data validation
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 import uuid
 
 class PersonBase(BaseModel):
@@ -16,13 +17,15 @@ class PersonBase(BaseModel):
     job_title: Optional[str] = Field(None, description="Current job title")
     linkedin_url: Optional[str] = Field(None, description="LinkedIn profile URL")
     
-    @validator('linkedin_url')
+    @field_validator('linkedin_url')
+    @classmethod
     def validate_linkedin_url(cls, v):
         if v and not v.startswith(('http://', 'https://')):
             return f'https://{v}'
         return v
     
-    @validator('full_name')
+    @field_validator('full_name')
+    @classmethod
     def validate_full_name(cls, v):
         if not v or len(v.strip()) < 2:
             raise ValueError('Full name must be at least 2 characters')
@@ -48,8 +51,7 @@ class PersonResponse(PersonBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class OrganizationBase(BaseModel):
     """Base organization model"""
@@ -59,13 +61,15 @@ class OrganizationBase(BaseModel):
     state: Optional[str] = Field(None, description="State location")
     website: Optional[str] = Field(None, description="Official website")
     
-    @validator('website')
+    @field_validator('website')
+    @classmethod
     def validate_website(cls, v):
         if v and not v.startswith(('http://', 'https://')):
             return f'https://{v}'
         return v
     
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
         if not v or len(v.strip()) < 2:
             raise ValueError('Organization name must be at least 2 characters')
@@ -91,8 +95,7 @@ class OrganizationResponse(OrganizationBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class SearchResponse(BaseModel):
     """Search results response model"""
@@ -102,6 +105,14 @@ class SearchResponse(BaseModel):
     limit: int = Field(100, description="Results per page")
     query: str = Field(..., description="Search query used")
     search_type: str = Field("all", description="Type of search performed")
+    
+    @cached_property
+    def grouped_by_type(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Results partitioned by result_type in a single pass"""
+        groups: Dict[str, List[Dict[str, Any]]] = {'person': [], 'organization': []}
+        for result in self.results:
+            groups.setdefault(result.get('result_type'), []).append(result)
+        return groups
 
 class ImportResult(BaseModel):
     """Data import result model"""
@@ -119,7 +130,8 @@ class ContactImportRequest(BaseModel):
     contacts: List[Dict[str, Any]] = Field(..., description="List of contacts to import")
     source: str = Field(..., description="Source of the import data")
     
-    @validator('contacts')
+    @field_validator('contacts')
+    @classmethod
     def validate_contacts(cls, v):
         if not v:
             raise ValueError('At least one contact is required')
@@ -5,6 +5,7 @@ Handles CSV data import with privacy filtering and validation
 
 import pandas as pd
 import io
+import csv
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime
 import uuid
@@ -21,6 +22,9 @@ from ..core.models import ImportResult, validate_import_data
 
 logger = get_logger("import_service")
 
+# Delimiters detect_csv_format will consider
+CSV_DELIMITERS = ',;\t|'
+
 class ImportService:
     """Service for handling CSV data imports"""
     
@@ -29,7 +33,8 @@ class ImportService:
         self.db_manager = get_database_manager()
     
     def import_csv_file(self, file_content: bytes, filename: str, 
-                       column_mapping: Dict[str, str] = None) -> ImportResult:
+                       column_mapping: Dict[str, str] = None,
+                       csv_format: Dict[str, Any] = None) -> ImportResult:
         """
         Import CSV file with privacy filtering and validation
         
@@ -37,6 +42,7 @@ class ImportService:
             file_content: Raw CSV file bytes
             filename: Name of the uploaded file
             column_mapping: Mapping of CSV columns to database fields
+            csv_format: Previously detected CSV format (see detect_csv_format)
         
         Returns:
             ImportResult with details of the import operation
@@ -44,12 +50,12 @@ class ImportService:
         logger.info(f"Starting CSV import: {filename}")
         
         try:
-            # Read CSV data
-            df = pd.read_csv(io.BytesIO(file_content))
-            logger.info(f"CSV loaded: {len(df)} rows, {len(df.columns)} columns")
+            if csv_format is None:
+                csv_format = self.detect_csv_format(file_content)
             
-            # Filter sensitive columns
-            allowed_columns, filtered_columns = filter_csv_columns(df.columns.tolist())
+            # Filter sensitive columns from the header before parsing any rows
+            headers = self.read_csv_headers(file_content, csv_format)
+            allowed_columns, filtered_columns = filter_csv_columns(headers)
             
             if not allowed_columns:
                 return ImportResult(
@@ -58,11 +64,13 @@ class ImportService:
                     privacy_filtered_fields=filtered_columns
                 )
             
-            # Keep only allowed columns
-            df_filtered = df[allowed_columns]
+            # Read CSV data; the parser skips filtered columns entirely
+            df = self.read_csv(file_content, csv_format, usecols=allowed_columns)
+            logger.info(f"CSV loaded: {len(df)} rows, {len(headers)} columns "
+                       f"({len(allowed_columns)} allowed)")
             
             # Convert to list of dictionaries
-            records = df_filtered.to_dict('records')
+            records = df.to_dict('records')
             
             # Apply privacy filtering to data
             sanitized_records, privacy_report = sanitize_dataset_for_storage(records)
@@ -212,6 +220,52 @@ class ImportService:
             logger.error(f"Error updating contact {contact_id}: {e}")
             return False
     
+    def detect_csv_format(self, file_content: bytes) -> Dict[str, Any]:
+        """
+        Sniff the CSV dialect from the first 8KB of the file
+        Returns delimiter, quote character and header detection for read_csv
+        """
+        sample = file_content[:8192].decode('utf-8', errors='replace')
+        sniffer = csv.Sniffer()
+        
+        try:
+            # Restrict to real delimiters; unrestricted, the sniffer can pick a letter that
+            # happens to repeat evenly (e.g. 'N' in an NFL roster)
+            dialect = sniffer.sniff(sample, delimiters=CSV_DELIMITERS)
+            delimiter, quotechar = dialect.delimiter, dialect.quotechar
+        except csv.Error:
+            delimiter, quotechar = ',', '"'
+        
+        # A delimiter that leaves the header as a single field is a misdetection
+        header = next(csv.reader(io.StringIO(sample), delimiter=delimiter, quotechar=quotechar), [])
+        if len(header) <= 1:
+            delimiter = ','
+        
+        try:
+            has_header = sniffer.has_header(sample)
+        except csv.Error:
+            has_header = True
+        
+        return {'delimiter': delimiter, 'quotechar': quotechar, 'has_header': has_header}
+    
+    def read_csv(self, file_content: bytes, csv_format: Dict[str, Any] = None, **kwargs) -> pd.DataFrame:
+        """Read CSV bytes with the C parser using a known (or freshly sniffed) format"""
+        if csv_format is None:
+            csv_format = self.detect_csv_format(file_content)
+        
+        return pd.read_csv(
+            io.BytesIO(file_content),
+            sep=csv_format['delimiter'],
+            quotechar=csv_format['quotechar'],
+            engine='c',
+            dtype=str,
+            **kwargs
+        )
+    
+    def read_csv_headers(self, file_content: bytes, csv_format: Dict[str, Any] = None) -> List[str]:
+        """Read only the CSV header row"""
+        return self.read_csv(file_content, csv_format, nrows=0).columns.tolist()
+    
     def get_import_column_suggestions(self, csv_columns: List[str]) -> Dict[str, str]:
         """
         Suggest column mappings for CSV import
@@ -247,26 +301,35 @@ class ImportService:
         Returns validation report with recommendations
         """
         try:
-            df = pd.read_csv(io.BytesIO(file_content))
+            csv_format = self.detect_csv_format(file_content)
+            headers = self.read_csv_headers(file_content, csv_format)
+            
+            if not csv_format['has_header']:
+                logger.warning(f"No header row detected in {filename}; treating first row as headers")
             
-            # Filter columns for privacy
-            allowed_columns, filtered_columns = filter_csv_columns(df.columns.tolist())
+            # Filter columns for privacy, then parse only the allowed ones
+            allowed_columns, filtered_columns = filter_csv_columns(headers)
+            df = self.read_csv(file_content, csv_format, usecols=allowed_columns) if allowed_columns else pd.DataFrame()
             
             # Get column mapping suggestions
             column_suggestions = self.get_import_column_suggestions(allowed_columns)
             
-            # Sample data preview (first 5 rows)
-            sample_data = df[allowed_columns].head(5).to_dict('records') if allowed_columns else []
+            # Sample data preview (first 5 rows), kept as a DataFrame so the UI can render it directly
+            sample_df = df.head(5)
+            sample_data = sample_df.to_dict('records')
             
             return {
                 'valid': len(allowed_columns) > 0,
                 'total_rows': len(df),
-                'total_columns': len(df.columns),
+                'total_columns': len(headers),
                 'allowed_columns': allowed_columns,
                 'filtered_columns': filtered_columns,
+                'filtered_columns_text': ", ".join(filtered_columns),
                 'column_suggestions': column_suggestions,
                 'sample_data': sample_data,
+                'sample_df': sample_df,
                 'recommended_mapping': column_suggestions,
+                'csv_format': csv_format,
                 'warnings': [
                     f"Filtered {len(filtered_columns)} sensitive columns"
                 ] if filtered_columns else []
@@ -280,7 +343,9 @@ class ImportService:
                 'total_columns': 0,
                 'allowed_columns': [],
                 'filtered_columns': [],
-                'sample_data': []
+                'filtered_columns_text': "",
+                'sample_data': [],
+                'sample_df': pd.DataFrame()
             }
 
 # Global import service instance
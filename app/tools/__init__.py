@@ -0,0 +1,2 @@
+# Developer Tools
+# Database introspection helpers shared by the command-line scripts
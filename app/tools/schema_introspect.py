@@ -0,0 +1,253 @@
+"""
+Schema introspection helpers
+Shared connection and pg_catalog queries used by the live schema scripts
+"""
+
+import os
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+# One lazily opened connection is shared by every caller in the process
+_conn = None
+_conn_lock = threading.Lock()
+
+# Introspected schema, cached for the lifetime of the shared connection
+_schema: Optional[Dict[str, Any]] = None
+
+# Catalog queries are too cheap to benefit from JIT, and a stalled lookup should not hang the script
+SESSION_OPTIONS = '-c jit=off -c statement_timeout=30000'
+APPLICATION_NAME = 'schema_explorer'
+
+def get_connection_candidates() -> List[Tuple[str, Dict[str, Any]]]:
+    """Get the connection settings to try, in order of preference"""
+    candidates = []
+    session = {'options': SESSION_OPTIONS, 'application_name': APPLICATION_NAME}
+    
+    # Parse the DATABASE_URL to get connection parameters
+    db_url = os.getenv('DATABASE_URL') or os.getenv('SUPABASE_DB_URL')
+    
+    if db_url:
+        # Use the full DATABASE_URL
+        candidates.append(('DATABASE_URL', {'dsn': db_url, **session}))
+    
+    # Fallback to individual parameters
+    candidates.append(('individual parameters', {
+        'host': os.getenv('SUPABASE_HOST', 'aws-0-us-east-1.pooler.supabase.com'),
+        'port': int(os.getenv('SUPABASE_PORT', '6543')),
+        'database': os.getenv('SUPABASE_DB_NAME', 'postgres'),
+        'user': os.getenv('SUPABASE_USER', 'postgres.bmabudpcmfizqxuifiqf'),
+        'password': os.getenv('SUPABASE_PASSWORD', os.getenv('SUPABASE_DATABASE_PASSWORD')),
+        **session
+    }))
+    
+    return candidates
+
+def connect():
+    """Get the shared PostgreSQL connection, opening it on first use"""
+    global _conn, _schema
+    with _conn_lock:
+        if _conn is not None and not _conn.closed:
+            return _conn
+        
+        _schema = None
+        for label, params in get_connection_candidates():
+            try:
+                _conn = psycopg2.connect(cursor_factory=RealDictCursor, **params)
+                return _conn
+            except Exception as e:
+                print(f"Failed to connect with {label}: {e}")
+        
+        return None
+
+def close():
+    """Close the shared connection"""
+    global _conn, _schema
+    with _conn_lock:
+        if _conn is not None and not _conn.closed:
+            _conn.close()
+        _conn = None
+        _schema = None
+
+def execute_sql_query(conn, query, params=None) -> List[Dict[str, Any]]:
+    """Execute a SQL query and return results"""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(query, params)
+            # RealDictRow is already a dict subclass, so rows are returned without copying
+            return cursor.fetchall()
+    except Exception as e:
+        print(f"SQL query failed: {e}")
+        return []
+
+def execute_sql_rows(conn, query, params=None) -> List[tuple]:
+    """Execute a SQL query and return plain tuple rows, skipping the per-row dict construction"""
+    try:
+        with conn.cursor(cursor_factory=psycopg2.extensions.cursor) as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+    except Exception as e:
+        print(f"SQL query failed: {e}")
+        return []
+
+def get_all_tables(conn) -> List[str]:
+    """Get list of all user tables in the public schema"""
+    try:
+        query = """
+        SELECT c.relname AS table_name
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public' 
+        AND c.relkind IN ('r', 'p')
+        ORDER BY c.relname
+        """
+        
+        return [table_name for (table_name,) in execute_sql_rows(conn, query)]
+        
+    except Exception as e:
+        print(f"Error getting table list: {e}")
+        return []
+
+def get_views(conn) -> List[Dict[str, Any]]:
+    """Get list of all views"""
+    try:
+        query = """
+        SELECT 
+            c.relname AS table_name,
+            pg_get_viewdef(c.oid) AS view_definition
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public'
+        AND c.relkind = 'v'
+        ORDER BY c.relname
+        """
+        
+        return execute_sql_query(conn, query)
+        
+    except Exception as e:
+        print(f"Error getting views: {e}")
+        return []
+
+def get_functions(conn) -> List[Dict[str, Any]]:
+    """Get list of all functions"""
+    try:
+        query = """
+        SELECT 
+            p.proname AS routine_name,
+            'FUNCTION' AS routine_type,
+            pg_get_function_arguments(p.oid) AS arguments,
+            pg_get_function_result(p.oid) AS return_type,
+            p.prosrc AS routine_definition
+        FROM pg_proc p
+        JOIN pg_namespace n ON n.oid = p.pronamespace
+        WHERE n.nspname = 'public'
+        AND p.prokind = 'f'
+        ORDER BY p.proname
+        """
+        
+        return execute_sql_query(conn, query)
+        
+    except Exception as e:
+        print(f"Error getting functions: {e}")
+        return []
+
+def get_all_table_schemas(conn, tables: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get schema information for all public tables in a single round trip
+    Columns, constraints and indexes are aggregated server-side into one JSON row per table
+    If tables is not given, every public table is included
+    """
+    try:
+        query = """
+        SELECT 
+            c.relname AS table_name,
+            COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'column_name', a.attname,
+                    'data_type', format_type(a.atttypid, a.atttypmod),
+                    'is_nullable', CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END,
+                    'column_default', pg_get_expr(d.adbin, d.adrelid)
+                ) ORDER BY a.attnum)
+                FROM pg_attribute a
+                LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+                WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+            ), '[]'::jsonb) AS columns,
+            COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'constraint_name', con.conname,
+                    'constraint_type', CASE con.contype
+                        WHEN 'p' THEN 'PRIMARY KEY'
+                        WHEN 'f' THEN 'FOREIGN KEY'
+                        WHEN 'u' THEN 'UNIQUE'
+                        WHEN 'c' THEN 'CHECK'
+                        WHEN 'x' THEN 'EXCLUDE'
+                    END,
+                    'column_name', a.attname,
+                    'foreign_table_name', fc.relname,
+                    'foreign_column_name', fa.attname
+                ) ORDER BY con.conname)
+                FROM pg_constraint con
+                LEFT JOIN LATERAL unnest(con.conkey, con.confkey) AS k(attnum, fattnum) ON true
+                LEFT JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+                LEFT JOIN pg_class fc ON fc.oid = con.confrelid
+                LEFT JOIN pg_attribute fa ON fa.attrelid = con.confrelid AND fa.attnum = k.fattnum
+                WHERE con.conrelid = c.oid
+            ), '[]'::jsonb) AS constraints,
+            COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'indexname', i.relname,
+                    'indexdef', pg_get_indexdef(i.oid)
+                ) ORDER BY i.relname)
+                FROM pg_index x
+                JOIN pg_class i ON i.oid = x.indexrelid
+                WHERE x.indrelid = c.oid
+            ), '[]'::jsonb) AS indexes
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p')
+        ORDER BY c.relname
+        """
+        
+        schemas = {row['table_name']: row for row in execute_sql_query(conn, query)}
+        
+        if tables is None:
+            return schemas
+        
+        return {
+            table_name: schemas.get(table_name, {
+                'table_name': table_name, 'columns': [], 'constraints': [], 'indexes': []
+            })
+            for table_name in tables
+        }
+        
+    except Exception as e:
+        print(f"Error getting table schemas: {e}")
+        return {table_name: {'table_name': table_name, 'error': str(e)} for table_name in tables or []}
+
+def fetch_all_schema(conn=None) -> Dict[str, Any]:
+    """
+    Get tables, views, functions and per-table schemas for the public schema
+    Uses the shared connection by default; the result is cached until the connection is closed
+    """
+    global _schema
+    if conn is None:
+        conn = connect()
+        if conn is None:
+            return {'tables': [], 'views': [], 'functions': [], 'schemas': {}}
+    
+    if conn is _conn and _schema is not None:
+        return _schema
+    
+    schema = {
+        'tables': get_all_tables(conn),
+        'views': get_views(conn),
+        'functions': get_functions(conn),
+        'schemas': get_all_table_schemas(conn),
+    }
+    
+    if conn is _conn:
+        _schema = schema
+    
+    return schema
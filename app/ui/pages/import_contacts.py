@@ -6,6 +6,7 @@ CSV file import with privacy filtering
 import streamlit as st
 import pandas as pd
 import io
+import hashlib
 
 from ...services.import_service import get_import_service
 from ...core.logger import get_logger
@@ -44,10 +45,15 @@ def show_import_contacts():
             # Read and validate CSV
             file_content = uploaded_file.getvalue()
             
-            with st.spinner("Analyzing CSV structure..."):
-                validation_report = import_service.validate_csv_structure(
-                    file_content, uploaded_file.name
-                )
+            # Validate once per upload; widget reruns reuse the stored report
+            report_key = hashlib.sha1(file_content).hexdigest()
+            if st.session_state.get('csv_report_key') != report_key:
+                with st.spinner("Analyzing CSV structure..."):
+                    st.session_state.csv_validation_report = import_service.validate_csv_structure(
+                        file_content, uploaded_file.name
+                    )
+                st.session_state.csv_report_key = report_key
+            validation_report = st.session_state.csv_validation_report
             
             if validation_report['valid']:
                 # Show CSV preview and column mapping
@@ -88,16 +94,13 @@ def show_csv_preview_and_mapping(validation_report, file_content, filename):
     if validation_report['filtered_columns']:
         st.warning("🔒 **Privacy Protection Active**")
         st.write("The following columns were filtered out for privacy:")
-        filtered_cols_text = ", ".join(validation_report['filtered_columns'])
-        st.code(filtered_cols_text)
+        st.code(validation_report['filtered_columns_text'])
     
     # Column mapping section
     st.markdown("---")
     st.markdown("### 🔗 Column Mapping")
     st.write("Map your CSV columns to database fields:")
     
-    # Create column mapping interface
-    mapping = {}
     suggested_mapping = validation_report.get('column_suggestions', {})
     
     # Available database fields
@@ -106,39 +109,43 @@ def show_csv_preview_and_mapping(validation_report, file_content, filename):
         'organization', 'department', 'linkedin_url', '-- Skip Column --'
     ]
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.write("**Your CSV Columns:**")
-        for csv_column in validation_report['allowed_columns']:
-            st.write(f"• {csv_column}")
+    # Single editable table instead of one selectbox per CSV column
+    allowed_columns = validation_report['allowed_columns']
+    mapping_df = pd.DataFrame({
+        'csv_column': allowed_columns,
+        'mapped_field': [
+            suggested_mapping.get(csv_column) if suggested_mapping.get(csv_column) in db_fields
+            else '-- Skip Column --'
+            for csv_column in allowed_columns
+        ]
+    })
     
-    with col2:
-        st.write("**Map to Database Fields:**")
-        for csv_column in validation_report['allowed_columns']:
-            # Use suggested mapping as default
-            suggested_field = suggested_mapping.get(csv_column, '-- Skip Column --')
-            if suggested_field not in db_fields:
-                suggested_field = '-- Skip Column --'
-            
-            selected_field = st.selectbox(
-                f"Map '{csv_column}' to:",
-                db_fields,
-                index=db_fields.index(suggested_field),
-                key=f"mapping_{csv_column}"
+    edited_mapping = st.data_editor(
+        mapping_df,
+        column_config={
+            'csv_column': st.column_config.TextColumn("Your CSV Column", disabled=True),
+            'mapped_field': st.column_config.SelectboxColumn(
+                "Map to Database Field", options=db_fields, required=True
             )
-            
-            if selected_field != '-- Skip Column --':
-                mapping[csv_column] = selected_field
+        },
+        hide_index=True,
+        use_container_width=True,
+        key="column_mapping_editor"
+    )
+    
+    mapping = {
+        csv_column: db_field
+        for csv_column, db_field in zip(edited_mapping['csv_column'], edited_mapping['mapped_field'])
+        if db_field and db_field != '-- Skip Column --'
+    }
     
     # Data preview
-    if validation_report.get('sample_data'):
+    if not validation_report['sample_df'].empty:
         st.markdown("---")
         st.markdown("### 👀 Data Preview")
         st.write("First 5 rows of your data:")
         
-        preview_df = pd.DataFrame(validation_report['sample_data'])
-        st.dataframe(preview_df, use_container_width=True)
+        st.dataframe(validation_report['sample_df'], use_container_width=True)
     
     # Import button
     st.markdown("---")
@@ -147,7 +154,7 @@ def show_csv_preview_and_mapping(validation_report, file_content, filename):
     with col1:
         if st.button("📥 Import Data", type="primary", use_container_width=True):
             if mapping:
-                perform_import(file_content, filename, mapping)
+                perform_import(file_content, filename, mapping, validation_report.get('csv_format'))
             else:
                 st.error("Please map at least one column before importing")
     
@@ -155,7 +162,7 @@ def show_csv_preview_and_mapping(validation_report, file_content, filename):
         if st.button("🔄 Reset Upload", use_container_width=True):
             st.rerun()
 
-def perform_import(file_content, filename, column_mapping):
+def perform_import(file_content, filename, column_mapping, csv_format=None):
     """Perform the actual import operation"""
     
     import_service = get_import_service()
@@ -164,7 +171,7 @@ def perform_import(file_content, filename, column_mapping):
         try:
             # Perform import
             import_result = import_service.import_csv_file(
-                file_content, filename, column_mapping
+                file_content, filename, column_mapping, csv_format
             )
             
             # Display results
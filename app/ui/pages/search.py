@@ -4,13 +4,34 @@ Professional network search functionality
 """
 
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from ...services.search_service import get_search_service
 from ...core.logger import get_logger
+from ...core.models import SearchResponse
 
 logger = get_logger("search_page")
 
+# Suggestions are only fetched once the query is long enough
+SUGGESTION_MIN_LENGTH = 3
+
+@st.cache_data(ttl=60, max_entries=1024, show_spinner=False)
+def _cached_suggestions(query: str, limit: int = 5) -> List[str]:
+    """Get search suggestions, cached per (query, limit) across reruns"""
+    return get_search_service().get_search_suggestions(query, limit=limit)
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _cached_search(search_criteria: Dict[str, Any]) -> SearchResponse:
+    """Run a search, cached on the full search criteria across reruns"""
+    search_service = get_search_service()
+    if 'person_filters' in search_criteria or 'org_filters' in search_criteria:
+        return search_service.advanced_search(search_criteria)
+    return search_service.search_all(
+        search_criteria['query'],
+        limit=search_criteria['limit'],
+        offset=search_criteria['offset']
+    )
+
 def show_search():
     """Display the search page"""
     
@@ -25,9 +46,6 @@ def show_search():
     - 🔗 **Connections**: Professional relationships and networks
     """)
     
-    # Get search service
-    search_service = get_search_service()
-    
     # Search input section
     st.markdown("---")
     col1, col2 = st.columns([3, 1])
@@ -97,14 +115,7 @@ def show_search():
             # Perform search
             with st.spinner("Searching professional network..."):
                 try:
-                    if filters:
-                        results = search_service.advanced_search(search_criteria)
-                    else:
-                        results = search_service.search_all(
-                            search_query, 
-                            limit=50, 
-                            offset=0
-                        )
+                    results = _cached_search(search_criteria)
                     
                     # Display results
                     display_search_results(results, search_query)
@@ -116,10 +127,11 @@ def show_search():
         else:
             st.warning("Please enter a search term")
     
-    # Search suggestions
-    if search_query and len(search_query) >= 2:
+    # Search suggestions (_cached_suggestions makes rapid reruns of the same query free)
+    if search_query and len(search_query) >= SUGGESTION_MIN_LENGTH:
         try:
-            suggestions = search_service.get_search_suggestions(search_query, limit=5)
+            suggestions = _cached_suggestions(search_query, limit=5)
+            
             if suggestions:
                 st.markdown("**💡 Suggestions:**")
                 cols = st.columns(min(len(suggestions), 5))
@@ -143,8 +155,8 @@ def display_search_results(results, query: str):
     st.caption(f"Search query: **{query}** | Type: **{results.search_type}**")
     
     # Group results by type
-    people_results = [r for r in results.results if r.get('result_type') == 'person']
-    org_results = [r for r in results.results if r.get('result_type') == 'organization']
+    people_results = results.grouped_by_type['person']
+    org_results = results.grouped_by_type['organization']
     
     # Display people results
     if people_results:
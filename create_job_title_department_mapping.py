@@ -5,6 +5,7 @@ Creates a mapping table for job titles to standardized departments
 
 import sys
 import os
+from collections import Counter
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.core.database import get_database_manager
@@ -92,24 +93,24 @@ def create_job_title_department_table():
             logger.error("No job titles found")
             return False
         
-        # Get unique job titles
-        unique_titles = list(set([
-            row['job_title'] for row in job_titles_result.data 
-            if row.get('job_title') and row['job_title'].strip()
-        ]))
+        # Get unique job titles (single pass, first-seen order for reproducible inserts)
+        unique_titles = list(dict.fromkeys(
+            title.strip() for row in job_titles_result.data
+            if (title := row.get('job_title')) and title.strip()
+        ))
         
         logger.info(f"Found {len(unique_titles)} unique job titles")
         
         # Create job title department mappings
         job_title_mappings = []
-        department_counts = {}
+        department_counts = Counter()
         
         for title in unique_titles:
             department = classify_job_title(title)
-            department_counts[department] = department_counts.get(department, 0) + 1
+            department_counts[department] += 1
             
             job_title_mappings.append({
-                'job_title': title.strip(),
+                'job_title': title,
                 'standardized_department': department,
                 'created_at': 'now()'
             })
@@ -119,12 +120,18 @@ def create_job_title_department_table():
         for dept, count in sorted(department_counts.items()):
             logger.info(f"  {dept}: {count} job titles")
         
-        # Clear existing data from job_title_departments table (if it exists)
+        # Clear existing data from job_title_departments table (if it exists); TRUNCATE is constant
+        # time, while a filtered DELETE writes a tombstone per row
         try:
-            db.client.table('job_title_departments').delete().neq('job_title', '').execute()
+            db.client.rpc('truncate_job_title_departments').execute()
             logger.info("Cleared existing job_title_departments data")
         except Exception as e:
-            logger.info(f"job_title_departments table may not exist: {e}")
+            logger.info(f"truncate_job_title_departments unavailable ({e}), deleting rows instead...")
+            try:
+                db.client.table('job_title_departments').delete().neq('job_title', '').execute()
+                logger.info("Cleared existing job_title_departments data")
+            except Exception as e:
+                logger.info(f"job_title_departments table may not exist: {e}")
         
         # Insert mappings in batches
         batch_size = 100
@@ -1,11 +1,18 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Add the project root to the Python path to allow for absolute imports
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
+def count_table_rows(db, table_name):
+    """
+    Returns the exact row count of a table via a HEAD request (no row payload).
+    """
+    return db.client.table(table_name).select('id', count='exact', head=True).execute().count
+
 def diagnose_summary_tables():
     """
     Connects to the database and checks if the summary tables contain data.
@@ -35,12 +42,17 @@ def diagnose_summary_tables():
     tables_to_check = ["network_status", "organization_summary"]
     all_tables_ok = True
 
+    # Run the count checks concurrently; results are reported in table order
+    with ThreadPoolExecutor(max_workers=len(tables_to_check)) as executor:
+        count_futures = {
+            table_name: executor.submit(count_table_rows, db, table_name)
+            for table_name in tables_to_check
+        }
+
     for table_name in tables_to_check:
         print(f"\n--- Checking table: '{table_name}' ---")
         try:
-            # Use PostgREST to get a count
-            count_result = db.client.table(table_name).select('*', count='exact').limit(0).execute()
-            count = count_result.count
+            count = count_futures[table_name].result()
             
             if count > 0:
                 print(f"✅ Found {count} rows.")
@@ -4,265 +4,256 @@ Script to connect to Supabase and pull the live database schema
 Uses the same connection pattern as the CrowdBiz Graph application
 """
 
+import io
 import os
 import sys
-import psycopg2
-from typing import List, Dict, Any
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 
 # Add the app directory to the path so we can import our modules
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 from app.core.config import get_config
 from app.core.database import get_database_manager
+from app.tools.schema_introspect import (
+    get_connection_candidates,
+    execute_sql_query,
+    execute_sql_rows,
+    get_all_tables,
+    get_views,
+    get_functions,
+    get_all_table_schemas,
+)
 
-def get_postgres_connection():
-    """Get a direct PostgreSQL connection for schema queries"""
-    config = get_config()
-    
-    # Parse the DATABASE_URL to get connection parameters
-    db_url = os.getenv('DATABASE_URL') or os.getenv('SUPABASE_DB_URL')
-    
-    if db_url:
-        # Use the full DATABASE_URL
+# Keep the pool small to stay inside the Supabase pooler connection budget
+POOL_MIN_CONNECTIONS = 2
+POOL_MAX_CONNECTIONS = 4
+
+# Introspected schema snapshots are cached on disk, keyed by a checksum of the public catalog
+SCHEMA_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache')
+SCHEMA_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+def get_postgres_pool() -> Optional[ThreadedConnectionPool]:
+    """Get a small thread-safe connection pool for concurrent schema queries"""
+    for label, params in get_connection_candidates():
         try:
-            return psycopg2.connect(db_url, cursor_factory=RealDictCursor)
+            return ThreadedConnectionPool(
+                POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS,
+                cursor_factory=RealDictCursor, **params
+            )
         except Exception as e:
-            print(f"Failed to connect with DATABASE_URL: {e}")
+            print(f"Failed to connect with {label}: {e}")
     
-    # Fallback to individual parameters
-    try:
-        return psycopg2.connect(
-            host=os.getenv('SUPABASE_HOST', 'aws-0-us-east-1.pooler.supabase.com'),
-            port=int(os.getenv('SUPABASE_PORT', '6543')),
-            database=os.getenv('SUPABASE_DB_NAME', 'postgres'),
-            user=os.getenv('SUPABASE_USER', 'postgres.bmabudpcmfizqxuifiqf'),
-            password=os.getenv('SUPABASE_PASSWORD', os.getenv('SUPABASE_DATABASE_PASSWORD')),
-            cursor_factory=RealDictCursor
-        )
-    except Exception as e:
-        print(f"Failed to connect with individual parameters: {e}")
-        return None
+    return None
 
-def execute_sql_query(conn, query: str, params=None) -> List[Dict[str, Any]]:
-    """Execute a SQL query and return results"""
+def run_with_pooled_connection(pool: ThreadedConnectionPool, func: Callable, *args):
+    """Check out a pooled connection, run func(conn, *args) and return the connection"""
+    conn = pool.getconn()
     try:
-        with conn.cursor() as cursor:
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
-    except Exception as e:
-        print(f"SQL query failed: {e}")
-        return []
+        return func(conn, *args)
+    finally:
+        pool.putconn(conn)
 
-def get_table_schema(conn, table_name: str) -> Dict[str, Any]:
-    """Get detailed schema information for a specific table"""
+def get_all_table_counts(conn) -> Dict[str, Optional[int]]:
+    """Get approximate row counts for all public tables from the planner statistics"""
     try:
-        # Get column information
-        columns_query = """
-        SELECT 
-            column_name,
-            data_type,
-            is_nullable,
-            column_default,
-            character_maximum_length,
-            numeric_precision,
-            numeric_scale
-        FROM information_schema.columns 
-        WHERE table_schema = 'public' AND table_name = %s
-        ORDER BY ordinal_position
-        """
-        WHERE table_schema = 'public' AND table_name = %s
-        ORDER BY ordinal_position
-        """
-        
-        columns = execute_sql_query(conn, columns_query, (table_name,))
-        
-        # Get constraints information
-        constraints_query = """
-        SELECT 
-            tc.constraint_name,
-            tc.constraint_type,
-            kcu.column_name,
-            ccu.table_name AS foreign_table_name,
-            ccu.column_name AS foreign_column_name
-        FROM information_schema.table_constraints tc
-        LEFT JOIN information_schema.key_column_usage kcu
-            ON tc.constraint_name = kcu.constraint_name
-        LEFT JOIN information_schema.constraint_column_usage ccu
-            ON ccu.constraint_name = tc.constraint_name
-        WHERE tc.table_schema = 'public' AND tc.table_name = %s
-        """
-        
-        constraints = execute_sql_query(conn, constraints_query, (table_name,))
-        
-        # Get indexes information
-        indexes_query = """
+        # reltuples is -1 for tables that have never been vacuumed/analyzed
+        query = """
         SELECT 
-            indexname,
-            indexdef
-        FROM pg_indexes 
-        WHERE schemaname = 'public' AND tablename = %s
+            c.relname AS table_name,
+            CASE WHEN c.reltuples < 0 THEN NULL ELSE c.reltuples::bigint END AS count
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p')
         """
         
-        indexes = execute_sql_query(conn, indexes_query, (table_name,))
-        
-        return {
-            'table_name': table_name,
-            'columns': columns,
-            'constraints': constraints,
-            'indexes': indexes
-        }
+        return dict(execute_sql_rows(conn, query))
         
     except Exception as e:
-        print(f"Error getting schema for table {table_name}: {e}")
-        return {'table_name': table_name, 'error': str(e)}
+        print(f"Error getting record counts: {e}")
+        return {}
 
-def get_all_tables(conn) -> List[str]:
-    """Get list of all user tables in the public schema"""
+def get_catalog_checksum(conn) -> Optional[str]:
+    """
+    Get a cheap checksum of the public schema catalog
+    Any DDL on a public relation or function rewrites its catalog row and so changes its xmin
+    """
     try:
         query = """
-        SELECT table_name 
-        FROM information_schema.tables 
-        WHERE table_schema = 'public' 
-        AND table_type = 'BASE TABLE'
-        ORDER BY table_name
+        SELECT md5(
+            COALESCE((
+                SELECT string_agg(c.relname || ':' || c.relfilenode::text || ':' || c.xmin::text, ',' ORDER BY c.relname)
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = 'public'
+            ), '') || '|' || COALESCE((
+                SELECT string_agg(p.oid::text || ':' || p.xmin::text, ',' ORDER BY p.oid)
+                FROM pg_proc p
+                JOIN pg_namespace n ON n.oid = p.pronamespace
+                WHERE n.nspname = 'public'
+            ), '')
+        ) AS checksum
         """
         
         result = execute_sql_query(conn, query)
-        return [row['table_name'] for row in result]
+        return result[0]['checksum'] if result else None
         
     except Exception as e:
-        print(f"Error getting table list: {e}")
-        return []
+        print(f"Error getting catalog checksum: {e}")
+        return None
 
-def get_views(conn) -> List[Dict[str, Any]]:
-    """Get list of all views"""
-    try:
-        query = """
-        SELECT 
-            table_name,
-            view_definition
-        FROM information_schema.views 
-        WHERE table_schema = 'public'
-        ORDER BY table_name
-        """
-        
-        return execute_sql_query(conn, query)
-        
-    except Exception as e:
-        print(f"Error getting views: {e}")
-        return []
+def get_schema_cache_path(checksum: str) -> str:
+    """Get the on-disk cache file for a catalog checksum"""
+    return os.path.join(SCHEMA_CACHE_DIR, f"crowdbiz_schema_{checksum}.json")
 
-def get_functions(conn) -> List[Dict[str, Any]]:
-    """Get list of all functions"""
+def load_schema_cache(checksum: str) -> Optional[Dict[str, Any]]:
+    """Load a cached schema snapshot if one exists for the checksum and is still fresh"""
+    cache_path = get_schema_cache_path(checksum)
     try:
-        query = """
-        SELECT 
-            routine_name,
-            routine_type,
-            data_type AS return_type,
-            routine_definition
-        FROM information_schema.routines 
-        WHERE routine_schema = 'public'
-        AND routine_type = 'FUNCTION'
-        ORDER BY routine_name
-        """
-        
-        return execute_sql_query(conn, query)
-        
-    except Exception as e:
-        print(f"Error getting functions: {e}")
-        return []
+        if time.time() - os.path.getmtime(cache_path) > SCHEMA_CACHE_TTL_SECONDS:
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
 
-def get_table_count(conn, table_name: str) -> int:
-    """Get record count for a table"""
+def save_schema_cache(checksum: str, snapshot: Dict[str, Any]):
+    """Save a schema snapshot to the on-disk cache"""
     try:
-        query = f"SELECT COUNT(*) as count FROM {table_name}"
-        result = execute_sql_query(conn, query)
-        return result[0]['count'] if result else 0
-    except Exception as e:
-        print(f"Error counting records in {table_name}: {e}")
-        return 0
+        os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
+        with open(get_schema_cache_path(checksum), 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, default=str)
+    except OSError as e:
+        print(f"Could not write schema cache: {e}")
 
-def print_schema_summary(conn):
+def get_schema_snapshot(pool: ThreadedConnectionPool, executor: ThreadPoolExecutor,
+                        use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Get tables, views, functions and per-table schemas
+    Served from the disk cache while the catalog checksum is unchanged, otherwise introspected concurrently
+    """
+    checksum = run_with_pooled_connection(pool, get_catalog_checksum) if use_cache else None
+    
+    if checksum:
+        snapshot = load_schema_cache(checksum)
+        if snapshot is not None:
+            print(f"(schema loaded from cache {get_schema_cache_path(checksum)})")
+            return snapshot
+    
+    # The introspection queries are independent, so run them concurrently on pooled connections
+    futures = {
+        'tables': executor.submit(run_with_pooled_connection, pool, get_all_tables),
+        'views': executor.submit(run_with_pooled_connection, pool, get_views),
+        'functions': executor.submit(run_with_pooled_connection, pool, get_functions),
+        'schemas': executor.submit(run_with_pooled_connection, pool, get_all_table_schemas),
+    }
+    snapshot = {key: future.result() for key, future in futures.items()}
+    
+    # The introspection helpers log failures and return empty results, so only cache a snapshot
+    # that found tables and a schema for every one of them
+    tables, schemas = snapshot['tables'], snapshot['schemas']
+    if checksum and tables and all(table_name in schemas for table_name in tables):
+        save_schema_cache(checksum, snapshot)
+    
+    return snapshot
+
+def print_schema_summary(pool: ThreadedConnectionPool, use_cache: bool = True):
     """Print a comprehensive schema summary"""
-    print("=" * 80)
-    print("🏈 CrowdBiz Graph - Live Database Schema")
-    print("=" * 80)
+    # Build the report in memory and write it to stdout once at the end
+    buf = io.StringIO()
+    buf.write("=" * 80 + "\n")
+    buf.write("🏈 CrowdBiz Graph - Live Database Schema\n")
+    buf.write("=" * 80 + "\n")
     
     # Get basic stats
     try:
-        tables = get_all_tables(conn)
-        views = get_views(conn)
-        functions = get_functions(conn)
+        # Row estimates change with every ANALYZE, so they are always read live
+        with ThreadPoolExecutor(max_workers=POOL_MAX_CONNECTIONS) as executor:
+            counts_future = executor.submit(run_with_pooled_connection, pool, get_all_table_counts)
+            snapshot = get_schema_snapshot(pool, executor, use_cache)
+            counts = counts_future.result()
         
-        print(f"\n📊 Schema Overview:")
-        print(f"   Tables: {len(tables)}")
-        print(f"   Views: {len(views)}")
-        print(f"   Functions: {len(functions)}")
+        tables = snapshot['tables']
+        views = snapshot['views']
+        functions = snapshot['functions']
+        schemas = snapshot['schemas']
+        
+        buf.write(f"\n📊 Schema Overview:\n")
+        buf.write(f"   Tables: {len(tables)}\n")
+        buf.write(f"   Views: {len(views)}\n")
+        buf.write(f"   Functions: {len(functions)}\n")
         
         # Show table details
-        print(f"\n📋 Tables:")
+        buf.write(f"\n📋 Tables:\n")
         for table_name in tables:
-            schema = get_table_schema(conn, table_name)
+            schema = schemas.get(table_name, {'table_name': table_name})
             if 'error' in schema:
-                print(f"   ❌ {table_name} - Error: {schema['error']}")
+                buf.write(f"   ❌ {table_name} - Error: {schema['error']}\n")
                 continue
                 
             columns = schema.get('columns', [])
             constraints = schema.get('constraints', [])
             indexes = schema.get('indexes', [])
             
-            print(f"\n   🗃️  {table_name.upper()}")
-            print(f"      Columns: {len(columns)}")
+            buf.write(f"\n   🗃️  {table_name.upper()}\n")
+            buf.write(f"      Columns: {len(columns)}\n")
             
             # Show columns
             for col in columns:
                 nullable = "NULL" if col['is_nullable'] == 'YES' else "NOT NULL"
                 default = f" DEFAULT {col['column_default']}" if col['column_default'] else ""
-                print(f"        • {col['column_name']} {col['data_type']} {nullable}{default}")
+                buf.write(f"        • {col['column_name']} {col['data_type']} {nullable}{default}\n")
             
             # Show constraints
             if constraints:
-                print(f"      Constraints:")
+                buf.write(f"      Constraints:\n")
                 for const in constraints:
                     if const['constraint_type'] == 'PRIMARY KEY':
-                        print(f"        🔑 PK: {const['column_name']}")
+                        buf.write(f"        🔑 PK: {const['column_name']}\n")
                     elif const['constraint_type'] == 'FOREIGN KEY':
-                        print(f"        🔗 FK: {const['column_name']} → {const['foreign_table_name']}.{const['foreign_column_name']}")
+                        buf.write(f"        🔗 FK: {const['column_name']} → {const['foreign_table_name']}.{const['foreign_column_name']}\n")
                     elif const['constraint_type'] == 'UNIQUE':
-                        print(f"        🎯 UNIQUE: {const['column_name']}")
+                        buf.write(f"        🎯 UNIQUE: {const['column_name']}\n")
                     elif const['constraint_type'] == 'CHECK':
-                        print(f"        ✅ CHECK: {const['constraint_name']}")
+                        buf.write(f"        ✅ CHECK: {const['constraint_name']}\n")
             
             # Show indexes
             if indexes:
-                print(f"      Indexes: {len(indexes)}")
+                buf.write(f"      Indexes: {len(indexes)}\n")
                 for idx in indexes:
-                    print(f"        📇 {idx['indexname']}")
+                    buf.write(f"        📇 {idx['indexname']}\n")
         
         # Show views
         if views:
-            print(f"\n👁️  Views:")
+            buf.write(f"\n👁️  Views:\n")
             for view in views:
-                print(f"   • {view['table_name']}")
+                buf.write(f"   • {view['table_name']}\n")
         
         # Show functions
         if functions:
-            print(f"\n⚙️  Functions:")
+            buf.write(f"\n⚙️  Functions:\n")
             for func in functions:
-                print(f"   • {func['routine_name']}() → {func['return_type']}")
+                buf.write(f"   • {func['routine_name']}({func['arguments']}) → {func['return_type']}\n")
         
-        # Get record counts for each table
-        print(f"\n📈 Record Counts:")
+        # Show approximate record counts for each table
+        buf.write(f"\n📈 Record Counts (estimated):\n")
         for table_name in tables:
-            count = get_table_count(conn, table_name)
-            print(f"   {table_name}: {count:,} records")
+            count = counts.get(table_name)
+            if count is None:
+                buf.write(f"   {table_name}: unknown (not analyzed yet)\n")
+            else:
+                buf.write(f"   {table_name}: ~{count:,} records\n")
         
     except Exception as e:
-        print(f"Error in schema summary: {e}")
+        buf.write(f"Error in schema summary: {e}\n")
         import traceback
         traceback.print_exc()
+    
+    sys.stdout.write(buf.getvalue())
 
 def main():
     """Main function to connect and display schema"""
@@ -298,26 +289,26 @@ def main():
     # Now try direct PostgreSQL connection for schema
     try:
         print("\n🔌 Connecting to PostgreSQL directly for schema...")
-        conn = get_postgres_connection()
+        pool = get_postgres_pool()
         
-        if not conn:
+        if not pool:
             print("❌ Could not establish PostgreSQL connection")
             return
         
         # Test connection with a simple query
         print("🧪 Testing PostgreSQL connection...")
-        test_result = execute_sql_query(conn, "SELECT version();")
+        test_result = run_with_pooled_connection(pool, execute_sql_query, "SELECT version();")
         if test_result:
             version = test_result[0]['version']
             print(f"✅ Connected! PostgreSQL version: {version[:60]}...")
         
-        # Print the full schema
-        print_schema_summary(conn)
+        # Print the full schema (pass --no-cache to force a fresh introspection)
+        print_schema_summary(pool, use_cache='--no-cache' not in sys.argv)
         
         print(f"\n✅ Schema analysis complete!")
         
-        # Close connection
-        conn.close()
+        # Close pooled connections
+        pool.closeall()
         
     except Exception as e:
         print(f"❌ Connection failed: {e}")
@@ -3,11 +3,12 @@
 Script to connect to Supabase and pull the live database schema
 """
 
+import io
 import os
 import sys
 import psycopg2
-from typing import List, Dict, Any
-from psycopg2.extras import RealDictCursor
+from psycopg2 import sql
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -16,178 +17,96 @@ load_dotenv()
 # Add the app directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
-def get_postgres_connection():
-    """Get a direct PostgreSQL connection for schema queries"""
-    # Try DATABASE_URL first
-    db_url = os.getenv('DATABASE_URL') or os.getenv('SUPABASE_DB_URL')
-    
-    if db_url:
-        try:
-            return psycopg2.connect(db_url, cursor_factory=RealDictCursor)
-        except Exception as e:
-            print(f"Failed to connect with DATABASE_URL: {e}")
-    
-    # Fallback to individual parameters
-    try:
-        return psycopg2.connect(
-            host=os.getenv('SUPABASE_HOST', 'aws-0-us-east-1.pooler.supabase.com'),
-            port=int(os.getenv('SUPABASE_PORT', '6543')),
-            database=os.getenv('SUPABASE_DB_NAME', 'postgres'),
-            user=os.getenv('SUPABASE_USER', 'postgres.bmabudpcmfizqxuifiqf'),
-            password=os.getenv('SUPABASE_PASSWORD', os.getenv('SUPABASE_DATABASE_PASSWORD')),
-            cursor_factory=RealDictCursor
-        )
-    except Exception as e:
-        print(f"Failed to connect with individual parameters: {e}")
-        return None
+from app.tools.schema_introspect import connect, close, execute_sql_query, fetch_all_schema
 
-def execute_query(conn, query: str, params=None):
-    """Execute a SQL query and return results"""
-    try:
-        with conn.cursor() as cursor:
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
-    except Exception as e:
-        print(f"Query failed: {e}")
-        return []
-
-def get_tables(conn):
-    """Get all tables in the public schema"""
-    query = """
-    SELECT table_name 
-    FROM information_schema.tables 
-    WHERE table_schema = 'public' 
-    AND table_type = 'BASE TABLE'
-    ORDER BY table_name
+def get_table_counts(conn, tables: List[str]) -> Dict[str, Optional[int]]:
     """
-    result = execute_query(conn, query)
-    return [row['table_name'] for row in result]
-
-def get_table_info(conn, table_name):
-    """Get detailed information about a table"""
-    # Get columns
-    columns_query = """
-    SELECT 
-        column_name,
-        data_type,
-        is_nullable,
-        column_default
-    FROM information_schema.columns 
-    WHERE table_schema = 'public' AND table_name = %s
-    ORDER BY ordinal_position
+    Get exact record counts, one statement per table
+    A table whose count fails or times out maps to None; its transaction is rolled back
+    so the shared connection stays usable for the tables after it
     """
-    columns = execute_query(conn, columns_query, (table_name,))
-    
-    # Get constraints
-    constraints_query = """
-    SELECT 
-        tc.constraint_name,
-        tc.constraint_type,
-        kcu.column_name,
-        ccu.table_name AS foreign_table_name,
-        ccu.column_name AS foreign_column_name
-    FROM information_schema.table_constraints tc
-    LEFT JOIN information_schema.key_column_usage kcu
-        ON tc.constraint_name = kcu.constraint_name
-    LEFT JOIN information_schema.constraint_column_usage ccu
-        ON ccu.constraint_name = tc.constraint_name
-    WHERE tc.table_schema = 'public' AND tc.table_name = %s
-    """
-    constraints = execute_query(conn, constraints_query, (table_name,))
-    
-    # Get record count
-    count_query = f"SELECT COUNT(*) as count FROM \"{table_name}\""
-    count_result = execute_query(conn, count_query)
-    record_count = count_result[0]['count'] if count_result else 0
+    counts = {}
+    for table_name in tables:
+        # Identifiers are quoted by psycopg2 rather than formatted into the SQL
+        count_query = sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier('public', table_name))
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extensions.cursor) as cursor:
+                cursor.execute(count_query)
+                counts[table_name] = cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Count failed for {table_name}: {e}")
+            conn.rollback()
+            counts[table_name] = None
     
-    return {
-        'name': table_name,
-        'columns': columns,
-        'constraints': constraints,
-        'record_count': record_count
-    }
-
-def get_views(conn):
-    """Get all views"""
-    query = """
-    SELECT table_name
-    FROM information_schema.views 
-    WHERE table_schema = 'public'
-    ORDER BY table_name
-    """
-    result = execute_query(conn, query)
-    return [row['table_name'] for row in result]
-
-def get_functions(conn):
-    """Get all functions"""
-    query = """
-    SELECT routine_name, routine_type
-    FROM information_schema.routines 
-    WHERE routine_schema = 'public'
-    AND routine_type = 'FUNCTION'
-    ORDER BY routine_name
-    """
-    return execute_query(conn, query)
+    return counts
 
 def print_schema(conn):
     """Print the complete database schema"""
-    print("=" * 80)
-    print("🏈 CrowdBiz Graph - Live Database Schema from Supabase")
-    print("=" * 80)
+    # Build the report in memory and write it to stdout once at the end
+    buf = io.StringIO()
+    buf.write("=" * 80 + "\n")
+    buf.write("🏈 CrowdBiz Graph - Live Database Schema from Supabase\n")
+    buf.write("=" * 80 + "\n")
     
     # Test connection
-    version_result = execute_query(conn, "SELECT version();")
+    version_result = execute_sql_query(conn, "SELECT version();")
     if version_result:
         version = version_result[0]['version']
-        print(f"✅ PostgreSQL Version: {version.split(',')[0]}")
+        buf.write(f"✅ PostgreSQL Version: {version.split(',')[0]}\n")
     
     # Get schema objects
-    tables = get_tables(conn)
-    views = get_views(conn)
-    functions = get_functions(conn)
+    schema = fetch_all_schema(conn)
+    tables = schema['tables']
+    views = schema['views']
+    functions = schema['functions']
+    counts = get_table_counts(conn, tables)
     
-    print(f"\n📊 Schema Summary:")
-    print(f"   Tables: {len(tables)}")
-    print(f"   Views: {len(views)}")
-    print(f"   Functions: {len(functions)}")
+    buf.write(f"\n📊 Schema Summary:\n")
+    buf.write(f"   Tables: {len(tables)}\n")
+    buf.write(f"   Views: {len(views)}\n")
+    buf.write(f"   Functions: {len(functions)}\n")
     
     # Print detailed table information
-    print(f"\n📋 Tables Detail:")
+    buf.write(f"\n📋 Tables Detail:\n")
     for table_name in tables:
-        info = get_table_info(conn, table_name)
-        print(f"\n🗃️  {table_name.upper()} ({info['record_count']:,} records)")
+        info = schema['schemas'].get(table_name, {})
+        count = counts.get(table_name)
+        count_label = "unknown" if count is None else f"{count:,}"
+        buf.write(f"\n🗃️  {table_name.upper()} ({count_label} records)\n")
         
         # Columns
-        print("   Columns:")
-        for col in info['columns']:
+        buf.write("   Columns:\n")
+        for col in info.get('columns', []):
             nullable = "NULL" if col['is_nullable'] == 'YES' else "NOT NULL"
             default = f" DEFAULT {col['column_default']}" if col['column_default'] else ""
-            print(f"     • {col['column_name']} {col['data_type']} {nullable}{default}")
+            buf.write(f"     • {col['column_name']} {col['data_type']} {nullable}{default}\n")
         
         # Constraints
-        if info['constraints']:
-            print("   Constraints:")
+        if info.get('constraints'):
+            buf.write("   Constraints:\n")
             for const in info['constraints']:
                 if const['constraint_type'] == 'PRIMARY KEY':
-                    print(f"     🔑 PK: {const['column_name']}")
+                    buf.write(f"     🔑 PK: {const['column_name']}\n")
                 elif const['constraint_type'] == 'FOREIGN KEY':
-                    print(f"     🔗 FK: {const['column_name']} → {const['foreign_table_name']}.{const['foreign_column_name']}")
+                    buf.write(f"     🔗 FK: {const['column_name']} → {const['foreign_table_name']}.{const['foreign_column_name']}\n")
                 elif const['constraint_type'] == 'UNIQUE':
-                    print(f"     🎯 UNIQUE: {const['column_name']}")
+                    buf.write(f"     🎯 UNIQUE: {const['column_name']}\n")
                 elif const['constraint_type'] == 'CHECK':
-                    print(f"     ✅ CHECK: {const['constraint_name']}")
+                    buf.write(f"     ✅ CHECK: {const['constraint_name']}\n")
     
     # Print views
     if views:
-        print(f"\n👁️  Views:")
+        buf.write(f"\n👁️  Views:\n")
         for view in views:
-            print(f"   • {view}")
+            buf.write(f"   • {view['table_name']}\n")
     
     # Print functions
     if functions:
-        print(f"\n⚙️  Functions:")
+        buf.write(f"\n⚙️  Functions:\n")
         for func in functions:
-            print(f"   • {func['routine_name']}() [{func['routine_type']}]")
+            buf.write(f"   • {func['routine_name']}() [{func['routine_type']}]\n")
+    
+    sys.stdout.write(buf.getvalue())
 
 def main():
     """Main function"""
@@ -196,7 +115,7 @@ def main():
     
     try:
         print("\n🔌 Connecting to PostgreSQL...")
-        conn = get_postgres_connection()
+        conn = connect()
         
         if not conn:
             print("❌ Could not establish connection")
@@ -208,7 +127,7 @@ def main():
         print_schema(conn)
         
         # Close connection
-        conn.close()
+        close()
         print(f"\n✅ Schema exploration complete!")
         
     except Exception as e:
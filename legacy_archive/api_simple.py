@@ -5,26 +5,44 @@ FastAPI-based REST API for sports industry contact intelligence
 """
 
 import os
+import re
+import base64
 import json
+import asyncio
+import uuid
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Union, Any
+import httpx
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
+from cachetools import TTLCache
 
-from fastapi import FastAPI, HTTPException, Query, Path, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Path, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
+import msgspec
+import pyarrow as pa
 import uvicorn
 import sys
 
 # Load environment variables
 load_dotenv()
 
+# Keep-alive connection pool shared by every Supabase request, so TLS handshakes are reused
+# across requests and threadpool workers (timeout matches the PostgREST client default)
+http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30),
+    timeout=120
+)
+
 # Initialize Supabase client
 supabase: Client = create_client(
     os.getenv('SUPABASE_URL'),
-    os.getenv('SUPABASE_API_KEY')
+    os.getenv('SUPABASE_API_KEY'),
+    options=ClientOptions(httpx_client=http_client)
 )
 
 # Create FastAPI app
@@ -33,20 +51,100 @@ app = FastAPI(
     description="Sports Industry Contact Intelligence Platform",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
+# Batch sizes for bulk imports: rows per write request, values per IN lookup, rows per page
+IMPORT_BATCH_SIZE = 500
+LOOKUP_BATCH_SIZE = 200
+PAGE_SIZE = 1000
+
+# Media type list endpoints can answer with instead of JSON (see page_response)
+ARROW_STREAM_TYPE = "application/vnd.apache.arrow.stream"
+
+# Organization name keywords used to guess sport/org_type on import. Each set is compiled
+# once into a single alternation, so a name is scanned in one regex pass instead of one
+# substring test per keyword (keywords still match anywhere in the name, e.g. "corporation")
+NFL_TEAM_NAMES = frozenset({
+    'vikings', 'patriots', 'cowboys', 'packers', 'eagles', 'giants', 'jets', 'bills',
+    'dolphins', 'steelers', 'ravens', 'browns', 'bengals', 'texans', 'colts', 'titans',
+    'jaguars', 'broncos', 'chiefs', 'raiders', 'chargers', '49ers', 'seahawks', 'rams',
+    'cardinals', 'saints', 'falcons', 'panthers', 'buccaneers', 'bears', 'lions', 'commanders'
+})
+EDUCATION_TERMS = frozenset({'university', 'college', 'school'})
+AGENCY_TERMS = frozenset({'inc', 'corp', 'llc', 'company', 'agency', 'group'})
+
+def compile_keywords(keywords) -> re.Pattern:
+    """Compile a keyword set into one substring-matching pattern"""
+    return re.compile('|'.join(map(re.escape, sorted(keywords))))
+
+NFL_TEAM_PATTERN = compile_keywords(NFL_TEAM_NAMES)
+EDUCATION_PATTERN = compile_keywords(EDUCATION_TERMS)
+AGENCY_PATTERN = compile_keywords(AGENCY_TERMS)
+
+# In-process caches for slowly-changing reads, keyed by (endpoint, query args)
+response_cache = TTLCache(maxsize=1000, ttl=30)
+analytics_cache = TTLCache(maxsize=32, ttl=300)
+
 # Print Python executable path at startup
 print(f"[FastAPI] Python: {sys.executable}")
 
 # Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure this properly in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Preflight response headers are fixed, so they are built once rather than per request
+CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+]
+
+class AllowAllCORSMiddleware:
+    """
+    Pure ASGI replacement for CORSMiddleware(allow_origins=["*"], allow_credentials=True):
+    every origin is allowed, so the request origin is echoed back without any matching
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        headers = dict(scope["headers"])
+        origin = headers.get(b"origin")
+        if origin is None:
+            return await self.app(scope, receive, send)
+        
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        
+        # Answer preflight requests directly, allowing whatever headers were asked for
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in headers:
+            request_headers = headers.get(b"access-control-request-headers")
+            if request_headers:
+                cors_headers.append((b"access-control-allow-headers", request_headers))
+            await send({
+                "type": "http.response.start",
+                "status": 204,
+                "headers": cors_headers + CORS_PREFLIGHT_HEADERS
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+app.add_middleware(AllowAllCORSMiddleware)  # Configure this properly in production
+
+# Compress list responses (up to 1000 rows of repetitive JSON); small payloads are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Pydantic models
 class PersonBase(BaseModel):
@@ -55,8 +153,47 @@ class PersonBase(BaseModel):
     last_name: Optional[str] = None
     linkedin_url: Optional[str] = None
 
-class PersonCreate(PersonBase):
-    pass
+class PersonCreate(msgspec.Struct):
+    """Create-person payload, decoded and validated by msgspec in one pass"""
+    full_name: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    linkedin_url: Optional[str] = None
+
+class PersonBatch(msgspec.Struct):
+    """Batch person lookup payload"""
+    ids: List[str] = []
+
+CSVValue = Optional[Union[str, int, float]]
+
+class Contact(msgspec.Struct, gc=False):
+    """
+    One imported contact row; unknown CSV columns are ignored while decoding
+    Numeric cells are accepted and stringified, NaN cells count as missing
+    """
+    name: CSVValue = None
+    full_name: CSVValue = None
+    first_name: CSVValue = None
+    last_name: CSVValue = None
+    linkedin_url: CSVValue = None
+    organization: CSVValue = None
+    company: CSVValue = None
+    company_name: CSVValue = None
+    job_title: CSVValue = None
+    title: CSVValue = None
+    department: CSVValue = None
+    dept: CSVValue = None
+    
+    def __post_init__(self):
+        for field in self.__struct_fields__:
+            value = getattr(self, field)
+            if value is not None and not isinstance(value, str):
+                setattr(self, field, None if value != value else str(value))
+
+class ImportPayload(msgspec.Struct):
+    """Contact import payload, decoded and validated by msgspec in one pass"""
+    contacts: List[Contact] = []
+    source: str = "unknown"
 
 class PersonResponse(PersonBase):
     id: str
@@ -87,6 +224,128 @@ class SearchResponse(BaseModel):
     limit: int
 
 # Helper functions
+async def run_query(query):
+    """Execute a Supabase query in the threadpool so the blocking HTTP call doesn't stall the event loop"""
+    return await run_in_threadpool(query.execute)
+
+def chunked(items: List[Any], size: int):
+    """Yield successive slices of items of at most size elements"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+async def select_in(table: str, columns: str, column: str, values, modify=None) -> List[Dict[str, Any]]:
+    """Select rows whose column is in values, chunked so request URLs stay short"""
+    queries = []
+    for batch in chunked(list(values), LOOKUP_BATCH_SIZE):
+        query = supabase.table(table).select(columns).in_(column, batch)
+        if modify:
+            query = modify(query)
+        queries.append(run_query(query))
+    
+    results = await asyncio.gather(*queries)
+    return [row for result in results for row in result.data]
+
+async def bulk_write(table: str, rows: List[Dict[str, Any]], errors: List[str], key,
+                     method: str = "upsert", **kwargs) -> List[Optional[Dict[str, Any]]]:
+    """
+    Write rows in batches and return the written rows aligned with the input (None where a row failed)
+    Rows are grouped by column set first, since PostgREST fills columns missing from a bulk payload with NULL.
+    Written rows are matched back to the input by key(row), a natural key, since PostgREST does not promise
+    to return them in input order; a failed batch is retried one row at a time so a bad row only loses itself
+    """
+    written = [None] * len(rows)
+    groups = {}
+    for index, row in enumerate(rows):
+        groups.setdefault(frozenset(row), []).append(index)
+    
+    async def write(indexes):
+        builder = getattr(supabase.table(table), method)([rows[i] for i in indexes], **kwargs)
+        result = await run_query(builder)
+        
+        returned = defaultdict(list)
+        for written_row in result.data or []:
+            returned[key(written_row)].append(written_row)
+        for index in indexes:
+            matches = returned.get(key(rows[index]))
+            if matches:
+                written[index] = matches.pop()
+    
+    for indexes in groups.values():
+        for batch in chunked(indexes, IMPORT_BATCH_SIZE):
+            try:
+                await write(batch)
+            except Exception:
+                for index in batch:
+                    try:
+                        await write([index])
+                    except Exception as e:
+                        errors.append(f"Failed to write {table} row {key(rows[index])!r}: {str(e)}")
+    
+    return written
+
+def classify_organization(org_name: str) -> Dict[str, Any]:
+    """Build a new organization record, guessing sport/org_type from name patterns"""
+    org_data = {
+        'name': org_name
+    }
+    
+    # Try to determine org_type from name patterns
+    org_name_lower = org_name.lower()
+    if NFL_TEAM_PATTERN.search(org_name_lower):
+        org_data['sport'] = 'NFL'
+        org_data['org_type'] = 'Team'
+    elif EDUCATION_PATTERN.search(org_name_lower):
+        org_data['org_type'] = 'Education'
+    elif AGENCY_PATTERN.search(org_name_lower):
+        org_data['org_type'] = 'Agency'
+    
+    return org_data
+
+def clear_response_caches():
+    """Drop cached reads after a write so the next request sees the change"""
+    response_cache.clear()
+    analytics_cache.clear()
+
+def encode_cursor(row: Dict[str, Any], column: str) -> str:
+    """Opaque keyset cursor pointing just past row in (column, id) order"""
+    return base64.urlsafe_b64encode(msgspec.json.encode([row[column], row['id']])).decode()
+
+def quote_filter_value(value: Any) -> str:
+    """Double-quote a value for a PostgREST logic filter so commas/parentheses are literal"""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def after_cursor(query, column: str, cursor: str):
+    """Keyset filter: rows strictly after the cursor in (column, id) order, seeking via the index"""
+    try:
+        value, row_id = msgspec.json.decode(base64.urlsafe_b64decode(cursor))
+    except (ValueError, TypeError, msgspec.DecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+    
+    value, row_id = quote_filter_value(value), quote_filter_value(row_id)
+    return query.or_(f"{column}.gt.{value},and({column}.eq.{value},id.gt.{row_id})")
+
+def arrow_response(rows: List[Dict[str, Any]], headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serialize rows as an Arrow IPC stream, which clients load straight into columnar frames"""
+    table = pa.Table.from_pylist(rows)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    
+    return Response(sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_TYPE, headers=headers)
+
+def page_response(rows: List[Dict[str, Any]], limit: int, column: str, accept: Optional[str] = None) -> Response:
+    """
+    Return a page of rows, advertising the next keyset cursor when the page is full
+    Rows go out as an Arrow IPC stream when the client accepts one, JSON otherwise
+    """
+    headers = {'X-Next-Cursor': encode_cursor(rows[-1], column)} if len(rows) == limit else None
+    if accept and ARROW_STREAM_TYPE in accept:
+        return arrow_response(rows, headers)
+    return ORJSONResponse(rows, headers=headers)
+
 def safe_supabase_query(table: str, operation: str, **kwargs):
     """Safely execute Supabase queries with error handling"""
     try:
@@ -125,12 +384,12 @@ def safe_supabase_query(table: str, operation: str, **kwargs):
         return []
 
 # Health check endpoint
-@app.get("/health")
+@app.get("/health", response_model=None)
 async def health_check():
     """Health check endpoint"""
     try:
         # Test connection with a simple query
-        result = supabase.table('person').select("id").limit(1).execute()
+        result = await run_query(supabase.table('person').select("id").limit(1))
         
         return {
             "status": "healthy",
@@ -139,7 +398,7 @@ async def health_check():
             "database": "connected"
         }
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy", 
@@ -149,35 +408,71 @@ async def health_check():
         )
 
 # People endpoints
-@app.get("/people")
-async def list_people(
-    limit: int = Query(100, ge=1, le=1000),
-    offset: int = Query(0, ge=0),
-    search: Optional[str] = Query(None)
-):
-    """List people with optional search"""
+async def _fetch_people(limit: int, offset: int, search: Optional[str],
+                        after: Optional[str] = None,
+                        created_after: Optional[str] = None,
+                        fields: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Fetch a page of people, shared by /people and its /person alias"""
+    key = ('list_people', limit, offset, search, after, created_after, fields)
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    # id and full_name are always selected because the pagination cursor is built from them
+    columns = "*"
+    if fields:
+        columns = ",".join(dict.fromkeys(['id', 'full_name', *fields.split(',')]))
+    
     try:
-        query = supabase.table('person').select("*")
+        query = supabase.table('person').select(columns)
         
         if search:
             query = query.or_(f"full_name.ilike.%{search}%,first_name.ilike.%{search}%,last_name.ilike.%{search}%")
         
-        query = query.order('full_name').limit(limit).offset(offset)
-        result = query.execute()
+        if created_after:
+            query = query.gte('created_at', created_after)
+        
+        # A cursor seeks past the previous page; offset is kept for existing clients
+        if after:
+            query = after_cursor(query, 'full_name', after)
+        else:
+            query = query.offset(offset)
         
+        query = query.order('full_name').order('id').limit(limit)
+        result = await run_query(query)
+        
+        response_cache[key] = result.data
         return result.data
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve people: {str(e)}"
         )
 
-@app.get("/people/{person_id}")
+@app.get("/people", response_model=None)
+async def list_people(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    search: Optional[str] = Query(None),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    created_after: Optional[str] = Query(None, description="Only people created at or after this ISO timestamp"),
+    fields: Optional[str] = Query(None, pattern=r"^[a-z_]+(,[a-z_]+)*$",
+                                  description="Comma-separated person columns to return (default: all)")
+):
+    """List people with optional search"""
+    # Raw Supabase rows are already JSON-ready, so skip jsonable_encoder
+    people = await _fetch_people(limit, offset, search, after, created_after, fields)
+    return page_response(people, limit, 'full_name', request.headers.get('accept'))
+
+@app.get("/people/{person_id}", response_model=None)
 async def get_person(person_id: str = Path(...)):
     """Get person by ID"""
     try:
-        result = supabase.table('person').select("*").eq("id", person_id).execute()
+        result = await run_query(supabase.table('person').select("*").eq("id", person_id))
         
         if not result.data:
             raise HTTPException(
@@ -185,7 +480,7 @@ async def get_person(person_id: str = Path(...)):
                 detail="Person not found"
             )
         
-        return result.data[0]
+        return ORJSONResponse(result.data[0])
         
     except HTTPException:
         raise
@@ -195,17 +490,53 @@ async def get_person(person_id: str = Path(...)):
             detail=f"Failed to retrieve person: {str(e)}"
         )
 
-@app.post("/people")
-async def create_person(person: PersonCreate):
+@app.post("/people/batch", response_model=None)
+async def get_people_batch(request: Request):
+    """Get several people by ID in one request; unknown IDs are left out"""
+    try:
+        batch = msgspec.json.decode(await request.body(), type=PersonBatch)
+    except msgspec.DecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid batch payload: {str(e)}"
+        )
+    
+    if len(batch.ids) > PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {PAGE_SIZE} IDs per batch"
+        )
+    
+    try:
+        return ORJSONResponse(await select_in('person', '*', 'id', set(batch.ids)))
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve people: {str(e)}"
+        )
+
+@app.post("/people", response_model=None)
+async def create_person(request: Request):
     """Create new person with duplicate handling"""
     try:
+        person = msgspec.json.decode(await request.body(), type=PersonCreate)
+    except msgspec.DecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid person payload: {str(e)}"
+        )
+    
+    try:
+        now = datetime.utcnow().isoformat()
+        
         # Only include fields that exist in the person table schema
         person_data = {
             'full_name': person.full_name,
             'first_name': person.first_name,
             'last_name': person.last_name,
             'linkedin_url': person.linkedin_url,
-            'updated_at': datetime.utcnow().isoformat()
+            'updated_at': now
         }
         
         # Remove None values to avoid inserting nulls where not needed
@@ -215,14 +546,15 @@ async def create_person(person: PersonCreate):
         existing_person = None
         
         if person_data.get("linkedin_url"):
-            result = supabase.table('person').select('*').eq('linkedin_url', person_data["linkedin_url"]).execute()
+            result = await run_query(supabase.table('person').select('id').eq('linkedin_url', person_data["linkedin_url"]))
             if result.data:
                 existing_person = result.data[0]
         
         if existing_person:
             # Update existing record
-            result = supabase.table('person').update(person_data).eq('id', existing_person['id']).execute()
+            result = await run_query(supabase.table('person').update(person_data).eq('id', existing_person['id']))
             if result.data:
+                clear_response_caches()
                 return result.data[0]
             else:
                 raise HTTPException(
@@ -231,9 +563,10 @@ async def create_person(person: PersonCreate):
                 )
         else:
             # Insert new record
-            person_data["created_at"] = datetime.utcnow().isoformat()
-            result = supabase.table('person').insert(person_data).execute()
+            person_data["created_at"] = now
+            result = await run_query(supabase.table('person').insert(person_data))
             if result.data:
+                clear_response_caches()
                 return result.data[0]
             else:
                 raise HTTPException(
@@ -254,7 +587,7 @@ async def delete_person(person_id: str = Path(...)):
     """Delete person by ID"""
     try:
         # First check if person exists
-        result = supabase.table('person').select("*").eq("id", person_id).execute()
+        result = await run_query(supabase.table('person').select("id").eq("id", person_id))
         
         if not result.data:
             raise HTTPException(
@@ -263,7 +596,8 @@ async def delete_person(person_id: str = Path(...)):
             )
         
         # Delete the person (roles will be deleted via CASCADE if foreign key constraints exist)
-        delete_result = supabase.table('person').delete().eq("id", person_id).execute()
+        delete_result = await run_query(supabase.table('person').delete().eq("id", person_id))
+        clear_response_caches()
         
         return {"message": "Person deleted successfully", "id": person_id}
         
@@ -276,14 +610,14 @@ async def delete_person(person_id: str = Path(...)):
         )
 
 # Organizations endpoints
-@app.get("/organizations")
-async def list_organizations(
-    limit: int = Query(100, ge=1, le=1000),
-    offset: int = Query(0, ge=0),
-    sport: Optional[str] = Query(None),
-    search: Optional[str] = Query(None)
-):
-    """List organizations with optional filtering"""
+async def _fetch_organizations(limit: int, offset: int, sport: Optional[str],
+                               search: Optional[str], after: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Fetch a page of organizations, shared by /organizations and its /organization alias"""
+    key = ('list_organizations', limit, offset, sport, search, after)
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached
+    
     try:
         query = supabase.table('organization').select("*")
         
@@ -293,22 +627,75 @@ async def list_organizations(
         if search:
             query = query.or_(f"name.ilike.%{search}%,sport.ilike.%{search}%,org_type.ilike.%{search}%")
         
-        query = query.order('name').limit(limit).offset(offset)
-        result = query.execute()
+        if after:
+            query = after_cursor(query, 'name', after)
+        else:
+            query = query.offset(offset)
+        
+        query = query.order('name').order('id').limit(limit)
+        result = await run_query(query)
         
+        response_cache[key] = result.data
         return result.data
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve organizations: {str(e)}"
         )
 
-@app.get("/organizations/{org_id}")
+@app.get("/organizations", response_model=None)
+async def list_organizations(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    sport: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header")
+):
+    """List organizations with optional filtering"""
+    organizations = await _fetch_organizations(limit, offset, sport, search, after)
+    return page_response(organizations, limit, 'name', request.headers.get('accept'))
+
+@app.get("/organizations/people_counts", response_model=None)
+async def get_organization_people_counts(
+    ids: str = Query(..., description="Comma-separated organization IDs")
+):
+    """Number of distinct people with a role at each organization, keyed by organization ID"""
+    org_ids = {org_id for org_id in ids.split(',') if org_id}
+    
+    if len(org_ids) > PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {PAGE_SIZE} IDs per request"
+        )
+    
+    try:
+        # Counted in Postgres; at most PAGE_SIZE IDs means at most PAGE_SIZE rows back
+        result = await run_query(supabase.rpc('org_people_counts', {'org_ids': list(org_ids)}))
+        
+        counts = dict.fromkeys(org_ids, 0)
+        counts.update((row['org_id'], row['count']) for row in result.data)
+        return ORJSONResponse(counts)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to count organization people: {str(e)}"
+        )
+
+@app.get("/organizations/{org_id}", response_model=None)
 async def get_organization(org_id: str = Path(...)):
     """Get organization by ID"""
+    key = ('get_organization', org_id)
+    cached = response_cache.get(key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     try:
-        result = supabase.table('organization').select("*").eq("id", org_id).execute()
+        result = await run_query(supabase.table('organization').select("*").eq("id", org_id))
         
         if not result.data:
             raise HTTPException(
@@ -316,7 +703,8 @@ async def get_organization(org_id: str = Path(...)):
                 detail="Organization not found"
             )
         
-        return result.data[0]
+        response_cache[key] = result.data[0]
+        return ORJSONResponse(result.data[0])
         
     except HTTPException:
         raise
@@ -327,7 +715,7 @@ async def get_organization(org_id: str = Path(...)):
         )
 
 # Roles endpoints
-@app.get("/roles")
+@app.get("/roles", response_model=None)
 async def list_roles(
     person_id: Optional[str] = Query(None),
     org_id: Optional[str] = Query(None),
@@ -343,9 +731,9 @@ async def list_roles(
             query = query.eq('org_id', org_id)
         
         query = query.order('start_date', desc=True).limit(limit)
-        result = query.execute()
+        result = await run_query(query)
         
-        return result.data
+        return ORJSONResponse(result.data)
         
     except Exception as e:
         raise HTTPException(
@@ -354,7 +742,7 @@ async def list_roles(
         )
 
 # Search endpoints
-@app.get("/search")
+@app.get("/search", response_model=None)
 async def search(
     q: str = Query(..., min_length=2),
     type: Optional[str] = Query(None),
@@ -365,14 +753,27 @@ async def search(
     try:
         results = []
         
-        # Search people
+        # People and organization searches are independent, so run them concurrently
+        people_query = None
+        org_query = None
+        
         if not type or type == "person":
-            people_query = supabase.table('person').select("*").or_(
+            people_query = supabase.table('person').select("id, full_name, linkedin_url").or_(
                 f"full_name.ilike.%{q}%,first_name.ilike.%{q}%,last_name.ilike.%{q}%"
             ).limit(limit).offset(offset)
-            
-            people_result = people_query.execute()
-            
+        
+        if not type or type == "organization":
+            org_query = supabase.table('organization').select("id, name, sport, org_type").or_(
+                f"name.ilike.%{q}%,sport.ilike.%{q}%,org_type.ilike.%{q}%"
+            ).limit(limit).offset(offset)
+        
+        people_result, org_result = await asyncio.gather(
+            run_query(people_query) if people_query is not None else asyncio.sleep(0),
+            run_query(org_query) if org_query is not None else asyncio.sleep(0)
+        )
+        
+        # Search people
+        if people_result:
             for person in people_result.data:
                 results.append({
                     "type": "person",
@@ -383,13 +784,7 @@ async def search(
                 })
         
         # Search organizations
-        if not type or type == "organization":
-            org_query = supabase.table('organization').select("*").or_(
-                f"name.ilike.%{q}%,sport.ilike.%{q}%,org_type.ilike.%{q}%"
-            ).limit(limit).offset(offset)
-            
-            org_result = org_query.execute()
-            
+        if org_result:
             for org in org_result.data:
                 results.append({
                     "type": "organization",
@@ -400,12 +795,12 @@ async def search(
                     "description": f"Organization: {org['name']} ({org.get('sport', 'Unknown sport')})"
                 })
         
-        return SearchResponse(
-            results=results,
-            total=len(results),
-            page=offset // limit + 1,
-            limit=limit
-        )
+        return ORJSONResponse({
+            "results": results,
+            "total": len(results),
+            "page": offset // limit + 1,
+            "limit": limit
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -414,32 +809,38 @@ async def search(
         )
 
 # Analytics endpoints
-@app.get("/analytics/overview")
+@app.get("/analytics/overview", response_model=None)
 async def get_analytics_overview():
     """Get overview analytics"""
+    # Counts change slowly, so the overview is cached for longer than the list endpoints
+    cached = analytics_cache.get('get_analytics_overview')
+    if cached is not None:
+        return cached
+    
     try:
-        # Get people count
-        people_result = supabase.table('person').select("id", count="exact").execute()
+        # People count, organizations count and sport breakdown are fetched concurrently.
+        # Counts are estimated (exact on small tables, planner statistics on large ones) and
+        # limit(0) keeps PostgREST from shipping every id just to report the count
+        people_result, org_result, sports_result = await asyncio.gather(
+            run_query(supabase.table('person').select("id", count="estimated").limit(0)),
+            run_query(supabase.table('organization').select("id", count="estimated").limit(0)),
+            run_query(supabase.rpc('org_sport_counts'))
+        )
         people_count = people_result.count or 0
-        
-        # Get organizations count
-        org_result = supabase.table('organization').select("id", count="exact").execute()
         org_count = org_result.count or 0
         
-        # Get sport breakdown
-        sports_result = supabase.table('organization').select("sport").execute()
-        sports = {}
-        for org in sports_result.data:
-            sport = org.get('sport', 'Unknown')
-            sports[sport] = sports.get(sport, 0) + 1
+        # Sport breakdown is grouped in Postgres (see org_sport_counts)
+        sports = {row['sport']: row['count'] for row in sports_result.data}
         
-        return {
+        overview = {
             "total_people": people_count,
             "total_organizations": org_count,
             "active_roles": 0,  # Placeholder - would need role table
             "total_connections": people_count + org_count,
             "industry_breakdown": sports
         }
+        analytics_cache['get_analytics_overview'] = overview
+        return overview
         
     except Exception as e:
         raise HTTPException(
@@ -447,7 +848,7 @@ async def get_analytics_overview():
             detail=f"Analytics failed: {str(e)}"
         )
 
-@app.get("/analytics/growth")
+@app.get("/analytics/growth", response_model=None)
 async def get_growth_analytics():
     """Get growth analytics - placeholder"""
     try:
@@ -468,7 +869,7 @@ async def get_growth_analytics():
             detail=f"Growth analytics failed: {str(e)}"
         )
 
-@app.get("/analytics/network")
+@app.get("/analytics/network", response_model=None)
 async def get_network_analytics():
     """Get network analysis - placeholder"""
     try:
@@ -485,13 +886,13 @@ async def get_network_analytics():
             detail=f"Network analytics failed: {str(e)}"
         )
 
-@app.get("/analytics/roles/changes")
+@app.get("/analytics/roles/changes", response_model=None)
 async def get_role_changes(days: int = Query(30)):
     """Get recent role changes"""
     try:
         # Get recent roles/changes from role table or person table
         # Since we don't have a role table, we'll get recent person updates as a proxy
-        result = supabase.table('person').select("*").order('updated_at', desc=True).limit(50).execute()
+        result = await run_query(supabase.table('person').select("full_name, created_at, updated_at").order('updated_at', desc=True).limit(50))
         
         changes = []
         for person in result.data:
@@ -515,31 +916,28 @@ async def get_role_changes(days: int = Query(30)):
             detail=f"Role changes failed: {str(e)}"
         )
 
-@app.get("/analytics/organizations/stats")
+@app.get("/analytics/organizations/stats", response_model=None)
 async def get_organization_stats():
     """Get organization statistics"""
+    cached = analytics_cache.get('get_organization_stats')
+    if cached is not None:
+        return cached
+    
     try:
-        # Get organization breakdown by league/sport
-        result = supabase.table('organization').select("*").execute()
+        # Get organization breakdown by sport, grouped in Postgres (see org_sport_counts)
+        result = await run_query(supabase.rpc('org_sport_counts'))
         
-        league_breakdown = {}
-        state_breakdown = {}
-        total_organizations = len(result.data)
+        league_breakdown = {row['sport']: row['count'] for row in result.data}
+        total_organizations = sum(league_breakdown.values())
         
-        for org in result.data:
-            # League breakdown
-            league = org.get('sport', org.get('league', 'Unknown'))
-            league_breakdown[league] = league_breakdown.get(league, 0) + 1
-            
-            # State breakdown
-            state = org.get('state', 'Unknown')
-            state_breakdown[state] = state_breakdown.get(state, 0) + 1
+        # The organization table has no state column, so every organization is 'Unknown'
+        state_breakdown = {'Unknown': total_organizations} if total_organizations else {}
         
         # Format for frontend
         league_data = [{"league": k, "count": v} for k, v in league_breakdown.items()]
         state_data = [{"state": k, "count": v} for k, v in state_breakdown.items()]
         
-        return {
+        stats = {
             "basic_stats": {
                 "total_organizations": total_organizations,
                 "total_leagues": len(league_breakdown),
@@ -548,6 +946,8 @@ async def get_organization_stats():
             "league_breakdown": league_data,
             "state_breakdown": state_data
         }
+        analytics_cache['get_organization_stats'] = stats
+        return stats
         
     except Exception as e:
         raise HTTPException(
@@ -555,146 +955,221 @@ async def get_organization_stats():
             detail=f"Organization stats failed: {str(e)}"
         )
 
+# Dashboard endpoint
+@app.get("/dashboard", response_model=None)
+async def get_dashboard():
+    """Dashboard counts and the last week's role changes in one response"""
+    cached = response_cache.get('get_dashboard')
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    try:
+        # Both reads run concurrently in the threadpool (see dashboard_stats for the counts)
+        stats_result, changes = await asyncio.gather(
+            run_query(supabase.rpc('dashboard_stats')),
+            get_role_changes(days=7)
+        )
+        
+        dashboard = {"stats": stats_result.data, "changes": changes}
+        response_cache['get_dashboard'] = dashboard
+        return ORJSONResponse(dashboard)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Dashboard failed: {str(e)}"
+        )
+
 # Import endpoints for UI
 @app.post("/import/contacts")
-async def import_contacts(data: Dict[str, Any]):
-    """Import contacts from CSV data with improved handling"""
+async def import_contacts(request: Request):
+    """Import contacts from CSV data using batched upserts instead of per-row round trips"""
+    body = await request.body()
     try:
-        contacts = data.get("contacts", [])
-        source = data.get("source", "unknown")
+        try:
+            payload = msgspec.json.decode(body, type=ImportPayload)
+        except msgspec.DecodeError:
+            # Bare NaN/Infinity tokens (what json.dumps writes for empty pandas cells) aren't strict JSON
+            payload = msgspec.convert(json.loads(body), type=ImportPayload)
+    except (ValueError, msgspec.ValidationError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid import payload: {str(e)}"
+        )
+    
+    try:
+        contacts = payload.contacts
+        source = payload.source
         
         imported = 0
         updated = 0
         errors = []
+        # One timestamp and start date for the whole import; rows are written together anyway
+        now = datetime.utcnow().isoformat()
+        today = datetime.now().date().isoformat()
+        
+        # Prepare person records; contacts sharing a linkedin_url are merged into one record
+        linked_people = {}
+        unlinked_people = []
         
         for contact in contacts:
             try:
                 # Basic validation
-                if not contact.get("name") and not contact.get("full_name"):
+                if not contact.name and not contact.full_name:
                     errors.append("Missing name field")
                     continue
                 
                 # Prepare person data - only use columns that exist in the person table
                 person_data = {
-                    "updated_at": datetime.utcnow().isoformat()
+                    "updated_at": now
                 }
                 
                 # Handle name fields
-                if contact.get("name"):
-                    person_data["full_name"] = str(contact["name"]).strip()
-                elif contact.get("full_name"):
-                    person_data["full_name"] = str(contact["full_name"]).strip()
+                if contact.name:
+                    person_data["full_name"] = contact.name.strip()
+                elif contact.full_name:
+                    person_data["full_name"] = contact.full_name.strip()
                 
-                if contact.get("first_name"):
-                    person_data["first_name"] = str(contact["first_name"]).strip()
-                if contact.get("last_name"):
-                    person_data["last_name"] = str(contact["last_name"]).strip()
+                if contact.first_name:
+                    person_data["first_name"] = contact.first_name.strip()
+                if contact.last_name:
+                    person_data["last_name"] = contact.last_name.strip()
                 
                 # Handle linkedin only (no email fields)
-                if contact.get("linkedin_url"):
-                    linkedin = str(contact["linkedin_url"]).strip()
+                if contact.linkedin_url:
+                    linkedin = contact.linkedin_url.strip()
                     if linkedin and linkedin.lower() not in ['', 'nan', 'null']:
                         person_data["linkedin_url"] = linkedin
                 
                 # Remove None values
                 person_data = {k: v for k, v in person_data.items() if v is not None}
                 
-                # Use upsert to handle duplicates gracefully (linkedin_url only)
-                existing_person = None
-                
-                if person_data.get("linkedin_url"):
-                    result = supabase.table('person').select('*').eq('linkedin_url', person_data["linkedin_url"]).execute()
-                    if result.data:
-                        existing_person = result.data[0]
-                
-                # Insert or update person
-                if existing_person:
-                    # Update existing record
-                    result = supabase.table('person').update(person_data).eq('id', existing_person['id']).execute()
-                    if result.data:
-                        person_id = existing_person['id']
-                        updated += 1
-                    else:
-                        errors.append(f"Failed to update person: {person_data.get('full_name', 'unknown')}")
-                        continue
+                url = person_data.get("linkedin_url")
+                if url and url in linked_people:
+                    # A repeated profile in the same file updates the earlier row
+                    linked_people[url][0].update(person_data)
+                    linked_people[url][1].append(contact)
+                    updated += 1
+                elif url:
+                    linked_people[url] = (person_data, [contact])
                 else:
-                    # Insert new record
-                    person_data["created_at"] = datetime.utcnow().isoformat()
-                    result = supabase.table('person').insert(person_data).execute()
-                    if result.data:
-                        person_id = result.data[0]['id']
-                        imported += 1
-                    else:
-                        errors.append(f"Failed to create person: {person_data.get('full_name', 'unknown')}")
-                        continue
+                    unlinked_people.append((person_data, [contact]))
                 
-                # Handle organization and role if provided
-                org_name = contact.get("organization") or contact.get("company") or contact.get("company_name")
-                job_title = contact.get("job_title") or contact.get("title")
+            except Exception as e:
+                errors.append(f"Error importing {contact.name or contact.full_name or 'unknown'}: {str(e)}")
+        
+        # One lookup tells which profiles already exist (linkedin_url only)
+        existing_urls = {
+            row['linkedin_url']
+            for row in await select_in('person', 'linkedin_url', 'linkedin_url', linked_people)
+        }
+        for person_data, _ in unlinked_people:
+            # Names repeat, so profile-less inserts carry their own id to be matched back by
+            person_data["id"] = str(uuid.uuid4())
+            person_data["created_at"] = now
+        for url, (person_data, _) in linked_people.items():
+            if url not in existing_urls:
+                person_data["created_at"] = now
+        
+        # Upsert profiles on linkedin_url and insert the rest
+        people = list(linked_people.values()) + unlinked_people
+        written = await bulk_write('person', [p for p, _ in linked_people.values()], errors,
+                                   key=lambda row: row['linkedin_url'], on_conflict='linkedin_url')
+        written += await bulk_write('person', [p for p, _ in unlinked_people], errors,
+                                    key=lambda row: row['id'], method="insert")
+        
+        person_ids = []
+        for (person_data, _), row in zip(people, written):
+            if row is None:
+                person_ids.append(None)
+                continue
+            person_ids.append(row['id'])
+            if person_data.get("linkedin_url") in existing_urls:
+                updated += 1
+            else:
+                imported += 1
+        
+        # Collect roles for contacts with both an organization and a job title
+        pending_roles = []
+        for (_, person_contacts), person_id in zip(people, person_ids):
+            if person_id is None:
+                continue
+            
+            for contact in person_contacts:
+                org_name = contact.organization or contact.company or contact.company_name
+                job_title = contact.job_title or contact.title
+                if not (org_name and job_title):
+                    continue
                 
+                org_name = org_name.strip()
+                job_title = job_title.strip()
                 if org_name and job_title:
-                    org_name = str(org_name).strip()
-                    job_title = str(job_title).strip()
-                    
-                    if org_name and job_title:
-                        try:
-                            # Find or create organization
-                            org_result = supabase.table('organization').select("*").ilike('name', org_name).execute()
-                            
-                            if org_result.data:
-                                org_id = org_result.data[0]['id']
-                            else:
-                                # Create new organization
-                                org_data = {
-                                    'name': org_name
-                                }
-                                
-                                # Try to determine org_type from name patterns
-                                org_name_lower = org_name.lower()
-                                if any(team in org_name_lower for team in ['vikings', 'patriots', 'cowboys', 'packers', 'eagles', 'giants', 'jets', 'bills', 'dolphins', 'steelers', 'ravens', 'browns', 'bengals', 'texans', 'colts', 'titans', 'jaguars', 'broncos', 'chiefs', 'raiders', 'chargers', '49ers', 'seahawks', 'rams', 'cardinals', 'saints', 'falcons', 'panthers', 'buccaneers', 'bears', 'lions', 'commanders']):
-                                    org_data['sport'] = 'NFL'
-                                    org_data['org_type'] = 'Team'
-                                elif any(term in org_name_lower for term in ['university', 'college', 'school']):
-                                    org_data['org_type'] = 'Education'
-                                elif any(term in org_name_lower for term in ['inc', 'corp', 'llc', 'company', 'agency', 'group']):
-                                    org_data['org_type'] = 'Agency'
-                                
-                                new_org = supabase.table('organization').insert(org_data).execute()
-                                if new_org.data:
-                                    org_id = new_org.data[0]['id']
-                                else:
-                                    continue  # Skip role creation if org creation failed
-                            
-                            # Create or update role
-                            role_data = {
-                                'person_id': person_id,
-                                'org_id': org_id,
-                                'job_title': job_title,
-                                'start_date': datetime.now().date().isoformat()
-                                # Note: end_date is NULL for current roles
-                            }
-                            
-                            # Handle department if provided
-                            dept = contact.get("department") or contact.get("dept")
-                            if dept:
-                                role_data['dept'] = str(dept).strip()
-                            
-                            # Check if similar role already exists (current role for this person at this org)
-                            existing_role = supabase.table('role').select("*").eq('person_id', person_id).eq('org_id', org_id).is_('end_date', 'null').execute()
-                            
-                            if existing_role.data:
-                                # Update existing role
-                                supabase.table('role').update(role_data).eq('id', existing_role.data[0]['id']).execute()
-                            else:
-                                # Create new role
-                                supabase.table('role').insert(role_data).execute()
-                                
-                        except Exception as role_error:
-                            # Don't fail the whole import if role creation fails
-                            errors.append(f"Role creation failed for {person_data.get('full_name', 'unknown')}: {str(role_error)}")
+                    pending_roles.append((person_id, org_name, job_title, contact))
+        
+        if pending_roles:
+            # Organization names are unique case-insensitively, so match on the lowercased name;
+            # only this batch's names are looked up, at most LOOKUP_BATCH_SIZE rows per call
+            org_names = list({org_name.lower() for _, org_name, _, _ in pending_roles})
+            results = await asyncio.gather(*(
+                run_query(supabase.rpc('organizations_by_name', {'names': batch}))
+                for batch in chunked(org_names, LOOKUP_BATCH_SIZE)
+            ))
+            org_ids = {row['name'].lower(): row['id'] for result in results for row in result.data}
+            
+            new_orgs = {}
+            for _, org_name, _, _ in pending_roles:
+                if org_name.lower() not in org_ids:
+                    new_orgs.setdefault(org_name.lower(), classify_organization(org_name))
+            
+            for row in await bulk_write('organization', list(new_orgs.values()), errors,
+                                        key=lambda row: row['name'].lower(), method="insert"):
+                if row is not None:
+                    org_ids[row['name'].lower()] = row['id']
+            
+            # Current roles (end_date is NULL) for this person/org pair are updated, others inserted
+            current_roles = {
+                (row['person_id'], row['org_id']): row['id']
+                for row in await select_in(
+                    'role', 'id, person_id, org_id', 'person_id',
+                    {person_id for person_id, _, _, _ in pending_roles},
+                    modify=lambda query: query.is_('end_date', 'null')
+                )
+            }
+            
+            role_updates = []
+            role_inserts = {}
+            for person_id, org_name, job_title, contact in pending_roles:
+                org_id = org_ids.get(org_name.lower())
+                if org_id is None:
+                    continue  # Skip role creation if org creation failed
                 
-            except Exception as e:
-                errors.append(f"Error importing {contact.get('name', contact.get('full_name', 'unknown'))}: {str(e)}")
+                role_data = {
+                    'person_id': person_id,
+                    'org_id': org_id,
+                    'job_title': job_title,
+                    'start_date': today
+                    # Note: end_date is NULL for current roles
+                }
+                
+                # Handle department if provided
+                dept = contact.department or contact.dept
+                if dept:
+                    role_data['dept'] = dept.strip()
+                
+                role_id = current_roles.get((person_id, org_id))
+                if role_id:
+                    role_updates.append({'id': role_id, **role_data})
+                else:
+                    role_inserts[(person_id, org_id)] = role_data
+            
+            role_key = lambda row: (row['person_id'], row['org_id'])
+            await bulk_write('role', role_updates, errors, key=role_key, on_conflict='id')
+            await bulk_write('role', list(role_inserts.values()), errors, key=role_key,
+                             on_conflict='person_id,org_id,start_date')
+        
+        clear_response_caches()
         
         return {
             "imported": imported,
@@ -710,7 +1185,7 @@ async def import_contacts(data: Dict[str, Any]):
             detail=f"Import failed: {str(e)}"
         )
 
-@app.get("/import/history")
+@app.get("/import/history", response_model=None)
 async def get_import_history():
     """Get import history - placeholder"""
     return [
@@ -731,22 +1206,23 @@ async def get_import_history():
     ]
 
 # Database explorer endpoints
-@app.get("/person")
+# The aliases share the default page (and its cache entry) with the canonical endpoints
+@app.get("/person", response_model=None, include_in_schema=False)
 async def get_all_people():
     """Get all people - alias for /people"""
-    return await list_people()
+    return ORJSONResponse(await _fetch_people(100, 0, None))
 
-@app.get("/organization") 
+@app.get("/organization", response_model=None, include_in_schema=False)
 async def get_all_organizations():
     """Get all organizations - alias for /organizations"""
-    return await list_organizations()
+    return ORJSONResponse(await _fetch_organizations(100, 0, None, None))
 
-@app.get("/news_item")
+@app.get("/news_item", response_model=None)
 async def get_news_items():
     """Get news items"""
     try:
-        result = supabase.table('news_item').select("*").limit(100).execute()
-        return result.data
+        result = await run_query(supabase.table('news_item').select("*").limit(100))
+        return ORJSONResponse(result.data)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -754,7 +1230,7 @@ async def get_news_items():
         )
 
 # Export endpoint
-@app.get("/export")
+@app.get("/export", response_model=None)
 async def export_data(
     type: str = Query("all_contacts"),
     format: str = Query("csv"),
@@ -772,14 +1248,14 @@ async def export_data(
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={"detail": "Resource not found"}
     )
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
@@ -790,5 +1266,9 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # Requires the uvicorn[standard] extras; fail loudly rather than fall back to asyncio/h11
+        loop="uvloop",
+        http="httptools",
+        interface="asgi3"
     )
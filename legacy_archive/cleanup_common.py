@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the contact cleanup scripts
+API access (pooled session, concurrent deletes) and direct Supabase access (paged reads,
+batched deletes, server-side incomplete/date filters) used by cleanup_contacts.py,
+delete_recent_contacts.py and simple_cleanup.py
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import lru_cache
+from urllib.parse import urlencode
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+from supabase import create_client
+
+# Load environment variables
+load_dotenv()
+
+API_URL = "http://localhost:8000"
+
+# The only person columns the cleanup reads
+PERSON_FIELDS = "id,full_name,linkedin_url,created_at"
+
+# Concurrent DELETE requests; enough to overlap round trips without flooding the API's connection pool
+DELETE_WORKERS = 16
+
+# IDs per bulk DELETE; each UUID adds ~37 bytes to the query string, so batches stay well
+# under proxy URL limits (same bound the API uses for its IN lookups)
+DELETE_BATCH_SIZE = 200
+
+# Rows per range() request or /people page (PostgREST's default max-rows cap and the API's limit)
+PAGE_SIZE = 1000
+
+# /people pages requested at once; pages are fetched in waves until one comes back short
+PAGE_WORKERS = 8
+
+# One pooled session for every API call, so connections are reused instead of forking curl per
+# request; the pool is sized for the concurrent delete workers
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+def is_incomplete(person):
+    """True for records with no LinkedIn URL (the only public identifier we track) and no meaningful name"""
+    if person.get('linkedin_url'):
+        return False
+    
+    name = person.get('full_name')
+    return not name or len(name.strip()) < 2
+
+# API access
+def api_request(endpoint, method="GET", data=None):
+    """Call the local API over the shared keep-alive session and return the JSON response"""
+    try:
+        # orjson decodes large /people pages several times faster than the stdlib json module
+        body, headers = None, None
+        if data is not None:
+            body, headers = orjson.dumps(data), {"Content-Type": "application/json"}
+        
+        response = session.request(method, f"{API_URL}{endpoint}", data=body, headers=headers, timeout=30)
+        if response.content:
+            return orjson.loads(response.content)
+        return {"success": True}
+    except Exception as e:
+        print(f"Error calling API: {e}")
+        return None
+
+def get_all_people(**filters):
+    """All people matching the /people filters, fetched in waves of concurrent pages; None on failure"""
+    people = []
+    offset = 0
+    
+    def fetch_page(page_offset):
+        params = {'limit': PAGE_SIZE, 'offset': page_offset, 'fields': PERSON_FIELDS, **filters}
+        return api_request(f"/people?{urlencode(params)}")
+    
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+        while True:
+            wave = range(offset, offset + PAGE_WORKERS * PAGE_SIZE, PAGE_SIZE)
+            
+            # map() yields pages in offset order, so rows keep the API's ordering
+            for page in executor.map(fetch_page, wave):
+                if isinstance(page, dict) and 'detail' in page:
+                    print(f"❌ API Error: {page['detail']}")
+                    return None
+                if not isinstance(page, list):
+                    return None
+                
+                people.extend(page)
+                if len(page) < PAGE_SIZE:
+                    return people
+            
+            offset += PAGE_WORKERS * PAGE_SIZE
+
+def delete_via_api(records):
+    """Delete records through the API concurrently; returns (deleted_count, failed_count)"""
+    deleted_count = 0
+    failed_count = 0
+    
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        futures = {
+            executor.submit(api_request, f"/people/{record['id']}", method="DELETE"): record
+            for record in records
+        }
+        
+        for i, future in enumerate(as_completed(futures)):
+            name = futures[future].get('full_name', 'No name')
+            
+            if future.result() is not None:
+                deleted_count += 1
+                if (i + 1) % 50 == 0:
+                    print(f"  Progress: {i+1}/{len(records)} records processed...")
+            else:
+                failed_count += 1
+                print(f"  ❌ Failed to delete: {name}")
+    
+    return deleted_count, failed_count
+
+# Direct Supabase access
+@lru_cache(maxsize=1)
+def get_supabase():
+    """
+    Supabase client, created and validated once on first use so API-only scripts never need
+    database credentials and a missing setting stops the script before any cleanup starts
+    """
+    url = os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_API_KEY')
+    
+    if not url or not key:
+        raise SystemExit("❌ Missing SUPABASE_URL or SUPABASE_API_KEY")
+    
+    return create_client(url, key)
+
+def fetch_pages(build_query):
+    """Yield rows one range() page at a time; build_query must return a fresh, ordered query"""
+    start = 0
+    while True:
+        result = build_query().range(start, start + PAGE_SIZE - 1).execute()
+        yield from result.data
+        
+        if len(result.data) < PAGE_SIZE:
+            break
+        start += PAGE_SIZE
+
+def fetch_incomplete():
+    """Incomplete person records, filtered in Postgres (see incomplete_people)"""
+    return list(fetch_pages(lambda: get_supabase().rpc('incomplete_people').order('id')))
+
+def fetch_by_date_range(target_date):
+    """Person records created on target_date (YYYY-MM-DD)"""
+    # Half-open range [day, next day) so rows in the last second are included and the
+    # created_at index is used for a plain range scan
+    next_day = (datetime.fromisoformat(target_date) + timedelta(days=1)).date().isoformat()
+    return list(fetch_pages(
+        lambda: get_supabase().table('person').select(PERSON_FIELDS)
+        .gte('created_at', f'{target_date}T00:00:00').lt('created_at', f'{next_day}T00:00:00')
+        .order('id')
+    ))
+
+def fetch_counts_by_date():
+    """Person counts per creation day, grouped in Postgres (see person_counts_by_date)"""
+    return {row['day']: row['count'] for row in get_supabase().rpc('person_counts_by_date').execute().data}
+
+def purge_by_date(target_date):
+    """Delete every person created on target_date in one transaction (see purge_person_by_day)"""
+    return get_supabase().rpc('purge_person_by_day', {'d': target_date}).execute().data
+
+def batched_delete(records):
+    """Delete person records with one purge_people call per batch, retrying a failed batch per record"""
+    supabase = get_supabase()
+    deleted_count = 0
+    
+    for start in range(0, len(records), DELETE_BATCH_SIZE):
+        batch = records[start:start + DELETE_BATCH_SIZE]
+        
+        try:
+            # role.person_id does not cascade, so purge_people deletes the roles first in the same transaction
+            supabase.rpc('purge_people', {'ids': [record['id'] for record in batch]}).execute()
+            deleted_count += len(batch)
+        except Exception as e:
+            print(f"  ⚠️  Batch delete failed ({e}), retrying one record at a time...")
+            for record in batch:
+                try:
+                    supabase.rpc('purge_people', {'ids': [record['id']]}).execute()
+                    deleted_count += 1
+                except Exception as e:
+                    print(f"  ❌ Failed to delete {record['full_name']}: {e}")
+        
+        print(f"  Deleted {deleted_count}/{len(records)} records...")
+    
+    return deleted_count
@@ -4,67 +4,33 @@ Cleanup Script for Corrupted Contact Imports
 Removes incomplete contact records from failed import batches
 """
 
-import os
-import json
-from datetime import datetime
-from dotenv import load_dotenv
-from supabase import create_client
-
-# Load environment variables
-load_dotenv()
-
-# Initialize Supabase client
-supabase = create_client(
-    os.getenv('SUPABASE_URL'),
-    os.getenv('SUPABASE_API_KEY')
+from cleanup_common import (
+    batched_delete,
+    fetch_by_date_range,
+    fetch_counts_by_date,
+    fetch_incomplete,
+    purge_by_date,
 )
 
 def find_incomplete_records():
     """Find records that are incomplete (missing LinkedIn URL - the only public identifier we track)"""
     print("🔍 Finding incomplete records...")
-    
-    # Get all person records
-    result = supabase.table('person').select('*').execute()
-    
-    incomplete_records = []
-    for person in result.data:
-        # Check if record is incomplete (no LinkedIn URL and no meaningful name)
-        if (not person.get('linkedin_url') and 
-            (not person.get('full_name') or len(person.get('full_name', '').strip()) < 2)):
-            incomplete_records.append(person)
-    
-    return incomplete_records
+    return fetch_incomplete()
 
 def find_records_by_date(target_date):
     """Find records created on a specific date"""
     print(f"🔍 Finding records created on {target_date}...")
-    
-    # Get records from specific date
-    result = supabase.table('person').select('*').gte('created_at', f'{target_date}T00:00:00').lt('created_at', f'{target_date}T23:59:59').execute()
-    
-    return result.data
+    return fetch_by_date_range(target_date)
 
 def analyze_records():
     """Analyze the current state of records"""
     print("📊 Analyzing current records...")
     
-    # Get all records
-    result = supabase.table('person').select('id, full_name, linkedin_url, created_at').execute()
-    
-    total = len(result.data)
-    by_date = {}
-    incomplete = []
-    
-    for person in result.data:
-        created_date = person['created_at'][:10]
-        if created_date not in by_date:
-            by_date[created_date] = 0
-        by_date[created_date] += 1
-        
-        # Check if incomplete
-        if (not person.get('linkedin_url') and 
-            (not person.get('full_name') or len(person.get('full_name', '').strip()) < 2)):
-            incomplete.append(person)
+    # Per-day counts are grouped in Postgres (see person_counts_by_date) and incomplete
+    # records are filtered there too, so no full table download is needed
+    by_date = fetch_counts_by_date()
+    total = sum(by_date.values())
+    incomplete = find_incomplete_records()
     
     print(f"Total records: {total}")
     print("\nRecords by date:")
@@ -75,9 +41,10 @@ def analyze_records():
     
     return incomplete
 
-def cleanup_incomplete_records(dry_run=True):
-    """Remove incomplete records"""
-    incomplete = find_incomplete_records()
+def cleanup_incomplete_records(incomplete=None, dry_run=True):
+    """Remove incomplete records, reusing an already-fetched list when one is passed in"""
+    if incomplete is None:
+        incomplete = find_incomplete_records()
     
     if not incomplete:
         print("✅ No incomplete records found!")
@@ -104,25 +71,14 @@ def cleanup_incomplete_records(dry_run=True):
         return
     
     print("🗑️  Deleting incomplete records...")
-    deleted_count = 0
-    
-    for record in incomplete:
-        try:
-            # Delete the person record
-            supabase.table('person').delete().eq('id', record['id']).execute()
-            deleted_count += 1
-            
-            if deleted_count % 50 == 0:
-                print(f"  Deleted {deleted_count}/{len(incomplete)} records...")
-                
-        except Exception as e:
-            print(f"  ❌ Failed to delete {record['full_name']}: {e}")
+    deleted_count = batched_delete(incomplete)
     
     print(f"✅ Cleanup complete! Deleted {deleted_count} incomplete records")
 
-def cleanup_by_date(target_date, dry_run=True):
-    """Remove all records from a specific date"""
-    records = find_records_by_date(target_date)
+def cleanup_by_date(target_date, records=None, dry_run=True):
+    """Remove all records from a specific date, reusing an already-fetched list when one is passed in"""
+    if records is None:
+        records = find_records_by_date(target_date)
     
     if not records:
         print(f"✅ No records found for {target_date}")
@@ -150,19 +106,8 @@ def cleanup_by_date(target_date, dry_run=True):
         return
     
     print(f"🗑️  Deleting records from {target_date}...")
-    deleted_count = 0
-    
-    for record in records:
-        try:
-            # Delete the person record (roles will be deleted via CASCADE)
-            supabase.table('person').delete().eq('id', record['id']).execute()
-            deleted_count += 1
-            
-            if deleted_count % 50 == 0:
-                print(f"  Deleted {deleted_count}/{len(records)} records...")
-                
-        except Exception as e:
-            print(f"  ❌ Failed to delete {record['full_name']}: {e}")
+    # One server-side statement deletes the whole day atomically, without shipping IDs back
+    deleted_count = purge_by_date(target_date)
     
     print(f"✅ Cleanup complete! Deleted {deleted_count} records from {target_date}")
 
@@ -171,8 +116,8 @@ def main():
     print("🧹 Contact Import Cleanup Tool")
     print("=" * 40)
     
-    # First, analyze current state
-    analyze_records()
+    # First, analyze current state; the incomplete records it finds are reused below
+    incomplete = analyze_records()
     
     print("\nCleanup Options:")
     print("1. Clean up incomplete records (missing LinkedIn URL and meaningful name)")
@@ -185,12 +130,12 @@ def main():
         print("\n🧹 Cleaning up incomplete records...")
         
         # First do a dry run
-        incomplete = cleanup_incomplete_records(dry_run=True)
+        incomplete = cleanup_incomplete_records(incomplete, dry_run=True)
         
         if incomplete:
             proceed = input(f"\nProceed with deleting {len(incomplete)} incomplete records? (y/N): ").strip().lower()
             if proceed == 'y':
-                cleanup_incomplete_records(dry_run=False)
+                cleanup_incomplete_records(incomplete, dry_run=False)
     
     elif choice == "2":
         print("\n🧹 Cleaning up records from June 10, 2025...")
@@ -201,7 +146,7 @@ def main():
         if june_10_records:
             proceed = input(f"\nProceed with deleting {len(june_10_records)} records from June 10? (y/N): ").strip().lower()
             if proceed == 'y':
-                cleanup_by_date("2025-06-10", dry_run=False)
+                cleanup_by_date("2025-06-10", june_10_records, dry_run=False)
     
     elif choice == "3":
         print("\n📊 Analysis complete - no cleanup performed")
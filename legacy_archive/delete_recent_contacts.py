@@ -3,52 +3,10 @@
 Delete all contacts added in the past 24 hours
 """
 
-import json
-import subprocess
 import sys
 from datetime import datetime, timedelta
 
-def run_curl(endpoint, method="GET", data=None):
-    """Run curl command and return JSON response"""
-    cmd = ["curl", "-s", "-X", method, f"http://localhost:8000{endpoint}"]
-    
-    if data:
-        cmd.extend(["-H", "Content-Type: application/json", "-d", json.dumps(data)])
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            response = result.stdout.strip()
-            if response:
-                return json.loads(response)
-            else:
-                return {"success": True}
-        else:
-            print(f"Error: {result.stderr}")
-            return None
-    except Exception as e:
-        print(f"Error running curl: {e}")
-        return None
-
-def get_all_people():
-    """Get all people from the API"""
-    all_people = []
-    limit = 1000
-    offset = 0
-    
-    while True:
-        people = run_curl(f"/people?limit={limit}&offset={offset}")
-        if not people or len(people) == 0:
-            break
-        
-        all_people.extend(people)
-        
-        if len(people) < limit:
-            break
-        
-        offset += limit
-    
-    return all_people
+from cleanup_common import delete_via_api, get_all_people
 
 def find_recent_contacts(hours=24):
     """Find contacts created in the past N hours"""
@@ -60,22 +18,13 @@ def find_recent_contacts(hours=24):
     
     print(f"Cutoff date: {cutoff_str}")
     
-    # Get all people
-    all_people = get_all_people()
+    # The API filters on created_at, so only recent contacts are transferred
+    recent_contacts = get_all_people(created_after=f"{cutoff_str}T00:00:00")
     
-    if not all_people:
+    if recent_contacts is None:
         print("❌ Failed to fetch people")
         return []
     
-    print(f"Total people in database: {len(all_people)}")
-    
-    # Filter for recent contacts
-    recent_contacts = []
-    for person in all_people:
-        created_at = person.get('created_at', '')
-        if created_at >= f"{cutoff_str}T00:00:00":
-            recent_contacts.append(person)
-    
     return recent_contacts
 
 def delete_contacts(contacts, dry_run=True):
@@ -111,22 +60,7 @@ def delete_contacts(contacts, dry_run=True):
         return
     
     print(f"\n🗑️  Deleting {len(contacts)} contacts...")
-    deleted_count = 0
-    failed_count = 0
-    
-    for i, contact in enumerate(contacts):
-        person_id = contact['id']
-        name = contact.get('full_name', 'No name')
-        
-        result = run_curl(f"/people/{person_id}", method="DELETE")
-        
-        if result is not None:
-            deleted_count += 1
-            if (i + 1) % 50 == 0:
-                print(f"  Progress: {i+1}/{len(contacts)} contacts processed...")
-        else:
-            failed_count += 1
-            print(f"  ❌ Failed to delete: {name}")
+    deleted_count, failed_count = delete_via_api(contacts)
     
     print(f"\n✅ Deletion complete!")
     print(f"   Deleted: {deleted_count}")
@@ -3,56 +3,31 @@
 Simple API-based cleanup for corrupted contacts
 """
 
-import json
-import subprocess
 import sys
+from collections import Counter
 
-def run_curl(endpoint, method="GET", data=None):
-    """Run curl command and return JSON response"""
-    cmd = ["curl", "-s", "-X", method, f"http://localhost:8000{endpoint}"]
-    
-    if data:
-        cmd.extend(["-H", "Content-Type: application/json", "-d", json.dumps(data)])
-    
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-        else:
-            print(f"Error: {result.stderr}")
-            return None
-    except Exception as e:
-        print(f"Error running curl: {e}")
-        return None
+from cleanup_common import delete_via_api, get_all_people, is_incomplete
 
 def analyze_records():
     """Analyze current records via API"""
     print("📊 Analyzing current records...")
     
     # Get all people
-    people = run_curl("/people?limit=2000")
+    people = get_all_people()
     if not people:
         print("❌ Failed to fetch people")
         return []
     
-    # Check if we got an error response
-    if isinstance(people, dict) and 'detail' in people:
-        print(f"❌ API Error: {people['detail']}")
-        return []
-    
     total = len(people)
-    by_date = {}
+    by_date = Counter()
     incomplete = []
     
     for person in people:
         created_date = person.get('created_at', '')[:10]
-        if created_date not in by_date:
-            by_date[created_date] = 0
         by_date[created_date] += 1
         
         # Check if incomplete (no LinkedIn and no meaningful name)
-        if (not person.get('linkedin_url') and 
-            (not person.get('full_name') or len(person.get('full_name', '').strip()) < 2)):
+        if is_incomplete(person):
             incomplete.append(person)
     
     print(f"Total records: {total}")
@@ -75,18 +50,13 @@ def analyze_records():
     
     return incomplete
 
-def delete_record(person_id):
-    """Delete a person record via API"""
-    result = run_curl(f"/people/{person_id}", method="DELETE")
-    return result is not None
-
 def cleanup_june_10_records():
     """Clean up the corrupted June 10 records"""
     print("\n🧹 Cleaning up June 10, 2025 records...")
     
-    # Get all people
-    people = run_curl("/people?limit=2000")
-    if not people:
+    # Get people created since June 10
+    people = get_all_people(created_after='2025-06-10T00:00:00')
+    if people is None:
         print("❌ Failed to fetch people")
         return
     
@@ -118,33 +88,18 @@ def cleanup_june_10_records():
         return
     
     print("\n🗑️  Deleting records...")
-    deleted_count = 0
-    failed_count = 0
-    
-    for i, record in enumerate(june_10_records):
-        person_id = record['id']
-        name = record.get('full_name', 'No name')
-        
-        # Actually delete the record using the API
-        if delete_record(person_id):
-            print(f"Record {i+1}/{len(june_10_records)}: ✅ Deleted '{name}'")
-            deleted_count += 1
-        else:
-            print(f"Record {i+1}/{len(june_10_records)}: ❌ Failed to delete '{name}'")
-            failed_count += 1
-        
-        if (i + 1) % 50 == 0:
-            print(f"  Progress: {i+1}/{len(june_10_records)} records processed...")
+    deleted_count, failed_count = delete_via_api(june_10_records)
     
     print(f"\n✅ Successfully deleted {deleted_count} records")
     if failed_count > 0:
         print(f"❌ Failed to delete {failed_count} records")
 
-def cleanup_incomplete_records():
+def cleanup_incomplete_records(incomplete=None):
     """Clean up incomplete records (no LinkedIn and no meaningful name)"""
     print("\n🧹 Cleaning up incomplete records...")
     
-    incomplete = analyze_records()
+    if incomplete is None:
+        incomplete = analyze_records()
     
     if not incomplete:
         print("✅ No incomplete records found!")
@@ -158,23 +113,7 @@ def cleanup_incomplete_records():
         return
     
     print(f"\n🗑️  Deleting records...")
-    deleted_count = 0
-    failed_count = 0
-    
-    for i, record in enumerate(incomplete):
-        person_id = record['id']
-        name = record.get('full_name', 'No name')
-        
-        # Actually delete the record using the API
-        if delete_record(person_id):
-            print(f"Record {i+1}/{len(incomplete)}: ✅ Deleted '{name}'")
-            deleted_count += 1
-        else:
-            print(f"Record {i+1}/{len(incomplete)}: ❌ Failed to delete '{name}'")
-            failed_count += 1
-        
-        if (i + 1) % 50 == 0:
-            print(f"  Progress: {i+1}/{len(incomplete)} records processed...")
+    deleted_count, failed_count = delete_via_api(incomplete)
     
     print(f"\n✅ Successfully deleted {deleted_count} records")
     if failed_count > 0:
@@ -185,8 +124,8 @@ def main():
     print("🧹 Contact Import Cleanup Tool")
     print("=" * 40)
     
-    # Analyze current state
-    analyze_records()
+    # Analyze current state; the incomplete records it finds are reused below
+    incomplete = analyze_records()
     
     print("\nCleanup Options:")
     print("1. Clean up all records from June 10, 2025 (corrupted batch)")
@@ -198,7 +137,7 @@ def main():
     if choice == "1":
         cleanup_june_10_records()
     elif choice == "2":
-        cleanup_incomplete_records()
+        cleanup_incomplete_records(incomplete)
     elif choice == "3":
         print("\n📊 Analysis complete - no cleanup performed")
     else:
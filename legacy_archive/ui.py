@@ -10,20 +10,22 @@ Integrates with the existing FastAPI backend for data operations.
 import streamlit as st
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timedelta
 import os
 from typing import Dict, List, Optional, Any
-import plotly.express as px
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import plotly.graph_objects as go
 from supabase import create_client, Client
 from dotenv import load_dotenv
 import io
 import uuid
 import sys
-
-# Load environment variables
-load_dotenv()
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Page configuration
 st.set_page_config(
@@ -35,20 +37,22 @@ st.set_page_config(
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_API_KEY")
-
-# Initialize Supabase client
-@st.cache_resource
-def init_supabase():
-    if SUPABASE_URL and SUPABASE_KEY:
-        return create_client(SUPABASE_URL, SUPABASE_KEY)
-    return None
+IMPORT_CHUNK_SIZE = 2000  # CSV rows prepared and posted per /import/contacts request
+GZIP_EXPORT_ROWS = 500  # Explorer exports at least this long are downloaded gzipped
+ARROW_STREAM_TYPE = "application/vnd.apache.arrow.stream"  # Columnar format for API list pages
+STATIC_CHART_CONFIG = {"displayModeBar": False}  # Analytics charts are read-only, so skip the mode bar
 
-supabase = init_supabase()
+# Role change fields shown in the activity tables, with their display names
+CHANGE_COLUMNS = {
+    "person_name": "Person",
+    "organization_name": "Organization",
+    "title": "Title",
+    "department": "Department",
+    "created_at": "Date"
+}
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling, injected on every rerun
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -85,7 +89,38 @@ st.markdown("""
         border-left: 4px solid #dc3545;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Load environment variables once per server process instead of re-reading .env on every rerun
+@st.cache_resource(show_spinner=False)
+def load_settings():
+    load_dotenv()
+    return os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_API_KEY")
+
+SUPABASE_URL, SUPABASE_KEY = load_settings()
+
+# Initialize Supabase client
+@st.cache_resource
+def init_supabase():
+    if SUPABASE_URL and SUPABASE_KEY:
+        return create_client(SUPABASE_URL, SUPABASE_KEY)
+    return None
+
+supabase = init_supabase()
+
+# One keep-alive session for every API call, shared across reruns and sessions, so each
+# request reuses a pooled connection instead of opening a new one
+@st.cache_resource
+def get_session():
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    ))
+    return session
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Sidebar navigation
 st.sidebar.title("🏈 CrowdBiz Graph")
@@ -101,15 +136,7 @@ def api_request(endpoint: str, method: str = "GET", params: dict = None, data: d
     """Make API request to FastAPI backend"""
     try:
         url = f"{API_BASE_URL}{endpoint}"
-        
-        if method == "GET":
-            response = requests.get(url, params=params)
-        elif method == "POST":
-            response = requests.post(url, json=data)
-        elif method == "PUT":
-            response = requests.put(url, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url)
+        response = get_session().request(method, url, params=params, json=data, timeout=30)
         
         if response.status_code == 200:
             return response.json()
@@ -123,39 +150,147 @@ def api_request(endpoint: str, method: str = "GET", params: dict = None, data: d
         st.error(f"Request error: {e}")
         return None
 
+def api_request_page(endpoint: str, params: dict):
+    """
+    GET one page of a keyset-paginated list endpoint as a DataFrame; returns (df, next page cursor or None)
+    The page is requested as an Arrow IPC stream, which loads column-wise without a JSON decode
+    """
+    try:
+        response = get_session().get(
+            f"{API_BASE_URL}{endpoint}",
+            params=params,
+            headers={"Accept": ARROW_STREAM_TYPE},
+            timeout=30
+        )
+        
+        if response.status_code == 200:
+            df = pa.ipc.open_stream(response.content).read_pandas()
+            return df, response.headers.get("X-Next-Cursor")
+        else:
+            st.error(f"API Error: {response.status_code} - {response.text}")
+    except requests.exceptions.ConnectionError:
+        st.error("❌ Cannot connect to API server. Please start the FastAPI server with: `python api.py`")
+    except Exception as e:
+        st.error(f"Request error: {e}")
+    
+    return None, None
+
+def run_concurrently(*calls):
+    """
+    Run independent zero-argument calls on worker threads and return their results in order
+    Workers share this script run's context, so st.error calls inside them still render
+    """
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(calls), initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+@st.cache_data(ttl=15)
 def check_api_health():
     """Check if FastAPI server is running"""
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        response = get_session().get(f"{API_BASE_URL}/health", timeout=5)
         return response.status_code == 200
     except:
         return False
 
-def get_dashboard_stats():
-    """Get dashboard statistics via API"""
-    # Get basic counts from API endpoints
-    people = api_request("/people", params={"limit": 1})
-    orgs = api_request("/organizations", params={"limit": 1})
+@st.cache_data(ttl=60, show_spinner=False)
+def get_dashboard_data():
+    """Get dashboard statistics and the last week's role changes in one API call; returns (stats, changes)"""
+    dashboard = api_request("/dashboard") or {}
+    stats = dashboard.get("stats") or {"total_people": 0, "total_organizations": 0, "total_roles": 0, "nfl_teams": 0}
+    return stats, dashboard.get("changes")
+
+def prepare_contacts(chunk: pd.DataFrame, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Build /import/contacts rows from a CSV chunk with vectorized string ops
+    columns maps contact fields to the selected CSV column ("" when unmapped)
+    """
+    fields = pd.DataFrame(
+        {field: chunk[col].astype('string').str.strip() for field, col in columns.items() if col},
+        index=chunk.index
+    )
+    name = fields['name'] if 'name' in fields else pd.Series(pd.NA, index=fields.index, dtype='string')
+    
+    if 'first_name' in fields and 'last_name' in fields:
+        # Rows without a full name fall back to "first last" and only those rows keep the name parts
+        from_parts = name.isna()
+        full_name = (fields['first_name'].fillna('') + ' ' + fields['last_name'].fillna('')).str.strip()
+        fields['name'] = name.fillna(full_name)
+        fields.loc[~from_parts, ['first_name', 'last_name']] = pd.NA
+    else:
+        fields = fields.drop(columns=['first_name', 'last_name'], errors='ignore')
+        fields['name'] = name
     
-    # For more detailed stats, use direct Supabase queries if available
-    if supabase:
-        try:
-            people_count = supabase.table("person").select("id", count="exact").execute().count
-            org_count = supabase.table("organization").select("id", count="exact").execute().count
-            role_count = supabase.table("role").select("id", count="exact").execute().count
-            nfl_teams = supabase.table("organization").select("id", count="exact").eq("sport", "NFL").execute().count
-            
-            return {
-                "total_people": people_count,
-                "total_organizations": org_count,
-                "total_roles": role_count,
-                "nfl_teams": nfl_teams
-            }
-        except Exception as e:
-            st.error(f"Error getting stats: {e}")
+    # Skip rows with no name; missing values go out as null, which the API treats as absent
+    fields = fields.dropna(subset=['name'])
+    return fields.astype(object).where(fields.notna(), None).to_dict('records')
+
+@st.cache_data(max_entries=8, show_spinner="Reading CSV...")
+def read_csv_preview(file_id: str, _uploaded_file) -> pd.DataFrame:
+    """
+    First rows of an uploaded CSV, parsed once per upload
+    Keyed on the upload's file_id, so reruns from mapping changes skip hashing or re-reading the file
+    """
+    _uploaded_file.seek(0)
+    return pd.read_csv(_uploaded_file, nrows=5, dtype=str)
+
+def read_csv_chunks(uploaded_file, chunk_size: int):
+    """
+    Yield an uploaded CSV as DataFrames of at most chunk_size rows, every column read as text
+    Parsed block by block with pyarrow's streaming reader into Arrow-backed columns; falls back
+    to the pandas parser for the rest of the file when Arrow can't parse it
+    """
+    # Column names come from pandas, the parser behind read_csv_preview and so the mapping choices;
+    # duplicate and blank headers are named the same way here (a.1, Unnamed: 2) instead of Arrow's
+    uploaded_file.seek(0)
+    column_names = pd.read_csv(uploaded_file, nrows=0).columns.tolist()
+    yielded = 0
     
-    return {"total_people": 0, "total_organizations": 0, "total_roles": 0, "nfl_teams": 0}
+    try:
+        uploaded_file.seek(0)
+        reader = pacsv.open_csv(
+            uploaded_file,
+            read_options=pacsv.ReadOptions(block_size=1 << 20, column_names=column_names, skip_rows=1),
+            convert_options=pacsv.ConvertOptions(
+                # Every column typed as a string, so a late non-numeric value can't break inference
+                column_types={name: pa.string() for name in column_names},
+                strings_can_be_null=True  # Empty cells become missing, as with pandas
+            )
+        )
+        
+        for batch in reader:
+            for start in range(0, batch.num_rows, chunk_size):
+                chunk = batch.slice(start, chunk_size).to_pandas(types_mapper=pd.ArrowDtype)
+                yielded += len(chunk)
+                yield chunk
+    except pa.ArrowInvalid:
+        # Arrow can fail on open or mid-file (e.g. a quoted newline); pandas re-reads the file
+        # and skips the rows already yielded
+        uploaded_file.seek(0)
+        for chunk in pd.read_csv(uploaded_file, chunksize=chunk_size, dtype=str):
+            if yielded >= len(chunk):
+                yielded -= len(chunk)
+                continue
+            yield chunk.iloc[yielded:]
+            yielded = 0
+
+# Charts are rebuilt only when their (already aggregated) data changes
+@st.cache_data(ttl=300, show_spinner=False)
+def league_distribution_figure(leagues: tuple, counts: tuple) -> go.Figure:
+    """Pie chart of organizations per league"""
+    return go.Figure(go.Pie(labels=leagues, values=counts), layout=dict(title="League Distribution"))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def daily_changes_figure(dates: tuple, counts: tuple) -> go.Figure:
+    """WebGL line chart of role changes per day, without hover tooltips"""
+    return go.Figure(
+        go.Scattergl(x=dates, y=counts, mode="lines"),
+        layout=dict(title="Daily Role Changes", hovermode=False)
+    )
 
+# Reruns (e.g. opening a result's expander) repeat the same search, so reuse results for 5 minutes
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
 def search_database(query: str, search_type: str = "all"):
     """Search via API"""
     params = {"q": query, "limit": 50}
@@ -184,8 +319,11 @@ if not api_healthy:
 if page == "Dashboard":
     st.markdown('<h1 class="main-header">🏈 CrowdBiz Graph Dashboard</h1>', unsafe_allow_html=True)
     
-    # Get statistics
-    stats = get_dashboard_stats()
+    # Get statistics and recent activity (cached for a minute; Refresh forces a re-query)
+    if st.button("🔄 Refresh"):
+        get_dashboard_data.clear()
+    
+    stats, recent_changes = get_dashboard_data()
     
     # Display key metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -208,20 +346,13 @@ if page == "Dashboard":
     st.subheader("📈 Recent Activity")
     
     try:
-        # Get recent role changes via API
-        recent_changes = api_request("/analytics/roles/changes", params={"days": 7})
-        
         if recent_changes and recent_changes.get("changes"):
-            changes_df = pd.DataFrame([
-                {
-                    "Person": change.get("person_name", "Unknown"),
-                    "Organization": change.get("organization_name", "Unknown"),
-                    "Title": change.get("title", ""),
-                    "Department": change.get("department", ""),
-                    "Date": change.get("created_at", "")[:10] if change.get("created_at") else ""
-                }
-                for change in recent_changes["changes"][:10]
-            ])
+            # Build the table column-wise from the raw records instead of rebuilding each dict
+            changes_df = pd.DataFrame.from_records(
+                recent_changes["changes"][:10], columns=list(CHANGE_COLUMNS)
+            ).fillna({"person_name": "Unknown", "organization_name": "Unknown", "title": "", "department": "", "created_at": ""})
+            changes_df["created_at"] = changes_df["created_at"].astype("string").str.slice(0, 10)
+            changes_df = changes_df.rename(columns=CHANGE_COLUMNS)
             
             st.dataframe(changes_df, use_container_width=True)
         else:
@@ -232,10 +363,15 @@ if page == "Dashboard":
     
     # Quick search
     st.subheader("🔍 Quick Search")
-    quick_search = st.text_input("Search for people, organizations, or roles...")
-    
-    if quick_search:
-        search_results = search_database(quick_search)
+    # A form only reruns on submit, so typing doesn't send a search per keystroke
+    with st.form("quick_search"):
+        quick_search = st.text_input("Search for people, organizations, or roles...")
+        submitted = st.form_submit_button("Search")
+    
+    if submitted and len(quick_search.strip()) < 2:
+        st.warning("Enter at least 2 characters to search.")
+    elif submitted:
+        search_results = search_database(quick_search.strip())
         if search_results and search_results.get("results"):
             for result in search_results["results"][:5]:  # Show top 5 results
                 with st.container():
@@ -260,6 +396,9 @@ elif page == "Search":
     with col2:
         search_type = st.selectbox("Search in:", ["all", "person", "organization", "role"])
     
+    if st.button("🔄 Clear search cache", help="Searches are reused for 5 minutes; clear to query the API again"):
+        search_database.clear()
+    
     if st.button("Search", type="primary") or search_query:
         if search_query:
             with st.spinner("Searching..."):
@@ -269,6 +408,19 @@ elif page == "Search":
                 results = search_results["results"]
                 st.success(f"Found {len(results)} results")
                 
+                # Fetch details for every result up front, one request per type instead of one per result
+                person_ids = [r['id'] for r in results if r.get('type') == 'person' and r.get('id')]
+                org_ids = [r['id'] for r in results if r.get('type') == 'organization' and r.get('id')]
+                
+                person_details_by_id = {}
+                if person_ids:
+                    people = api_request("/people/batch", method="POST", data={"ids": person_ids})
+                    person_details_by_id = {person['id']: person for person in people or []}
+                
+                org_people_counts = {}
+                if org_ids:
+                    org_people_counts = api_request("/organizations/people_counts", params={"ids": ",".join(org_ids)}) or {}
+                
                 # Display results
                 for i, result in enumerate(results):
                     result_type = result.get('type', 'Unknown').title()
@@ -286,9 +438,9 @@ elif page == "Search":
                             with col2:
                                 st.write(f"**ID:** {result.get('id', 'N/A')}")
                                 
-                                # Get additional details via API
+                                # Additional details from the batch lookup above
                                 if result.get('id'):
-                                    person_details = api_request(f"/people/{result['id']}")
+                                    person_details = person_details_by_id.get(result['id'])
                                     if person_details:
                                         # Show only public professional information
                                         if person_details.get('first_name') or person_details.get('last_name'):
@@ -307,11 +459,9 @@ elif page == "Search":
                             with col2:
                                 st.write(f"**ID:** {result.get('id', 'N/A')}")
                                 
-                                # Get organization people count
-                                if result.get('id'):
-                                    org_people = api_request(f"/organizations/{result['id']}/people", params={"limit": 1})
-                                    if org_people:
-                                        st.write(f"**People Count:** {len(org_people)}")
+                                # Organization people count from the batch lookup above
+                                if result.get('id') in org_people_counts:
+                                    st.write(f"**People Count:** {org_people_counts[result['id']]}")
                         
                         elif result_type.lower() == "role":
                             col1, col2 = st.columns(2)
@@ -343,11 +493,11 @@ elif page == "Import Contacts":
     
     if uploaded_file is not None:
         try:
-            # Read the CSV
-            df = pd.read_csv(uploaded_file)
+            # Read only the preview rows here (once per upload); the import streams the whole file in chunks
+            df = read_csv_preview(uploaded_file.file_id, uploaded_file)
             
             st.subheader("📋 File Preview")
-            st.dataframe(df.head(), use_container_width=True)
+            st.dataframe(df, use_container_width=True)
             
             st.subheader("🔧 Column Mapping")
             
@@ -373,74 +523,75 @@ elif page == "Import Contacts":
             # Import button
             if st.button("Import Contacts", type="primary"):
                 with st.spinner("Importing contacts..."):
-                    # Prepare contacts for bulk import
-                    contacts = []
+                    # Stream the file in chunks, preparing and posting each one on its own, so memory
+                    # stays bounded by the chunk size and progress is visible on large files
+                    totals = {'imported': 0, 'updated': 0, 'total': 0}
+                    errors = []
+                    prepared_count = 0
+                    imported_chunks = 0
+                    failed_chunks = 0
+                    progress = st.progress(0.0)
                     
-                    for index, row in df.iterrows():
-                        try:
-                            # Prepare person data
-                            contact = {}
-                            
-                            if full_name_col and pd.notna(row.get(full_name_col)):
-                                contact['name'] = str(row[full_name_col]).strip()
-                            elif first_name_col and last_name_col:
-                                first = str(row.get(first_name_col, "")).strip()
-                                last = str(row.get(last_name_col, "")).strip()
-                                contact['name'] = f"{first} {last}".strip()
-                                contact['first_name'] = first
-                                contact['last_name'] = last
-                            else:
-                                continue  # Skip if no name
-                            
-                            # LinkedIn URL only (no email/phone for privacy compliance)
-                            if linkedin_col and pd.notna(row.get(linkedin_col)):
-                                contact['linkedin_url'] = str(row[linkedin_col]).strip()
-                            
-                            # Add organization and job title data
-                            if organization_col and pd.notna(row.get(organization_col)):
-                                contact['organization'] = str(row[organization_col]).strip()
-                            
-                            if job_title_col and pd.notna(row.get(job_title_col)):
-                                contact['job_title'] = str(row[job_title_col]).strip()
-                            
-                            if department_col and pd.notna(row.get(department_col)):
-                                contact['department'] = str(row[department_col]).strip()
+                    contact_columns = {
+                        'name': full_name_col,
+                        'first_name': first_name_col,
+                        'last_name': last_name_col,
+                        'linkedin_url': linkedin_col,  # LinkedIn URL only (no email/phone for privacy compliance)
+                        'organization': organization_col,
+                        'job_title': job_title_col,
+                        'department': department_col
+                    }
+                    
+                    for chunk in read_csv_chunks(uploaded_file, IMPORT_CHUNK_SIZE):
+                        contacts = prepare_contacts(chunk, contact_columns)
+                        
+                        # Bulk import this chunk via API
+                        if contacts:
+                            prepared_count += len(contacts)
+                            import_data = {
+                                "contacts": contacts,
+                                "source": f"CSV Upload - {uploaded_file.name}"
+                            }
                             
-                            contacts.append(contact)
+                            import_result = api_request("/import/contacts", method="POST", data=import_data)
                             
-                        except Exception as e:
-                            st.error(f"Error preparing row {index + 1}: {e}")
+                            if import_result:
+                                imported_chunks += 1
+                                for key in totals:
+                                    totals[key] += import_result.get(key, 0)
+                                errors.extend(import_result.get('errors', []))
+                            else:
+                                failed_chunks += 1
+                        
+                        # The parser reads ahead in blocks, so the file position tracks progress closely
+                        progress.progress(min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0))
+                    
+                    progress.progress(1.0)
                     
-                    # Bulk import via API
-                    if contacts:
-                        import_data = {
-                            "contacts": contacts,
-                            "source": f"CSV Upload - {uploaded_file.name}"
-                        }
+                    if imported_chunks:
+                        # Show detailed results
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("New Contacts", totals['imported'])
+                        with col2:
+                            st.metric("Updated Contacts", totals['updated'])
+                        with col3:
+                            st.metric("Total Processed", totals['total'])
                         
-                        import_result = api_request("/import/contacts", method="POST", data=import_data)
+                        if totals['imported'] > 0 or totals['updated'] > 0:
+                            st.success(f"Import completed! ✅ {totals['imported']} new contacts created, {totals['updated']} contacts updated")
                         
-                        if import_result:
-                            # Show detailed results
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.metric("New Contacts", import_result.get('imported', 0))
-                            with col2:
-                                st.metric("Updated Contacts", import_result.get('updated', 0))
-                            with col3:
-                                st.metric("Total Processed", import_result.get('total', 0))
-                            
-                            if import_result.get('imported', 0) > 0 or import_result.get('updated', 0) > 0:
-                                st.success(f"Import completed! ✅ {import_result.get('imported', 0)} new contacts created, {import_result.get('updated', 0)} contacts updated")
-                            
-                            if import_result.get('errors'):
-                                st.warning(f"❌ {len(import_result['errors'])} errors occurred during import:")
-                                for error in import_result['errors'][:10]:  # Show first 10 errors
-                                    st.error(error)
-                                if len(import_result['errors']) > 10:
-                                    st.info(f"... and {len(import_result['errors']) - 10} more errors")
-                        else:
-                            st.error("Import failed. Please check your data and try again.")
+                        if failed_chunks:
+                            st.warning(f"❌ {failed_chunks} chunk(s) of up to {IMPORT_CHUNK_SIZE} rows failed to import")
+                        
+                        if errors:
+                            st.warning(f"❌ {len(errors)} errors occurred during import:")
+                            for error in errors[:10]:  # Show first 10 errors
+                                st.error(error)
+                            if len(errors) > 10:
+                                st.info(f"... and {len(errors) - 10} more errors")
+                    elif prepared_count:
+                        st.error("Import failed. Please check your data and try again.")
                     else:
                         st.warning("No valid contacts found in the uploaded file.")
         
@@ -473,7 +624,11 @@ elif page == "Analytics":
     
     # Get analytics data via API
     try:
-        org_stats = api_request("/analytics/organizations/stats")
+        # The two analytics requests are independent, so fetch them concurrently
+        org_stats, role_changes = run_concurrently(
+            lambda: api_request("/analytics/organizations/stats"),
+            lambda: api_request("/analytics/roles/changes", params={"days": 30})
+        )
         
         if org_stats:
             col1, col2 = st.columns(2)
@@ -486,8 +641,8 @@ elif page == "Analytics":
                     counts = [item['count'] for item in league_data if item['league']]
                     
                     if leagues and counts:
-                        fig = px.pie(values=counts, names=leagues, title="League Distribution")
-                        st.plotly_chart(fig, use_container_width=True)
+                        fig = league_distribution_figure(tuple(leagues), tuple(counts))
+                        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
             
             with col2:
                 st.subheader("League Statistics")
@@ -499,10 +654,9 @@ elif page == "Analytics":
         
         # Role changes analysis
         st.subheader("Recent Role Changes")
-        role_changes = api_request("/analytics/roles/changes", params={"days": 30})
         
         if role_changes and role_changes.get("changes"):
-            changes_df = pd.DataFrame(role_changes["changes"])
+            changes_df = pd.DataFrame.from_records(role_changes["changes"], columns=list(CHANGE_COLUMNS))
             
             if not changes_df.empty:
                 # Show summary
@@ -511,10 +665,13 @@ elif page == "Analytics":
                     st.metric("Total Changes (30 days)", role_changes.get("total_changes", 0))
                 with col2:
                     if "created_at" in changes_df.columns:
-                        changes_df['date'] = pd.to_datetime(changes_df['created_at']).dt.date
+                        # Timestamps are ISO8601, so parse with that format instead of inferring it per value
+                        changes_df['date'] = pd.to_datetime(
+                            changes_df['created_at'], format='ISO8601', utc=True, cache=True, errors='coerce'
+                        ).dt.date
                         daily_changes = changes_df['date'].value_counts().sort_index()
-                        fig = px.line(x=daily_changes.index, y=daily_changes.values, title="Daily Role Changes")
-                        st.plotly_chart(fig, use_container_width=True)
+                        fig = daily_changes_figure(tuple(daily_changes.index), tuple(daily_changes.values.tolist()))
+                        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
                 
                 # Show recent changes table
                 st.dataframe(changes_df[['person_name', 'organization_name', 'title', 'department']].head(10), 
@@ -545,12 +702,22 @@ elif page == "Database Explorer":
         limit = st.number_input("Limit results:", min_value=1, max_value=1000, value=100)
     
     with col2:
-        offset = st.number_input("Offset:", min_value=0, value=0)
+        offset = st.number_input("Offset:", min_value=0, value=0,
+                                 help="Jump straight to a row; large offsets are slow, so prefer the page buttons")
     
     with col3:
         if st.button("Load Data", type="primary"):
             st.rerun()
     
+    # Keyset pagination: each entry is the cursor a page starts after, so Prev pops and Next pushes.
+    # The stack resets whenever the table, page size or starting offset changes
+    page_key = (selected_table, limit, offset)
+    if st.session_state.get("explorer_page_key") != page_key:
+        st.session_state["explorer_page_key"] = page_key
+        st.session_state["cursor_stack"] = []
+    cursor_stack = st.session_state["cursor_stack"]
+    next_cursor = None
+    
     # Load and display data
     try:
         endpoint = tables[selected_table]
@@ -569,10 +736,12 @@ elif page == "Database Explorer":
                 st.info("Enter a search term to see results.")
                 df = pd.DataFrame()
         else:
-            response = api_request(endpoint, params=params)
-            if response:
-                df = pd.DataFrame(response)
-            else:
+            # The API seeks past the cursor via its (name, id) index and ignores offset once a cursor is given
+            if cursor_stack:
+                params["after"] = cursor_stack[-1]
+            
+            df, next_cursor = api_request_page(endpoint, params)
+            if df is None:
                 df = pd.DataFrame()
         
         if not df.empty:
@@ -588,17 +757,33 @@ elif page == "Database Explorer":
             # Display data
             st.dataframe(df, use_container_width=True)
             
-            # Download option
-            csv = df.to_csv(index=False)
+            # Download option, written in chunks straight to bytes; larger exports are gzipped
+            compress = len(df) >= GZIP_EXPORT_ROWS
+            csv_buffer = io.BytesIO()
+            df.to_csv(csv_buffer, index=False, chunksize=10_000, compression="gzip" if compress else None)
+            csv_buffer.seek(0)
+            
             st.download_button(
                 label=f"Download {selected_table} data as CSV",
-                data=csv,
-                file_name=f"{selected_table.lower()}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                data=csv_buffer,
+                file_name=f"{selected_table.lower()}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv{'.gz' if compress else ''}",
+                mime="application/gzip" if compress else "text/csv"
             )
         
         else:
             st.info(f"No data found for {selected_table}.")
+        
+        # Page navigation for the keyset-paginated tables
+        if selected_table != "Search Results":
+            nav1, nav2 = st.columns(2)
+            with nav1:
+                if st.button("⬅️ Previous page", disabled=not cursor_stack):
+                    cursor_stack.pop()
+                    st.rerun()
+            with nav2:
+                if st.button("Next page ➡️", disabled=not next_cursor):
+                    cursor_stack.append(next_cursor)
+                    st.rerun()
     
     except Exception as e:
         st.error(f"Error loading {selected_table} data: {e}")
@@ -1,73 +1,189 @@
 """
 Refresh Summary Tables Script
-Updates the network_status and organization_summary materialized views
+Updates the network_status and organization_summary summary tables, in Postgres via the
+refresh_* SQL functions, falling back to a client-side rebuild when they are unavailable
 """
 
 import sys
 import os
+import csv
+import io
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.core.database import get_database_manager
+import psycopg2
+
+from app.core.database import DatabaseManager, get_database_manager
 from app.core.logger import get_logger
+from app.tools.schema_introspect import get_connection_candidates
 
 logger = get_logger("refresh_summary_tables")
 
-def refresh_network_status():
-    """Refresh the network_status summary table efficiently."""
-    db = get_database_manager()
+# Postgres' per-statement bind parameter limit; batches are sized so one row's columns times the
+# batch stays under it
+MAX_STATEMENT_PARAMS = 65535
+
+# Rows per range() request (PostgREST's default max-rows cap)
+PAGE_SIZE = 1000
+
+# Concurrent PostgREST upsert requests; writes are round-trip bound, so overlapping them helps
+# up to the server's connection limit
+WRITE_WORKERS = 8
+
+def connect_direct():
+    """Open a direct PostgreSQL connection for bulk writes, or None when no credentials work"""
+    for label, params in get_connection_candidates():
+        # The introspection session options (30s statement timeout) are too tight for bulk writes
+        params = {**params, 'options': '', 'application_name': 'refresh_summary_tables'}
+        try:
+            return psycopg2.connect(**params)
+        except Exception as e:
+            logger.debug(f"Direct connection with {label} failed: {e}")
+    
+    return None
+
+def get_batch_size(records):
+    """Largest batch whose values fit in one statement, from the column count of the records"""
+    if not records:
+        return 1
+    return max(1, MAX_STATEMENT_PARAMS // len(records[0]) - 1)
+
+def copy_records(cur, table, columns, records):
+    """Stream records into a table with COPY FROM STDIN as CSV; None is sent as \\N so empty strings stay empty"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        ['\\N' if record[column] is None else record[column] for column in columns] for record in records
+    )
+    buffer.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+
+def write_summary(db, table, records, conflict_column, refresh_started):
+    """
+    Upsert records into a summary table and prune rows older than refresh_started
+    Over a direct connection the records are COPYed into a temporary staging table and merged
+    in one transaction; without database credentials they are sent as PostgREST batches
+    """
+    conn = connect_direct() if records else None
+    
+    if conn is not None:
+        columns = list(records[0])
+        column_list = ', '.join(columns)
+        updates = ', '.join(f"{column} = EXCLUDED.{column}" for column in columns if column != conflict_column)
+        
+        try:
+            with conn, conn.cursor() as cur:
+                # COPY skips per-row parsing and planning, and the temp table is not WAL-logged; the
+                # merge keeps the target populated, so readers never see it empty
+                cur.execute(f"CREATE TEMP TABLE {table}_staging (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+                copy_records(cur, f"{table}_staging", columns, records)
+                cur.execute(
+                    f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {table}_staging "
+                    f"ON CONFLICT ({conflict_column}) DO UPDATE SET {updates}"
+                )
+                cur.execute(f"DELETE FROM {table} WHERE last_updated < %s", (refresh_started,))
+            logger.info(f"Upserted {len(records)} {table} records via COPY")
+            return
+        finally:
+            conn.close()
+    
+    batch_size = get_batch_size(records)
+    logger.info(f"Writing {table} in batches of {batch_size} rows ({len(records[0]) if records else 0} columns)")
+    
+    batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+    logger.info(f"Upserting {len(records)} {table} records via PostgREST in {len(batches)} batches...")
+    
+    # Like the refreshes in main(), each write worker gets its own DatabaseManager, so no HTTP
+    # client is shared between threads
+    worker = threading.local()
+    
+    def upsert_batch(batch):
+        if not hasattr(worker, 'db'):
+            worker.db = DatabaseManager()
+        worker.db.client.table(table).upsert(batch, on_conflict=conflict_column).execute()
+        return len(batch)
+    
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        futures = [executor.submit(upsert_batch, batch) for batch in batches]
+        try:
+            for i, future in enumerate(as_completed(futures)):
+                logger.info(f"Upserted batch {i + 1}/{len(batches)}: {future.result()} records")
+        except Exception:
+            # Drop the queued batches and skip the prune below, so no existing row is lost
+            for future in futures:
+                future.cancel()
+            raise
+    
+    db.client.table(table).delete().lt('last_updated', refresh_started).execute()
+
+def fetch_rows(db, table, columns):
+    """Yield every row of a table one range() page at a time, ordered by id so pages never overlap"""
+    start = 0
+    while True:
+        page = db.client.table(table).select(columns).order('id').range(start, start + PAGE_SIZE - 1).execute().data or []
+        yield from page
+        
+        if len(page) < PAGE_SIZE:
+            break
+        start += PAGE_SIZE
+
+def refresh_network_status(db=None, full=False):
+    """
+    Refresh the network_status summary table, in Postgres when the SQL functions are available
+    By default only people changed since the last refresh are recomputed; full=True rebuilds every row
+    """
+    db = db or get_database_manager()
     
     if not db.is_connected():
         logger.error("Database not connected")
         return False
     
     try:
-        # 1. Clear existing data
-        logger.info("Clearing existing network_status data...")
-        db.client.table('network_status').delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
+        # Aggregate where the data lives (see refresh_network_status() and
+        # refresh_network_status_incremental() in SQL); nothing is downloaded
+        function = 'refresh_network_status' if full else 'refresh_network_status_incremental'
+        count = db.client.rpc(function).execute().data
+        logger.info(f"✅ network_status table refreshed in Postgres via {function} ({count} records)")
+        return True
+    except Exception as e:
+        logger.warning(f"Server-side network_status refresh failed ({e}); rebuilding client-side...")
+        return rebuild_network_status(db)
+
+def rebuild_network_status(db):
+    """Rebuild network_status client-side by fetching the source tables and joining them in memory."""
+    try:
+        # 1. Every row written below is stamped with this time; older rows are pruned at the end
+        refresh_started = datetime.now(timezone.utc).isoformat()
+        
+        # 2. Fetch people and organizations page by page, keyed by id for the in-memory join
+        logger.info("Fetching all people and organizations...")
+        person_map = {person['id']: person for person in fetch_rows(db, 'person', 'id, full_name, first_name, last_name, linkedin_url, created_at')}
+        org_map = {org['id']: org for org in fetch_rows(db, 'organization', 'id, name, org_type, sport, industry')}
         
-        # 2. Fetch all necessary data in bulk
-        logger.info("Fetching all current roles with person and organization data...")
+        # 3. Stream every role once, counting all roles and keeping only current ones, so a
+        # single page of roles is held at a time
+        logger.info("Streaming roles...")
+        total_roles_counts = Counter()
+        person_roles = defaultdict(list)
+        for role in fetch_rows(db, 'role', 'person_id, org_id, job_title, dept, standardized_department, start_date, is_executive, is_current'):
+            total_roles_counts[role['person_id']] += 1
+            if role.get('is_current'):
+                person_roles[role['person_id']].append(role)
         
-        roles_response = db.client.table('role') \
-            .select('job_title, dept, standardized_department, start_date, is_executive, person:person_id(*), organization(*)') \
-            .eq('is_current', True) \
-            .execute()
-            
-        if not roles_response.data:
+        if not person_roles:
             logger.warning("No current roles found. Network status will be empty.")
-            return True
-
-        roles_data = roles_response.data
-        logger.info(f"Found {len(roles_data)} current roles to process.")
-
-        # 3. Get total role counts for all people efficiently
-        logger.info("Fetching total role counts for all people...")
-        all_roles_response = db.client.table('role').select('person_id', count='exact').execute()
         
-        total_roles_counts = {}
-        if all_roles_response.data:
-            # This is a workaround since PostgREST doesn't support GROUP BY directly
-            from collections import Counter
-            person_ids = [role['person_id'] for role in all_roles_response.data]
-            total_roles_counts = Counter(person_ids)
-
+        logger.info(f"Found {sum(map(len, person_roles.values()))} current roles across {len(person_roles)} people.")
+        
         # 4. Process data in memory
         network_status_records = []
         
-        # Group roles by person to handle multiple current roles
-        person_roles = {}
-        for role in roles_data:
-            if not role.get('person'):
-                continue
-            person_id = role['person']['id']
-            if person_id not in person_roles:
-                person_roles[person_id] = []
-            person_roles[person_id].append(role)
-
         for person_id, roles in person_roles.items():
             primary_role = roles[0]  # Take the first role as the primary one
-            person = primary_role.get('person')
-            organization = primary_role.get('organization')
+            person = person_map.get(person_id)
+            organization = org_map.get(primary_role.get('org_id'))
 
             if not person or not organization:
                 continue  # Skip if data is incomplete
@@ -88,21 +204,15 @@ def refresh_network_status():
                 'is_executive': primary_role.get('is_executive', False),
                 'role_start_date': primary_role.get('start_date'),
                 'current_roles_count': len(roles),
-                'total_roles_count': total_roles_counts.get(person_id, 0),
+                'total_roles_count': total_roles_counts[person_id],
                 'created_at': person.get('created_at'),
-                'last_updated': 'now()'
+                'last_updated': refresh_started
             }
             network_status_records.append(record)
 
-        # 5. Insert new records in batches
-        if network_status_records:
-            batch_size = 200  # Increased batch size for efficiency
-            logger.info(f"Inserting {len(network_status_records)} records in batches of {batch_size}...")
-            
-            for i in range(0, len(network_status_records), batch_size):
-                batch = network_status_records[i:i + batch_size]
-                db.client.table('network_status').insert(batch).execute()
-                logger.info(f"Inserted batch {i//batch_size + 1}: {len(batch)} records")
+        # 5. Upsert records, then prune people who no longer have a current role;
+        # the table is never emptied, so readers see old or new rows throughout the refresh
+        write_summary(db, 'network_status', network_status_records, 'person_id', refresh_started)
         
         logger.info("✅ network_status table refreshed successfully")
         return True
@@ -111,48 +221,54 @@ def refresh_network_status():
         logger.error(f"Failed to refresh network_status: {e}", exc_info=True)
         return False
 
-def refresh_organization_summary():
-    """Refresh the organization_summary table efficiently."""
-    db = get_database_manager()
+def refresh_organization_summary(db=None):
+    """Refresh the organization_summary table, in Postgres when the SQL function is available."""
+    db = db or get_database_manager()
     
     if not db.is_connected():
         logger.error("Database not connected")
         return False
     
     try:
-        # 1. Clear existing data
-        logger.info("Clearing existing organization_summary data...")
-        db.client.table('organization_summary').delete().neq('org_id', '00000000-0000-0000-0000-000000000000').execute()
+        # Aggregate where the data lives (see refresh_organization_summary() in SQL)
+        count = db.client.rpc('refresh_organization_summary').execute().data
+        logger.info(f"✅ organization_summary table refreshed in Postgres ({count} records)")
+        return True
+    except Exception as e:
+        logger.warning(f"Server-side organization_summary refresh failed ({e}); rebuilding client-side...")
+        return rebuild_organization_summary(db)
+
+def rebuild_organization_summary(db):
+    """Rebuild organization_summary client-side by fetching organizations and roles and counting in memory."""
+    try:
+        # 1. Every row written below is stamped with this time; older rows are pruned at the end
+        refresh_started = datetime.now(timezone.utc).isoformat()
         
-        # 2. Fetch all necessary data in bulk
-        logger.info("Fetching all organizations and roles in bulk...")
-        orgs_response = db.client.table('organization').select('*').execute()
-        roles_response = db.client.table('role').select('org_id, is_current, is_executive').execute()
-
-        if not orgs_response.data:
-            logger.warning("No organizations found.")
-            return True
-            
-        organizations = orgs_response.data
-        roles = roles_response.data
-        logger.info(f"Found {len(organizations)} organizations and {len(roles)} roles to process.")
-
-        # 3. Process data in memory
+        # 2. Fetch all organizations page by page
+        logger.info("Fetching all organizations...")
+        organizations = list(fetch_rows(db, 'organization', '*'))
+
+        if not organizations:
+            logger.warning("No organizations found. Organization summary will be empty.")
+
         org_map = {org['id']: org for org in organizations}
-        parent_org_names = {org['id']: org.get('name') for org in organizations}
 
-        from collections import defaultdict
+        # 3. Stream roles and fold each page into the counters as it arrives
         current_employees = defaultdict(int)
         total_employees = defaultdict(int)
         executive_count = defaultdict(int)
 
-        for role in roles:
+        role_count = 0
+        for role in fetch_rows(db, 'role', 'org_id, is_current, is_executive'):
+            role_count += 1
             org_id = role['org_id']
             total_employees[org_id] += 1
             if role['is_current']:
                 current_employees[org_id] += 1
                 if role['is_executive']:
                     executive_count[org_id] += 1
+        
+        logger.info(f"Found {len(organizations)} organizations and {role_count} roles to process.")
 
         # 4. Create summary records
         summary_records = []
@@ -166,23 +282,16 @@ def refresh_organization_summary():
                 'industry': org_data.get('industry'),
                 'is_active': org_data.get('is_active', True),
                 'parent_org_id': parent_org_id,
-                'parent_org_name': parent_org_names.get(parent_org_id),
+                'parent_org_name': (org_map.get(parent_org_id) or {}).get('name'),
                 'current_employees': current_employees[org_id],
                 'total_employees': total_employees[org_id],
                 'executive_count': executive_count[org_id],
-                'last_updated': 'now()'
+                'last_updated': refresh_started
             }
             summary_records.append(record)
         
-        # 5. Insert new records in batches
-        if summary_records:
-            batch_size = 100
-            logger.info(f"Inserting {len(summary_records)} organization summary records...")
-            
-            for i in range(0, len(summary_records), batch_size):
-                batch = summary_records[i:i + batch_size]
-                db.client.table('organization_summary').insert(batch).execute()
-                logger.info(f"Inserted batch {i//batch_size + 1}: {len(batch)} records")
+        # 5. Upsert records, then prune organizations that no longer exist
+        write_summary(db, 'organization_summary', summary_records, 'org_id', refresh_started)
         
         logger.info("✅ organization_summary table refreshed successfully")
         return True
@@ -191,17 +300,17 @@ def refresh_organization_summary():
         logger.error(f"Failed to refresh organization_summary: {e}", exc_info=True)
         return False
 
-def main():
-    """Main function to refresh all summary tables"""
-    logger.info("🔄 Starting summary table refresh...")
-    
-    # Refresh network_status
-    logger.info("📊 Refreshing network_status table...")
-    network_success = refresh_network_status()
+def main(full=False):
+    """Main function to refresh all summary tables (full=True skips the incremental network_status refresh)"""
+    logger.info(f"🔄 Starting {'full' if full else 'incremental'} summary table refresh...")
     
-    # Refresh organization_summary
-    logger.info("🏢 Refreshing organization_summary table...")
-    org_success = refresh_organization_summary()
+    # The two refreshes are independent and I/O-bound, so run them side by side; each gets its
+    # own DatabaseManager so the threads never share one HTTP client
+    logger.info("📊 Refreshing network_status and 🏢 organization_summary tables...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        network_future = executor.submit(refresh_network_status, DatabaseManager(), full)
+        org_future = executor.submit(refresh_organization_summary, DatabaseManager())
+        network_success, org_success = network_future.result(), org_future.result()
     
     if network_success and org_success:
         logger.info("✅ All summary tables refreshed successfully!")
@@ -211,4 +320,4 @@ def main():
         print("❌ Summary table refresh had errors - check logs")
 
 if __name__ == "__main__":
-    main()
+    main(full='--full' in sys.argv)
@@ -17,7 +17,7 @@ Usage: python run.py [command]
 Commands:
   streamlit     Start the Streamlit web application
   api          Start the FastAPI service (optional)
-  refresh      Refresh the database summary tables
+  refresh      Refresh the database summary tables (--full to rebuild every row)
   checks       Run all validation and compliance checks
   tests        Run the test suite
   setup        Initial setup and configuration
@@ -50,10 +50,10 @@ def main():
             subprocess.run(["python", "app/api/main.py"])
             
         elif command == "refresh":
-            # Refresh the summary tables
+            # Refresh the summary tables in this interpreter (no second Python start-up and imports)
+            from refresh_summary_tables import main as refresh_main
             print("🔄 Refreshing summary tables...")
-            subprocess.run(["python", "refresh_summary_tables.py"])
-            print("✅ Summary tables refreshed successfully.")
+            refresh_main(full='--full' in sys.argv[2:])
             
         elif command == "checks":
             # Run all validation checks
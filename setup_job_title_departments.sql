@@ -69,3 +69,10 @@ JOIN organization o ON r.org_id = o.id
 LEFT JOIN job_title_departments jtd ON r.job_title = jtd.job_title
 WHERE r.is_current = true
 LIMIT 10;
+
+-- Step 9: Clear the lookup table in one statement before it is rebuilt
+-- (called by create_job_title_department_mapping.py via rpc)
+CREATE OR REPLACE FUNCTION truncate_job_title_departments()
+RETURNS VOID AS $$
+    TRUNCATE job_title_departments;
+$$ LANGUAGE sql;
@@ -0,0 +1,17 @@
+-- ==================================================================
+-- CrowdBiz Graph - Analytics Aggregate Functions
+-- Created: October 16, 2026
+-- Purpose: Aggregate analytics breakdowns in Postgres instead of
+--          shipping every organization row to the API
+-- ==================================================================
+
+-- Organization count per sport (NULL sports are reported as 'Unknown')
+CREATE OR REPLACE FUNCTION org_sport_counts()
+RETURNS TABLE (sport TEXT, count BIGINT) AS $$
+    SELECT COALESCE(o.sport, 'Unknown') AS sport, COUNT(*) AS count
+    FROM organization o
+    GROUP BY 1
+    ORDER BY 2 DESC;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION org_sport_counts() IS 'Organization counts grouped by sport for the analytics endpoints';
@@ -0,0 +1,18 @@
+-- ==================================================================
+-- CrowdBiz Graph - Trigram Indexes for Substring Search
+-- Created: October 16, 2026
+-- Purpose: Let the API's ILIKE '%term%' filters use an index instead
+--          of scanning every person/organization row
+-- ==================================================================
+
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+
+-- PERSON (list_people and search filter on all three name columns)
+CREATE INDEX IF NOT EXISTS person_full_name_trgm_idx ON person USING gin (full_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS person_first_name_trgm_idx ON person USING gin (first_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS person_last_name_trgm_idx ON person USING gin (last_name gin_trgm_ops);
+
+-- ORGANIZATION (list_organizations and search filter on name, sport and org_type)
+CREATE INDEX IF NOT EXISTS organization_name_trgm_idx ON organization USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS organization_sport_trgm_idx ON organization USING gin (sport gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS organization_org_type_trgm_idx ON organization USING gin (org_type gin_trgm_ops);
@@ -0,0 +1,13 @@
+-- ==================================================================
+-- CrowdBiz Graph - Keyset Pagination Indexes
+-- Created: October 16, 2026
+-- Purpose: Let list_people/list_organizations seek straight to the
+--          row after their cursor in (name, id) order instead of
+--          scanning and discarding OFFSET rows
+-- ==================================================================
+
+-- PERSON (list_people orders by full_name, id)
+CREATE INDEX IF NOT EXISTS person_full_name_id_idx ON person (full_name, id);
+
+-- ORGANIZATION (list_organizations orders by name, id)
+CREATE INDEX IF NOT EXISTS organization_name_id_idx ON organization (name, id);
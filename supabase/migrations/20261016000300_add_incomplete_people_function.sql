@@ -0,0 +1,22 @@
+-- ==================================================================
+-- CrowdBiz Graph - Incomplete Person Lookup
+-- Created: October 16, 2026
+-- Purpose: Let the cleanup scripts select incomplete contacts in
+--          Postgres instead of downloading every person row
+-- ==================================================================
+
+-- Incomplete = no LinkedIn URL (our only public identifier) and no meaningful name
+CREATE OR REPLACE FUNCTION incomplete_people()
+RETURNS TABLE (id UUID, full_name TEXT, linkedin_url TEXT, created_at TIMESTAMPTZ) AS $$
+    SELECT p.id, p.full_name, p.linkedin_url, p.created_at
+    FROM person p
+    WHERE COALESCE(p.linkedin_url, '') = ''
+      AND char_length(btrim(p.full_name, E' \t\r\n')) < 2
+    ORDER BY p.created_at;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION incomplete_people() IS 'People with no LinkedIn URL and a name shorter than two characters, for cleanup';
+
+-- Partial index over the people without a LinkedIn URL, matching the function's predicate
+CREATE INDEX IF NOT EXISTS person_without_linkedin_idx ON person (created_at)
+    WHERE COALESCE(linkedin_url, '') = '';
@@ -0,0 +1,17 @@
+-- ==================================================================
+-- CrowdBiz Graph - Person Counts by Creation Date
+-- Created: October 16, 2026
+-- Purpose: Aggregate the cleanup scripts' per-day record counts in
+--          Postgres instead of shipping every person row
+-- ==================================================================
+
+-- Person count per creation day (UTC, matching the date prefix of created_at in API responses)
+CREATE OR REPLACE FUNCTION person_counts_by_date()
+RETURNS TABLE (day DATE, count BIGINT) AS $$
+    SELECT (p.created_at AT TIME ZONE 'UTC')::date AS day, COUNT(*) AS count
+    FROM person p
+    GROUP BY 1
+    ORDER BY 1;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION person_counts_by_date() IS 'Person counts grouped by creation day for the cleanup scripts';
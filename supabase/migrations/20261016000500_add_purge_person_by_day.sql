@@ -0,0 +1,29 @@
+-- ==================================================================
+-- CrowdBiz Graph - Delete a Day's Person Records
+-- Created: October 16, 2026
+-- Purpose: Let cleanup_contacts.py delete a corrupted import day in
+--          one transactional statement instead of per-ID requests
+-- ==================================================================
+
+-- Deletes every person created on the given (UTC) day and returns how many were removed.
+-- role.person_id has no ON DELETE CASCADE in the base schema, so the day's roles are
+-- removed first in the same transaction.
+CREATE OR REPLACE FUNCTION purge_person_by_day(d DATE)
+RETURNS BIGINT AS $$
+    DELETE FROM role
+    WHERE person_id IN (
+        SELECT id FROM person
+        WHERE created_at >= (d::timestamp AT TIME ZONE 'UTC')
+          AND created_at < ((d + 1)::timestamp AT TIME ZONE 'UTC')
+    );
+
+    WITH deleted AS (
+        DELETE FROM person
+        WHERE created_at >= (d::timestamp AT TIME ZONE 'UTC')
+          AND created_at < ((d + 1)::timestamp AT TIME ZONE 'UTC')
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM deleted;
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION purge_person_by_day(DATE) IS 'Delete all people (and their roles) created on one day, for cleanup of corrupted import batches';
@@ -0,0 +1,19 @@
+-- ==================================================================
+-- CrowdBiz Graph - Dashboard Stats Function
+-- Created: October 16, 2026
+-- Purpose: Return the Streamlit dashboard's headline counts in one
+--          round trip instead of four sequential count queries
+-- ==================================================================
+
+-- Headline counts, keyed the way the dashboard reads them
+CREATE OR REPLACE FUNCTION dashboard_stats()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'total_people', (SELECT COUNT(*) FROM person),
+        'total_organizations', (SELECT COUNT(*) FROM organization),
+        'total_roles', (SELECT COUNT(*) FROM role),
+        'nfl_teams', (SELECT COUNT(*) FROM organization WHERE sport = 'NFL')
+    );
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION dashboard_stats() IS 'People, organization, role and NFL team counts for the Streamlit dashboard';
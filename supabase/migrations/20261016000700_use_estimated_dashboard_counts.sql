@@ -0,0 +1,40 @@
+-- ==================================================================
+-- CrowdBiz Graph - Estimated Dashboard Counts
+-- Created: October 16, 2026
+-- Purpose: Read the dashboard's whole-table counts from the planner
+--          statistics instead of scanning person, organization and role
+-- ==================================================================
+
+-- Planner row estimate for a table; falls back to an exact count until the
+-- table has been analyzed (reltuples is -1 before the first ANALYZE)
+CREATE OR REPLACE FUNCTION estimated_row_count(table_name REGCLASS)
+RETURNS BIGINT AS $$
+DECLARE
+    estimate REAL;
+    exact_count BIGINT;
+BEGIN
+    SELECT reltuples INTO estimate FROM pg_class WHERE oid = table_name;
+    
+    IF estimate IS NULL OR estimate < 0 THEN
+        EXECUTE format('SELECT COUNT(*) FROM %s', table_name) INTO exact_count;
+        RETURN exact_count;
+    END IF;
+    
+    RETURN estimate::BIGINT;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Headline counts, keyed the way the dashboard reads them; the NFL tally stays
+-- exact because the planner has no per-sport estimate worth showing
+CREATE OR REPLACE FUNCTION dashboard_stats()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'total_people', estimated_row_count('person'),
+        'total_organizations', estimated_row_count('organization'),
+        'total_roles', estimated_row_count('role'),
+        'nfl_teams', (SELECT COUNT(*) FROM organization WHERE sport = 'NFL')
+    );
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION estimated_row_count(REGCLASS) IS 'pg_class.reltuples row estimate, exact until the table is first analyzed';
+COMMENT ON FUNCTION dashboard_stats() IS 'People, organization, role and NFL team counts for the Streamlit dashboard';
@@ -0,0 +1,118 @@
+-- ==================================================================
+-- CrowdBiz Graph - Trigger-Maintained Stats Cache
+-- Created: October 16, 2026
+-- Purpose: Keep the dashboard's headline counts in a small table that
+--          triggers update on every write, so reading them never counts
+-- ==================================================================
+
+CREATE TABLE IF NOT EXISTS stats_cache (
+    metric TEXT PRIMARY KEY,
+    value BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Statement-level triggers read the transition tables, so a bulk import or
+-- delete adjusts each counter once instead of once per row.
+-- Note: every person, organization or role insert (or delete) now updates one
+-- stats_cache row and holds its row lock until commit, so concurrent importers
+-- writing the same table serialize on that lock.
+-- TG_ARGV[0] is the metric to adjust
+CREATE OR REPLACE FUNCTION stats_cache_track_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE stats_cache SET value = value + (SELECT COUNT(*) FROM new_rows), updated_at = NOW()
+        WHERE metric = TG_ARGV[0];
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE stats_cache SET value = value - (SELECT COUNT(*) FROM old_rows), updated_at = NOW()
+        WHERE metric = TG_ARGV[0];
+    ELSIF TG_OP = 'TRUNCATE' THEN
+        UPDATE stats_cache SET value = 0, updated_at = NOW() WHERE metric = TG_ARGV[0];
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- NFL teams also move in or out of the count when an organization's sport changes
+CREATE OR REPLACE FUNCTION stats_cache_track_nfl_teams()
+RETURNS TRIGGER AS $$
+DECLARE
+    delta BIGINT := 0;
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        delta := delta + (SELECT COUNT(*) FROM new_rows WHERE sport = 'NFL');
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        delta := delta - (SELECT COUNT(*) FROM old_rows WHERE sport = 'NFL');
+    END IF;
+    
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE stats_cache SET value = 0, updated_at = NOW() WHERE metric = 'nfl_teams';
+    ELSIF delta <> 0 THEN
+        UPDATE stats_cache SET value = value + delta, updated_at = NOW() WHERE metric = 'nfl_teams';
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Row counters (transition tables allow only one event per trigger)
+DROP TRIGGER IF EXISTS stats_cache_person_insert ON person;
+CREATE TRIGGER stats_cache_person_insert AFTER INSERT ON person
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_people');
+DROP TRIGGER IF EXISTS stats_cache_person_delete ON person;
+CREATE TRIGGER stats_cache_person_delete AFTER DELETE ON person
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_people');
+DROP TRIGGER IF EXISTS stats_cache_person_truncate ON person;
+CREATE TRIGGER stats_cache_person_truncate AFTER TRUNCATE ON person
+    FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_people');
+
+DROP TRIGGER IF EXISTS stats_cache_organization_insert ON organization;
+CREATE TRIGGER stats_cache_organization_insert AFTER INSERT ON organization
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_organizations');
+DROP TRIGGER IF EXISTS stats_cache_organization_delete ON organization;
+CREATE TRIGGER stats_cache_organization_delete AFTER DELETE ON organization
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_organizations');
+DROP TRIGGER IF EXISTS stats_cache_organization_truncate ON organization;
+CREATE TRIGGER stats_cache_organization_truncate AFTER TRUNCATE ON organization
+    FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_organizations');
+
+DROP TRIGGER IF EXISTS stats_cache_role_insert ON role;
+CREATE TRIGGER stats_cache_role_insert AFTER INSERT ON role
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_roles');
+DROP TRIGGER IF EXISTS stats_cache_role_delete ON role;
+CREATE TRIGGER stats_cache_role_delete AFTER DELETE ON role
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_roles');
+DROP TRIGGER IF EXISTS stats_cache_role_truncate ON role;
+CREATE TRIGGER stats_cache_role_truncate AFTER TRUNCATE ON role
+    FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_rows('total_roles');
+
+-- NFL team counter
+DROP TRIGGER IF EXISTS stats_cache_nfl_insert ON organization;
+CREATE TRIGGER stats_cache_nfl_insert AFTER INSERT ON organization
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_nfl_teams();
+DROP TRIGGER IF EXISTS stats_cache_nfl_update ON organization;
+CREATE TRIGGER stats_cache_nfl_update AFTER UPDATE ON organization
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_nfl_teams();
+DROP TRIGGER IF EXISTS stats_cache_nfl_delete ON organization;
+CREATE TRIGGER stats_cache_nfl_delete AFTER DELETE ON organization
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_nfl_teams();
+DROP TRIGGER IF EXISTS stats_cache_nfl_truncate ON organization;
+CREATE TRIGGER stats_cache_nfl_truncate AFTER TRUNCATE ON organization
+    FOR EACH STATEMENT EXECUTE FUNCTION stats_cache_track_nfl_teams();
+
+-- Seed the counters with exact counts (the triggers keep them exact from here on)
+INSERT INTO stats_cache (metric, value) VALUES
+    ('total_people', (SELECT COUNT(*) FROM person)),
+    ('total_organizations', (SELECT COUNT(*) FROM organization)),
+    ('total_roles', (SELECT COUNT(*) FROM role)),
+    ('nfl_teams', (SELECT COUNT(*) FROM organization WHERE sport = 'NFL'))
+ON CONFLICT (metric) DO UPDATE SET value = EXCLUDED.value, updated_at = NOW();
+
+-- Headline counts now come straight from the cache, exact and without scanning
+CREATE OR REPLACE FUNCTION dashboard_stats()
+RETURNS JSON AS $$
+    SELECT json_object_agg(metric, value) FROM stats_cache;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON TABLE stats_cache IS 'Trigger-maintained row counts for the Streamlit dashboard';
+COMMENT ON FUNCTION dashboard_stats() IS 'People, organization, role and NFL team counts for the Streamlit dashboard';
@@ -0,0 +1,147 @@
+-- ==================================================================
+-- CrowdBiz Graph - Set-Based Summary Table Refresh
+-- Created: October 16, 2026
+-- Purpose: Build network_status and organization_summary in-engine with
+--          GROUP BY aggregates so refresh_summary_tables.py can call them via
+--          rpc() instead of downloading every table and re-uploading the result
+-- ==================================================================
+
+-- Columns the client-side refresh already writes (added outside migrations)
+ALTER TABLE network_status ADD COLUMN IF NOT EXISTS current_standardized_department TEXT;
+ALTER TABLE organization_summary ADD COLUMN IF NOT EXISTS parent_org_id UUID;
+ALTER TABLE organization_summary ADD COLUMN IF NOT EXISTS is_active BOOLEAN DEFAULT TRUE;
+
+-- One row per person with a current role at a known organization; role counts
+-- come from a single GROUP BY over role instead of two correlated subqueries per person
+CREATE OR REPLACE FUNCTION refresh_network_status()
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER := 0;
+BEGIN
+    TRUNCATE network_status;
+
+    INSERT INTO network_status (
+        person_id, full_name, first_name, last_name, linkedin_url,
+        current_job_title, current_organization, current_org_type,
+        current_sport, current_industry, current_department, current_standardized_department,
+        role_start_date, is_executive, total_roles_count, current_roles_count, created_at
+    )
+    WITH role_counts AS (
+        SELECT
+            person_id,
+            COUNT(*) AS total_roles,
+            COUNT(*) FILTER (WHERE is_current) AS current_roles
+        FROM role
+        GROUP BY person_id
+    ),
+    primary_roles AS (
+        -- Most recent current role per person
+        SELECT DISTINCT ON (person_id)
+            person_id, org_id, job_title, dept, standardized_department, start_date, is_executive
+        FROM role
+        WHERE is_current = TRUE
+        ORDER BY person_id, start_date DESC NULLS LAST
+    )
+    SELECT
+        p.id,
+        p.full_name,
+        p.first_name,
+        p.last_name,
+        p.linkedin_url,
+        pr.job_title,
+        o.name,
+        o.org_type,
+        o.sport,
+        o.industry,
+        pr.dept,
+        pr.standardized_department,
+        pr.start_date,
+        COALESCE(pr.is_executive, FALSE),
+        rc.total_roles,
+        rc.current_roles,
+        p.created_at
+    FROM primary_roles pr
+    JOIN person p ON p.id = pr.person_id
+    JOIN organization o ON o.id = pr.org_id
+    JOIN role_counts rc ON rc.person_id = pr.person_id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- One row per organization; employee counts, department breakdown and top roles are
+-- each one grouped pass over role, joined back by org_id
+CREATE OR REPLACE FUNCTION refresh_organization_summary()
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER := 0;
+BEGIN
+    TRUNCATE organization_summary;
+
+    INSERT INTO organization_summary (
+        org_id, name, org_type, sport, industry, is_active, parent_org_id, parent_org_name,
+        total_employees, current_employees, executive_count,
+        departments, role_distribution
+    )
+    WITH employee_counts AS (
+        SELECT
+            org_id,
+            COUNT(DISTINCT person_id) AS total_employees,
+            COUNT(DISTINCT person_id) FILTER (WHERE is_current) AS current_employees,
+            COUNT(DISTINCT person_id) FILTER (WHERE is_current AND is_executive) AS executive_count
+        FROM role
+        GROUP BY org_id
+    ),
+    dept_breakdown AS (
+        SELECT org_id, jsonb_object_agg(dept, count) AS departments
+        FROM (
+            SELECT org_id, COALESCE(dept, 'Unknown') AS dept, COUNT(*) AS count
+            FROM role
+            WHERE is_current = TRUE
+            GROUP BY org_id, COALESCE(dept, 'Unknown')
+        ) dept_counts
+        GROUP BY org_id
+    ),
+    role_breakdown AS (
+        SELECT org_id, jsonb_object_agg(job_title, count) AS roles
+        FROM (
+            SELECT
+                org_id,
+                COALESCE(job_title, 'Unknown') AS job_title,
+                COUNT(*) AS count,
+                ROW_NUMBER() OVER (PARTITION BY org_id ORDER BY COUNT(*) DESC) AS rank
+            FROM role
+            WHERE is_current = TRUE
+            GROUP BY org_id, COALESCE(job_title, 'Unknown')
+        ) role_counts
+        WHERE rank <= 20  -- Top 20 roles
+        GROUP BY org_id
+    )
+    SELECT
+        o.id,
+        o.name,
+        o.org_type,
+        o.sport,
+        o.industry,
+        COALESCE(o.is_active, TRUE),
+        o.parent_org_id,
+        po.name,
+        COALESCE(ec.total_employees, 0),
+        COALESCE(ec.current_employees, 0),
+        COALESCE(ec.executive_count, 0),
+        COALESCE(db.departments, '{}'),
+        COALESCE(rb.roles, '{}')
+    FROM organization o
+    LEFT JOIN organization po ON po.id = o.parent_org_id
+    LEFT JOIN employee_counts ec ON ec.org_id = o.id
+    LEFT JOIN dept_breakdown db ON db.org_id = o.id
+    LEFT JOIN role_breakdown rb ON rb.org_id = o.id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION refresh_network_status() IS 'Rebuilds network_status in one set-based statement; called by refresh_summary_tables.py via rpc()';
+COMMENT ON FUNCTION refresh_organization_summary() IS 'Rebuilds organization_summary in one set-based statement; called by refresh_summary_tables.py via rpc()';
@@ -0,0 +1,174 @@
+-- ==================================================================
+-- CrowdBiz Graph - Refresh Summary Tables In Place
+-- Created: October 16, 2026
+-- Purpose: Replace TRUNCATE + INSERT in the summary refresh functions with
+--          upsert-then-prune so readers never block on an exclusive lock or
+--          see an empty table while a refresh runs
+-- ==================================================================
+
+-- Upsert the fresh rows, then prune the ones that were not refreshed; no TRUNCATE, so
+-- readers keep seeing the previous snapshot until the function's transaction commits
+CREATE OR REPLACE FUNCTION refresh_network_status()
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER := 0;
+BEGIN
+    INSERT INTO network_status (
+        person_id, full_name, first_name, last_name, linkedin_url,
+        current_job_title, current_organization, current_org_type,
+        current_sport, current_industry, current_department, current_standardized_department,
+        role_start_date, is_executive, total_roles_count, current_roles_count, created_at, last_updated
+    )
+    WITH role_counts AS (
+        SELECT
+            person_id,
+            COUNT(*) AS total_roles,
+            COUNT(*) FILTER (WHERE is_current) AS current_roles
+        FROM role
+        GROUP BY person_id
+    ),
+    primary_roles AS (
+        -- Most recent current role per person
+        SELECT DISTINCT ON (person_id)
+            person_id, org_id, job_title, dept, standardized_department, start_date, is_executive
+        FROM role
+        WHERE is_current = TRUE
+        ORDER BY person_id, start_date DESC NULLS LAST
+    )
+    SELECT
+        p.id,
+        p.full_name,
+        p.first_name,
+        p.last_name,
+        p.linkedin_url,
+        pr.job_title,
+        o.name,
+        o.org_type,
+        o.sport,
+        o.industry,
+        pr.dept,
+        pr.standardized_department,
+        pr.start_date,
+        COALESCE(pr.is_executive, FALSE),
+        rc.total_roles,
+        rc.current_roles,
+        p.created_at,
+        NOW()
+    FROM primary_roles pr
+    JOIN person p ON p.id = pr.person_id
+    JOIN organization o ON o.id = pr.org_id
+    JOIN role_counts rc ON rc.person_id = pr.person_id
+    ON CONFLICT (person_id) DO UPDATE SET
+        full_name = EXCLUDED.full_name,
+        first_name = EXCLUDED.first_name,
+        last_name = EXCLUDED.last_name,
+        linkedin_url = EXCLUDED.linkedin_url,
+        current_job_title = EXCLUDED.current_job_title,
+        current_organization = EXCLUDED.current_organization,
+        current_org_type = EXCLUDED.current_org_type,
+        current_sport = EXCLUDED.current_sport,
+        current_industry = EXCLUDED.current_industry,
+        current_department = EXCLUDED.current_department,
+        current_standardized_department = EXCLUDED.current_standardized_department,
+        role_start_date = EXCLUDED.role_start_date,
+        is_executive = EXCLUDED.is_executive,
+        total_roles_count = EXCLUDED.total_roles_count,
+        current_roles_count = EXCLUDED.current_roles_count,
+        created_at = EXCLUDED.created_at,
+        last_updated = EXCLUDED.last_updated;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+
+    -- Anything not touched above (NOW() is fixed for the transaction) no longer has a current role
+    DELETE FROM network_status WHERE last_updated IS DISTINCT FROM NOW();
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Same upsert-then-prune refresh for organization_summary
+CREATE OR REPLACE FUNCTION refresh_organization_summary()
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER := 0;
+BEGIN
+    INSERT INTO organization_summary (
+        org_id, name, org_type, sport, industry, is_active, parent_org_id, parent_org_name,
+        total_employees, current_employees, executive_count,
+        departments, role_distribution, last_updated
+    )
+    WITH employee_counts AS (
+        SELECT
+            org_id,
+            COUNT(DISTINCT person_id) AS total_employees,
+            COUNT(DISTINCT person_id) FILTER (WHERE is_current) AS current_employees,
+            COUNT(DISTINCT person_id) FILTER (WHERE is_current AND is_executive) AS executive_count
+        FROM role
+        GROUP BY org_id
+    ),
+    dept_breakdown AS (
+        SELECT org_id, jsonb_object_agg(dept, count) AS departments
+        FROM (
+            SELECT org_id, COALESCE(dept, 'Unknown') AS dept, COUNT(*) AS count
+            FROM role
+            WHERE is_current = TRUE
+            GROUP BY org_id, COALESCE(dept, 'Unknown')
+        ) dept_counts
+        GROUP BY org_id
+    ),
+    role_breakdown AS (
+        SELECT org_id, jsonb_object_agg(job_title, count) AS roles
+        FROM (
+            SELECT
+                org_id,
+                COALESCE(job_title, 'Unknown') AS job_title,
+                COUNT(*) AS count,
+                ROW_NUMBER() OVER (PARTITION BY org_id ORDER BY COUNT(*) DESC) AS rank
+            FROM role
+            WHERE is_current = TRUE
+            GROUP BY org_id, COALESCE(job_title, 'Unknown')
+        ) role_counts
+        WHERE rank <= 20  -- Top 20 roles
+        GROUP BY org_id
+    )
+    SELECT
+        o.id,
+        o.name,
+        o.org_type,
+        o.sport,
+        o.industry,
+        COALESCE(o.is_active, TRUE),
+        o.parent_org_id,
+        po.name,
+        COALESCE(ec.total_employees, 0),
+        COALESCE(ec.current_employees, 0),
+        COALESCE(ec.executive_count, 0),
+        COALESCE(db.departments, '{}'),
+        COALESCE(rb.roles, '{}'),
+        NOW()
+    FROM organization o
+    LEFT JOIN organization po ON po.id = o.parent_org_id
+    LEFT JOIN employee_counts ec ON ec.org_id = o.id
+    LEFT JOIN dept_breakdown db ON db.org_id = o.id
+    LEFT JOIN role_breakdown rb ON rb.org_id = o.id
+    ON CONFLICT (org_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        org_type = EXCLUDED.org_type,
+        sport = EXCLUDED.sport,
+        industry = EXCLUDED.industry,
+        is_active = EXCLUDED.is_active,
+        parent_org_id = EXCLUDED.parent_org_id,
+        parent_org_name = EXCLUDED.parent_org_name,
+        total_employees = EXCLUDED.total_employees,
+        current_employees = EXCLUDED.current_employees,
+        executive_count = EXCLUDED.executive_count,
+        departments = EXCLUDED.departments,
+        role_distribution = EXCLUDED.role_distribution,
+        last_updated = EXCLUDED.last_updated;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+
+    -- Rows for organizations deleted since the last refresh
+    DELETE FROM organization_summary WHERE last_updated IS DISTINCT FROM NOW();
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
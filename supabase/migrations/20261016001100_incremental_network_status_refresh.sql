@@ -0,0 +1,160 @@
+-- ==================================================================
+-- CrowdBiz Graph - Incremental network_status Refresh
+-- Created: October 16, 2026
+-- Purpose: Recompute network_status only for people whose person, role or
+--          organization rows changed since the last refresh, so routine
+--          refreshes cost time proportional to churn, not table size
+-- ==================================================================
+
+-- 1. Change timestamps on every source table (person already has updated_at)
+ALTER TABLE role ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+ALTER TABLE organization ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+
+CREATE INDEX IF NOT EXISTS person_updated_at_idx ON person (updated_at);
+CREATE INDEX IF NOT EXISTS role_updated_at_idx ON role (updated_at);
+CREATE INDEX IF NOT EXISTS organization_updated_at_idx ON organization (updated_at);
+
+-- Reuses update_updated_at_column() from the staging tables migration
+DROP TRIGGER IF EXISTS trigger_person_updated_at ON person;
+CREATE TRIGGER trigger_person_updated_at
+    BEFORE UPDATE ON person
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS trigger_role_updated_at ON role;
+CREATE TRIGGER trigger_role_updated_at
+    BEFORE UPDATE ON role
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS trigger_org_updated_at ON organization;
+CREATE TRIGGER trigger_org_updated_at
+    BEFORE UPDATE ON organization
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- A deleted role leaves no row to timestamp, so mark its person as changed instead
+-- (statement-level, so a bulk delete touches each person once)
+CREATE OR REPLACE FUNCTION touch_people_of_deleted_roles()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE person SET updated_at = NOW()
+    WHERE id IN (SELECT DISTINCT person_id FROM old_rows);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS role_delete_touch_person ON role;
+CREATE TRIGGER role_delete_touch_person AFTER DELETE ON role
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION touch_people_of_deleted_roles();
+
+-- 2. When each summary was last refreshed
+CREATE TABLE IF NOT EXISTS refresh_state (
+    name TEXT PRIMARY KEY,
+    last_refresh_ts TIMESTAMPTZ
+);
+
+-- 3. Incremental refresh; the first run (no refresh_state row yet) falls back to the full
+-- refresh_network_status()
+-- Writers stamp updated_at with their transaction start time, so a write can commit after a
+-- refresh yet carry an older timestamp than it. The next watermark is therefore taken before
+-- the dirty scan as the start of the oldest transaction still open on the database (or this
+-- statement's start if none is): anything this refresh cannot see yet is stamped at or after
+-- it. SECURITY DEFINER lets the function see every session in pg_stat_activity, not just
+-- the caller's own.
+CREATE OR REPLACE FUNCTION refresh_network_status_incremental()
+RETURNS INTEGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    since TIMESTAMPTZ;
+    next_since TIMESTAMPTZ;
+    dirty UUID[];
+    updated_count INTEGER := 0;
+BEGIN
+    -- Row lock serializes concurrent refreshes
+    SELECT last_refresh_ts INTO since FROM refresh_state WHERE name = 'network_status' FOR UPDATE;
+
+    SELECT LEAST(statement_timestamp(), MIN(a.xact_start)) INTO next_since
+    FROM pg_stat_activity a
+    WHERE a.datname = current_database()
+      AND a.backend_type = 'client backend'
+      AND a.pid <> pg_backend_pid()
+      AND a.xact_start IS NOT NULL;
+
+    IF since IS NULL THEN
+        updated_count := refresh_network_status();
+    ELSE
+        dirty := ARRAY(
+            SELECT id FROM person WHERE updated_at >= since
+            UNION
+            SELECT person_id FROM role WHERE updated_at >= since
+            UNION
+            SELECT r.person_id
+            FROM role r
+            JOIN organization o ON o.id = r.org_id
+            WHERE o.updated_at >= since
+        );
+
+        DELETE FROM network_status WHERE person_id = ANY(dirty);
+
+        INSERT INTO network_status (
+            person_id, full_name, first_name, last_name, linkedin_url,
+            current_job_title, current_organization, current_org_type,
+            current_sport, current_industry, current_department, current_standardized_department,
+            role_start_date, is_executive, total_roles_count, current_roles_count, created_at, last_updated
+        )
+        WITH role_counts AS (
+            SELECT
+                person_id,
+                COUNT(*) AS total_roles,
+                COUNT(*) FILTER (WHERE is_current) AS current_roles
+            FROM role
+            WHERE person_id = ANY(dirty)
+            GROUP BY person_id
+        ),
+        primary_roles AS (
+            -- Most recent current role per person
+            SELECT DISTINCT ON (person_id)
+                person_id, org_id, job_title, dept, standardized_department, start_date, is_executive
+            FROM role
+            WHERE is_current = TRUE AND person_id = ANY(dirty)
+            ORDER BY person_id, start_date DESC NULLS LAST
+        )
+        SELECT
+            p.id,
+            p.full_name,
+            p.first_name,
+            p.last_name,
+            p.linkedin_url,
+            pr.job_title,
+            o.name,
+            o.org_type,
+            o.sport,
+            o.industry,
+            pr.dept,
+            pr.standardized_department,
+            pr.start_date,
+            COALESCE(pr.is_executive, FALSE),
+            rc.total_roles,
+            rc.current_roles,
+            p.created_at,
+            NOW()
+        FROM primary_roles pr
+        JOIN person p ON p.id = pr.person_id
+        JOIN organization o ON o.id = pr.org_id
+        JOIN role_counts rc ON rc.person_id = pr.person_id;
+
+        GET DIAGNOSTICS updated_count = ROW_COUNT;
+    END IF;
+
+    INSERT INTO refresh_state (name, last_refresh_ts) VALUES ('network_status', next_since)
+    ON CONFLICT (name) DO UPDATE SET last_refresh_ts = EXCLUDED.last_refresh_ts;
+
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON TABLE refresh_state IS 'Last refresh time per summary table, used by the incremental refresh functions';
+COMMENT ON FUNCTION refresh_network_status_incremental() IS 'Recomputes network_status rows for people changed since the last refresh; full rebuild on first run';
@@ -0,0 +1,19 @@
+-- ==================================================================
+-- CrowdBiz Graph - Organization People Counts Function
+-- Created: October 16, 2026
+-- Purpose: Count distinct people per organization in Postgres for the
+--          Search page instead of downloading every role row, which
+--          PostgREST caps at 1000 rows per request
+-- ==================================================================
+
+-- Distinct people with a role at each of the given organizations;
+-- organizations without roles are left out
+CREATE OR REPLACE FUNCTION org_people_counts(org_ids UUID[])
+RETURNS TABLE (org_id UUID, count BIGINT) AS $$
+    SELECT r.org_id, COUNT(DISTINCT r.person_id) AS count
+    FROM role r
+    WHERE r.org_id = ANY(org_ids)
+    GROUP BY r.org_id;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION org_people_counts(UUID[]) IS 'Distinct people per organization for GET /organizations/people_counts';
@@ -0,0 +1,18 @@
+-- ==================================================================
+-- CrowdBiz Graph - Organization Lookup By Name
+-- Created: October 16, 2026
+-- Purpose: Let /import/contacts resolve only the organization names in
+--          its batch instead of downloading the whole organization table
+--          on every call
+-- ==================================================================
+
+-- Organizations whose name matches one of names case-insensitively
+-- (served by the org_name_unique index on lower(name))
+CREATE OR REPLACE FUNCTION organizations_by_name(names TEXT[])
+RETURNS TABLE (id UUID, name TEXT) AS $$
+    SELECT o.id, o.name
+    FROM organization o
+    WHERE lower(o.name) IN (SELECT lower(n) FROM unnest(names) AS n);
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION organizations_by_name(TEXT[]) IS 'Case-insensitive organization lookup by name for POST /import/contacts';
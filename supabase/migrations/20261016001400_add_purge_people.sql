@@ -0,0 +1,22 @@
+-- ==================================================================
+-- CrowdBiz Graph - Delete Person Records By ID
+-- Created: October 16, 2026
+-- Purpose: Let the contact cleanup delete a batch of people together
+--          with their roles in one transaction
+-- ==================================================================
+
+-- Deletes the given people and returns how many were removed.
+-- role.person_id has no ON DELETE CASCADE in the base schema, so their roles are
+-- removed first in the same transaction (as in purge_person_by_day).
+CREATE OR REPLACE FUNCTION purge_people(ids UUID[])
+RETURNS BIGINT AS $$
+    DELETE FROM role WHERE person_id = ANY(ids);
+
+    WITH deleted AS (
+        DELETE FROM person WHERE id = ANY(ids)
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM deleted;
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION purge_people(UUID[]) IS 'Delete people (and their roles) by ID, for the batched incomplete-record cleanup';
@@ -0,0 +1,38 @@
+"""
+CSV format detection tests
+Runs the processed import files through detect_csv_format and read_csv
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from app.services.import_service import ImportService
+
+PROCESSED_DIR = Path(__file__).resolve().parent.parent / "imports" / "processed"
+FIXTURES = sorted(PROCESSED_DIR.glob("*.csv"))
+
+@pytest.fixture(scope="module")
+def service():
+    return ImportService()
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda path: path.name)
+def test_detects_comma_delimiter(service, path):
+    csv_format = service.detect_csv_format(path.read_bytes())
+
+    assert csv_format['delimiter'] == ','
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda path: path.name)
+def test_read_csv_matches_pandas(service, path):
+    content = path.read_bytes()
+    df = service.read_csv(content, service.detect_csv_format(content))
+    expected = pd.read_csv(path, dtype=str)
+
+    assert df.columns.tolist() == expected.columns.tolist()
+    assert len(df) == len(expected)
+
+def test_headers_only_read(service):
+    content = (PROCESSED_DIR / "people_nfl_gemini_ui.csv").read_bytes()
+
+    assert service.read_csv_headers(content) == ['League', 'Team', 'Department', 'Full Name', 'Title']